@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""
+Times Reader.attributes on generated modules and classes of increasing size, to show it scales linearly
+"""
+
+import os
+import sys
+import time
+import tempfile
+import importlib
+
+import sphinxter
+
+SIZES = [100, 1000, 10000, 100000]
+
+with tempfile.TemporaryDirectory() as directory:
+
+    sys.path.insert(0, directory)
+
+    print(f"{'resource':>10} {'attributes':>10} {'seconds':>10} {'usec/attribute':>15}")
+
+    for kind, indent in [("module", ""), ("class", "    ")]:
+        for size in SIZES:
+
+            name = f"constants_{kind}_{size}"
+
+            with open(os.path.join(directory, f"{name}.py"), "w", encoding="utf-8") as module:
+                if kind == "class":
+                    module.write("class Constants:\n")
+                for index in range(size):
+                    module.write(f"{indent}CONSTANT_{index} = {index} # The constant {index}\n")
+
+            resource = importlib.import_module(name)
+
+            if kind == "class":
+                resource = resource.Constants
+
+            sphinxter.Reader.reset()
+
+            start = time.perf_counter()
+            attributes = sphinxter.Reader.attributes(resource)
+            seconds = time.perf_counter() - start
+
+            assert len(attributes) == size
+
+            print(f"{kind:>10} {size:>10} {seconds:>10.3f} {seconds / size * 1000000:>15.1f}")
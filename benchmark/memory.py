@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Measures the memory held by read documentation for a generated package of increasing size, as plain dicts and compact
+"""
+
+import os
+import sys
+import gc
+import tempfile
+import importlib
+import tracemalloc
+
+import sphinxter
+
+SIZES = [10, 100, 500]
+
+FUNCTION = '''
+def function_{index}(
+    a:int,      # The a
+    b:str="b",  # The b
+    *args,      # The args
+    c=None,     # The c
+    **kwargs    # The kwargs
+)->dict:
+    """
+    description: Function {index}
+    return: The result
+    """
+'''
+
+CLASS = '''
+class Class_{index}:
+    """
+    description: Class {index}
+    """
+
+    a = None    # The a
+    b = None    # The b
+
+    def __init__(self,
+        a:int,  # The a
+        b:str   # The b
+    ):
+        """
+        description: Makes Class {index}
+        """
+
+    def method(self,
+        c:list  # The c
+    )->bool:
+        """
+        description: Method of Class {index}
+        return: Whether it worked
+        """
+'''
+
+with tempfile.TemporaryDirectory() as directory:
+
+    sys.path.insert(0, directory)
+
+    print(f"{'modules':>10} {'representation':>15} {'bytes':>12} {'bytes/module':>15}")
+
+    for size in SIZES:
+
+        package = f"synthetic_{size}"
+
+        os.makedirs(os.path.join(directory, package))
+
+        with open(os.path.join(directory, package, "__init__.py"), "w", encoding="utf-8") as module:
+            module.write('"""\nSynthetic package\n"""\n')
+
+        for index in range(size):
+            with open(os.path.join(directory, package, f"module_{index}.py"), "w", encoding="utf-8") as module:
+                module.write(f'"""\nModule {index}\n"""\n')
+                for member in range(5):
+                    module.write(FUNCTION.format(index=member))
+                    module.write(CLASS.format(index=member))
+
+        resource = importlib.import_module(package)
+
+        for name in sphinxter.Sphinxter.submodules(resource):
+            importlib.import_module(name)
+
+        for compact in [False, True]:
+
+            sphinxter.Reader.reset()
+            gc.collect()
+
+            tracemalloc.start()
+
+            instance = sphinxter.Sphinxter(resource, discover=True, compact=compact)
+            instance.read()
+            sphinxter.Reader.reset()
+            gc.collect()
+
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            representation = "compact" if compact else "dict"
+
+            print(f"{size:>10} {representation:>15} {current:>12} {current // size:>15}")
+
+            del instance
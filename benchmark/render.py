@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Times rendering and writing a generated site of 500 documents one after another, in threads, and in processes,
+checking the documents written match
+"""
+
+import os
+import sys
+import glob
+import time
+import tempfile
+import importlib
+import concurrent.futures
+
+import sphinxter
+
+DOCUMENTS = 500
+POOLS = [
+    ("serial", None, None),
+    ("threads", concurrent.futures.ThreadPoolExecutor, 4),
+    ("processes", concurrent.futures.ProcessPoolExecutor, 2),
+    ("processes", concurrent.futures.ProcessPoolExecutor, 4),
+    ("processes", concurrent.futures.ProcessPoolExecutor, 8)
+]
+
+FUNCTION = '''
+def function_{index}(
+    a:int,      # The a
+    b:str="b",  # The b
+    *args,      # The args
+    c=None,     # The c
+    **kwargs    # The kwargs
+)->dict:
+    """
+    description: Function {index}
+    return: The result
+    usage: |
+        Call it::
+
+            function_{index}(1, "b", c=3)
+    """
+'''
+
+CLASS = '''
+class Class_{index}:
+    """
+    description: Class {index}
+    """
+
+    a = None    # The a
+    b = None    # The b
+
+    def __init__(self,
+        a:int,  # The a
+        b:str   # The b
+    ):
+        """
+        description: Makes Class {index}
+        """
+
+    def method(self,
+        c:list  # The c
+    )->bool:
+        """
+        description: Method of Class {index}
+        return: Whether it worked
+        raises:
+            ValueError: If it didn't
+        """
+'''
+
+def write(document):
+    """
+    Renders and writes a document, where it's being run
+    """
+
+    return sphinxter.Sphinxter.save(document.path, sphinxter.Sphinxter.render(document))
+
+if __name__ == "__main__":
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        sys.path.insert(0, directory)
+
+        package = "synthetic_site"
+
+        os.makedirs(os.path.join(directory, package))
+
+        with open(os.path.join(directory, package, "__init__.py"), "w", encoding="utf-8") as module:
+            module.write('"""\nSynthetic site\n"""\n')
+
+        # each module is its own document, besides the index
+
+        for index in range(DOCUMENTS - 1):
+            with open(os.path.join(directory, package, f"module_{index}.py"), "w", encoding="utf-8") as module:
+                module.write(f'"""\ndescription: Module {index}\ndocument: module_{index}\n"""\n')
+                for member in range(5):
+                    module.write(FUNCTION.format(index=member))
+                    module.write(CLASS.format(index=member))
+
+        instance = sphinxter.Sphinxter(importlib.import_module(package), base=directory, discover=True)
+        instance.read()
+
+        assert len(instance.documents) == DOCUMENTS
+
+        print(f"{'pool':>10} {'workers':>10} {'documents':>10} {'seconds':>10} {'speedup':>10}")
+
+        serial = None
+
+        for name, pool, workers in POOLS:
+
+            for path in glob.glob(os.path.join(directory, "*.rst")):
+                os.remove(path)
+
+            documents = list(instance.documents.values())
+
+            start = time.perf_counter()
+
+            if pool is None:
+                written = [write(document) for document in documents]
+            else:
+                with pool(workers) as executor:
+                    written = list(executor.map(write, documents, chunksize=16))
+
+            seconds = time.perf_counter() - start
+
+            texts = {}
+
+            for document in documents:
+                with open(document.path, "r", encoding="utf-8") as file:
+                    texts[document.path] = file.read()
+
+            if serial is None:
+                serial = (texts, seconds)
+
+            assert all(written) and texts == serial[0]
+
+            print(f"{name:>10} {str(workers):>10} {len(texts):>10} {seconds:>10.3f} {serial[1] / seconds:>10.2f}")
@@ -6,6 +6,7 @@ import sphinxter
 import sphinxter.unittest
 
 logging.getLogger().setLevel(logging.INFO)
+sphinxter.Source.listeners.append(sphinxter.Source.log)
 
 sphinxter.Sphinxter(
     [sphinxter, sphinxter.unittest],
@@ -13,16 +14,36 @@ sphinxter.Sphinxter(
         'index': "sphinxter",
         'sphinxter': "sphinxter.Sphinxter",
         'reader': "sphinxter.Reader",
+        'static': "sphinxter.Static",
+        'source': "sphinxter.Source",
+        'parser': "sphinxter.Parser",
+        'parsed': "sphinxter.Parsed",
+        'signatures': "sphinxter.Signatures",
+        'registry': "sphinxter.Registry",
+        'memory': "sphinxter.Memory",
         'writer': "sphinxter.Writer",
+        'sections': "sphinxter.Sections",
         'document': "sphinxter.Document",
+        'cache': "sphinxter.Cache",
+        'timings': "sphinxter.Timings",
         'unittest': "sphinxter.unittest"
     },
     [
         'self',
         'sphinxter',
         'reader',
+        'static',
+        'source',
+        'parser',
+        'parsed',
+        'signatures',
+        'registry',
+        'memory',
         'writer',
+        'sections',
         'document',
+        'cache',
+        'timings',
         'unittest'
     ]
 ).process()
@@ -164,10 +164,45 @@ description: |
         sphinx-build -b html docs/source/ docs/build/html
 
     * To change settings, like docs location, indenting by, check out :any:`sphinxter.Sphinxter`
+
+    * To read from source without importing, pass paths instead of modules, and check out :any:`Static.read()`
+
+    * To read modules in parallel processes, check out the jobs setting of :any:`sphinxter.Sphinxter`
+
+    * To read all the modules in a package without listing them, check out :any:`Sphinxter.submodules()`
+
+    * To rewrite documents as you edit, check out :any:`Sphinxter.watch()`
 """
 
+# pylint: disable=too-few-public-methods, broad-except
+
+import os
+import io
+import sys
+import time
+import logging
+import fnmatch
+import hashlib
+import inspect
+import pkgutil
+import importlib
+import itertools
+import tempfile
+import contextlib
+import concurrent.futures
+
+from sphinxter.cache import Cache, Store
+from sphinxter.timings import Timings
+from sphinxter.source import Source
+from sphinxter.parser import Parser
+from sphinxter.parsed import Parsed, Compact
+from sphinxter.signatures import Signatures
+from sphinxter.registry import Registry
+from sphinxter.memory import Memory
 from sphinxter.reader import Reader
+from sphinxter.static import Static
 from sphinxter.document import Document
+from sphinxter.sections import Sections
 from sphinxter.writer import Writer
 
 class Sphinxter:
@@ -176,20 +211,105 @@ class Sphinxter:
     document: sphinxter
     """
 
-    modules = None      # list of modules to read
+    class Settings:
+        """
+        description: |
+            Settings for reading, given to :any:`Sphinxter` as keywords. They're kept together so they can be
+            passed along as one to the processes reading in jobs. Any setting not given keeps its default.
+        usage: |
+            ::
+
+                import sphinxter
+
+                settings = sphinxter.Sphinxter.Settings(jobs=4, owners=["yourpackage"])
+
+                settings.jobs
+                # 4
+
+                settings.cache_size
+                # 104857600
+        """
+
+        cache = None                # directory to keep module documentation and written fragments in between runs, None to not keep any
+        cache_size = 100*1024*1024  # most bytes to keep in the cache directory, and again in its fragments directory
+        jobs = None                 # number of processes to read modules in, None to read them in this one
+        discover = False            # whether to read all the submodules of packages too
+        include = None              # patterns of module names to read when discovering, None for all
+        exclude = None              # patterns of module names not to read when discovering
+        owners = None               # names of packages whose functions and classes to read, None to read everything
+        compact = False             # whether to keep documentation as :any:`Compact` instead of dicts
+        timed = False               # whether to time reading each resource
+
+        def __init__(self,
+            **settings  # settings to change from their defaults
+        ):
+
+            for name, value in settings.items():
+
+                if name not in Sphinxter.Settings.__dict__ or name.startswith("_"):
+                    raise TypeError(f"unknown setting {name!r}")
+
+                setattr(self, name, value)
+
+    modules = None      # list of modules, or paths of module files or package directories, to read
     titles = None       # hash of titles, keyed by document name
     toctree = None      # main toctree list of document names, default: ['*', 'self']
     base = None         # base directory to write documents
     indent = None       # string to use for indenting
+    settings = None     # :any:`Sphinxter.Settings` for reading
     documents = None    # hash of documents, keyed by name
+    timings = None      # :any:`Timings` of the last read, if timed
 
     def __init__(self,
-        modules:'module or list[module]',   # module or modules to read
+        modules:'module or list[module]',   # module or modules to read, with paths read by :any:`Static.read`
         titles:dict=None,                   # document titles to use
         toctree:dict=None,                  # list of document names to use for the main toctree
         base:str="docs/source",             # base directory to store generated documents
-        indent:str='    '                   # string to use for indenting
+        indent:str='    ',                  # string to use for indenting
+        **settings                          # any of the :any:`Sphinxter.Settings` for reading, like cache, jobs, or owners
     ):
+        """
+        usage: |
+            To only read modules whose source has changed since the last run, keep a cache directory::
+
+                sphinxter.Sphinxter(yourmodule, cache=".sphinxter").process()
+
+            That also keeps what's written for each function, class, and module, in a fragments directory
+            within it, so only what's changed is written again. See :any:`Writer.store` for more.
+
+            To read many modules at once, set the number of processes to read them in::
+
+                sphinxter.Sphinxter([yourmodule, yourothermodule], jobs=4).process()
+
+            Each process imports the modules it reads by name, so they have to be importable. The documents
+            written are the same as reading them one by one.
+
+            To read a package and all its submodules, without listing them, discover them::
+
+                sphinxter.Sphinxter(yourpackage, discover=True, exclude=["*.tests", "*.tests.*"], jobs=4).process()
+
+            With jobs, the submodules are imported in those processes too.
+
+            To only document your own functions and classes, not what's imported from elsewhere, set the
+            packages that own them::
+
+                sphinxter.Sphinxter(yourpackage, discover=True, owners=["yourpackage"]).process()
+
+            Each function and class is documented in the module that defines it, and just referenced in any
+            others that import it. See :any:`Registry.owners` for more.
+
+            To use a lot less memory with a lot of modules, keep the documentation compact::
+
+                sphinxter.Sphinxter(yourpackage, discover=True, compact=True).process()
+
+            To find what's slow to read, time it and check the report for the slowest resources::
+
+                instance = sphinxter.Sphinxter(yourpackage, discover=True, timed=True)
+                instance.read()
+                instance.report(5)["slowest"]
+
+            See :any:`Timings` for what's in the report.
+        """
 
         if not isinstance(modules, list):
             modules = [modules]
@@ -199,6 +319,7 @@ class Sphinxter:
         self.toctree = toctree if toctree is not None else ['self', '*']
         self.base = base
         self.indent = indent
+        self.settings = Sphinxter.Settings(**settings)
         self.documents = {}
 
     def document(self,
@@ -284,39 +405,553 @@ class Sphinxter:
 
         return path
 
+    @staticmethod
+    def submodules(
+        package:'module',   # package, or module, to start from
+        include:list=None,  # patterns of module names to keep, None for all
+        exclude:list=None   # patterns of module names not to keep
+    )->list:
+        """
+        description: |
+            Finds the names of a package and all its submodules, recursively, with :any:`pkgutil.walk_packages`.
+            Subpackages are imported to look inside them, but plain modules aren't. Patterns are shell style,
+            like :any:`fnmatch.fnmatch`.
+        return: list of module names, the package first
+        usage: |
+            ::
+
+                import sphinxter
+
+                sphinxter.Sphinxter.submodules(sphinxter, exclude=["*.reader"])
+                # [
+                #     "sphinxter",
+                #     "sphinxter.cache",
+                #     "sphinxter.document",
+                #     "sphinxter.timings",
+                #     "sphinxter.unittest",
+                #     "sphinxter.writer"
+                # ]
+        """
+
+        names = [package.__name__]
+
+        if hasattr(package, "__path__"):
+            names.extend(name for _, name, _ in pkgutil.walk_packages(package.__path__, f"{package.__name__}."))
+
+        return [
+            name for name in names
+            if (include is None or any(fnmatch.fnmatchcase(name, pattern) for pattern in include))
+            and not any(fnmatch.fnmatchcase(name, pattern) for pattern in (exclude or []))
+        ]
+
+    @staticmethod
+    def load(
+        name:str,                           # name of the module, or path if static
+        static:bool,                        # whether to read from source only, with :any:`Static.read`
+        settings:'Sphinxter.Settings'=None, # settings for reading, the defaults if None
+        reading:list=None                   # names of all the modules being read, as :any:`Registry.reading`
+    )->tuple:
+        """
+        description: |
+            Reads a module by name, or path, so it can be done in another process. Since what's been
+            documented where is only known to the process reading everything in order, nothing is referenced
+            here, leaving that to :any:`Registry.link`, with what was documented where here.
+
+            If timed, everything is read here, so it's all in the timings returned.
+        return: list of module documentation, where their functions and classes were documented, and their :any:`Timings` if timed
+        """
+
+        if settings is None:
+            settings = Sphinxter.Settings()
+
+        Memory.store = Store(settings.cache, settings.cache_size) if settings.cache is not None else None
+        Registry.owners = settings.owners
+        Registry.reading = reading
+        Source.timings = Timings() if settings.timed else None
+        Registry.symbols.clear()
+
+        if static:
+            parseds = Static.read(name)
+        else:
+            parseds = [Reader.module(importlib.import_module(name))]
+
+        if settings.timed:
+            Parsed.resolve(parseds)
+
+        return parseds, dict(Registry.symbols.entries), Source.timings
+
+    def prepare(self):
+        """
+        Starts reading, clearing what's been read and setting up the Reader and Writer
+        """
+
+        Reader.reset()
+        settings = self.settings
+
+        Memory.store = Store(settings.cache, settings.cache_size) if settings.cache is not None else None
+        Writer.store = Store(os.path.join(settings.cache, "fragments"), settings.cache_size) if settings.cache is not None else None
+        Registry.owners = settings.owners
+        Source.timings = Timings() if settings.timed else None
+
+        self.timings = Source.timings
+        self.documents = {}
+
+    def sources(self)->list:
+        """
+        description: What to read, expanding packages if discovering
+        return: list of modules, or module names, and whether each is to be read statically, as paths are
+        """
+
+        sources = []
+
+        for module in self.modules:
+            if isinstance(module, str):
+                sources.append((module, True))
+            elif self.settings.discover:
+                sources.extend((name, False) for name in self.submodules(module, self.settings.include, self.settings.exclude))
+            else:
+                sources.append((module, False))
+
+        return sources
+
+    @staticmethod
+    def reading(
+        sources:list    # modules, or module names, and whether each is to be read statically, from :any:`Sphinxter.sources`
+    )->list:
+        """
+        description: Names of the modules to be read that aren't static, for :any:`Registry.reading`
+        return: list of module names
+        """
+
+        return [getattr(module, "__name__", module) for module, static in sources if not static]
+
+    @staticmethod
+    def walk(
+        module,         # module, module name, or path if static
+        static:bool     # whether to read from source only, with :any:`Static.read`
+    ):
+        """
+        description: Reads a module, or path, in this process, one resource at a time
+        return: generator of module name, kind, and parsed documentation, like :any:`Reader.walk`
+        """
+
+        if static:
+            return itertools.chain.from_iterable(Reader.records(parsed) for parsed in Static.read(module))
+
+        module = importlib.import_module(module) if isinstance(module, str) else module
+
+        # what's stored, or watched, is read as whole modules
+
+        if Memory.store is not None or Memory.files is not None:
+            return Reader.records(Reader.module(module))
+
+        return Reader.walk(module)
+
+    def collect(self,
+        records # module name, kind, and parsed documentation of a module's resources, module first
+    ):
+        """
+        Adds the resources of a module to their document(s)
+        """
+
+        for module, kind, parsed in records:
+
+            if self.settings.compact:
+                parsed = Compact.compact(parsed)
+
+            if kind == "module":
+                path = self.document(module, kind, parsed)
+            else:
+                self.document(module, kind, parsed, path)
+
     def read(self):
         """
         Reads all the documentation into their document(s)
         """
 
-        for module in self.modules:
+        self.prepare()
+
+        sources = self.sources()
+        Registry.reading = self.reading(sources)
+
+        with contextlib.ExitStack() as stack:
+
+            if self.settings.jobs is None:
+
+                walks = (self.walk(module, static) for module, static in sources)
+
+            else:
 
-            parsed = Reader.module(module)
+                executor = stack.enter_context(concurrent.futures.ProcessPoolExecutor(self.settings.jobs))
+
+                loads = executor.map(
+                    self.load,
+                    [module if static else getattr(module, "__name__", module) for module, static in sources],
+                    [static for _, static in sources],
+                    [self.settings] * len(sources),
+                    [Registry.reading] * len(sources)
+                )
+
+                def merged():
+                    for parseds, symbols, timings in loads:
+                        if timings is not None:
+                            self.timings.merge(timings)
+                        yield parseds, symbols
+
+                walks = (
+                    itertools.chain.from_iterable(Reader.records(Registry.link(parsed, symbols)) for parsed in parseds)
+                    for parseds, symbols in merged()
+                )
+
+            # modules are documented as they're ready, in order
+
+            for records in walks:
+                self.collect(records)
+
+    @staticmethod
+    def stat(
+        module,         # module, module name, or path if static
+        static:bool     # whether it's a path, read with :any:`Static.read`
+    )->dict:
+        """
+        description: |
+            Modification times and sizes of the source files of a module, or a path's modules. For a module, that's
+            every file its documentation was read from, if kept track of in :any:`Memory.files`, like the submodules
+            a package re-exports classes from, or else just its own.
+        return: modification time and size, keyed by file path
+        """
+
+        if static:
+
+            paths = [module]
+
+            if os.path.isdir(module):
+                paths = [
+                    os.path.join(directory, name)
+                    for directory, _, names in os.walk(module)
+                    for name in names if name.endswith(".py")
+                ]
+
+        else:
 
-            path = self.document(parsed['name'], "module", parsed)
+            module = importlib.import_module(module) if isinstance(module, str) else module
+            paths = sorted((Memory.files or {}).get(module.__name__) or [inspect.getsourcefile(module) or module.__file__])
 
-            for function in parsed["functions"]:
-                self.document(parsed['name'], "function", function, path)
+        stats = {}
 
-            for cls in parsed["classes"]:
-                self.document(parsed['name'], "class", cls, path)
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                stats[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                stats[path] = None
 
-            for cls in parsed["exceptions"]:
-                self.document(parsed['name'], "exception", cls, path)
+        return stats
 
-    def write(self):
+    def rewrite(self,
+        records:list,   # records of each module, in order
+        written:dict    # text last written, keyed by document path
+    )->dict:
         """
-        Writes all document(s)
+        description: |
+            Rebuilds the document(s) from what's been read and writes those whose text changed
+        return: text written, keyed by document path
         """
 
+        self.documents = {}
+
+        for module in records:
+            self.collect(module)
+
+        texts = {}
+
         for document in self.documents.values():
-            with open(document.path, "w", encoding="utf-8") as file:
-                Writer(document, file).dump()
 
-    def process(self):
+            texts[document.path] = self.render(document)
+
+            if written.get(document.path) != texts[document.path] and self.save(document.path, texts[document.path]):
+                if Source.listeners:
+                    Source.emit("document", document.path)
+
+        return texts
+
+    def watch(self,
+        interval:float=1.0, # seconds between checking for changes
+        polls:int=None      # how many times to check, None to keep checking until interrupted
+    ):
+        """
+        description: |
+            Reads and writes everything, then keeps checking the source files of what's documented for changes,
+            by their modification times and sizes, rereading only the modules whose files changed and rewriting
+            only the documents whose text changed.
+
+            The files checked for a module are all those its documentation was read from, kept track of in
+            :any:`Memory.files`, so a package is reread when a submodule it re-exports a class from changes.
+            Changed modules are reloaded with :any:`importlib.reload` before they're reread, along with the
+            modules whose files changed, so what they define is current. Paths are just reread. Modules are
+            always read in this process, no matter the jobs setting.
+
+            Submodules added while watching aren't discovered until it's started again.
+
+            If a module can't be reread, like with a syntax error mid edit, that's logged as a warning and sent
+            to :any:`Source.listeners` as an error event, and what was read of it before is kept until it's fixed.
+            What's cached for what's reread is pruned with :any:`Reader.prune`, so it doesn't grow as it runs.
+        usage: |
+            Instead of processing, watch while editing, stopping with Ctrl-C::
+
+                sphinxter.Sphinxter(yourmodule).watch()
+
+            Add :any:`Source.log` to :any:`Source.listeners` to have each document rewritten logged.
+        """
+
+        self.prepare()
+
+        sources = self.sources()
+        Registry.reading = self.reading(sources)
+        Memory.files = {}
+
+        try:
+
+            records = [list(self.walk(module, static)) for module, static in sources]
+            stats = [self.stat(module, static) for module, static in sources]
+
+            written = self.rewrite(records, {})
+
+            poll = 0
+
+            while polls is None or poll < polls:
+
+                time.sleep(interval)
+                poll += 1
+
+                changed = False
+                reloaded = set()
+
+                for index, (module, static) in enumerate(sources):
+
+                    stat = self.stat(module, static)
+
+                    if stat == stats[index]:
+                        continue
+
+                    reread = self.reread(module, static, [path for path, at in stat.items() if at != stats[index].get(path)], reloaded)
+                    stats[index] = stat
+
+                    # likely mid edit, so keep what was read before until it's fixed
+
+                    if reread is None:
+                        continue
+
+                    module, records[index] = reread
+                    sources[index] = (module, static)
+                    changed = True
+
+                    # what it was read from can change too
+
+                    stats[index] = self.stat(module, static)
+
+                if changed:
+                    written = self.rewrite(records, written)
+
+        finally:
+
+            Memory.files = None
+
+    def reread(self,
+        module,             # module, module name, or path if static
+        static:bool,        # whether it's a path, read with :any:`Static.read`
+        paths:list=None,    # paths of the files that changed
+        reloaded:set=None   # names of the modules already reloaded this time, which is added to
+    )->tuple:
+        """
+        description: |
+            Rereads a module whose files changed while watching, reloading it first unless it's a path, after
+            reloading any other modules whose files changed with :any:`Sphinxter.reload`. If it can't be, that's
+            logged as a warning and sent to :any:`Source.listeners` as an error event.
+        return: the module, reloaded if it was, and its records, or None if it couldn't be reread
+        """
+
+        name = module if static else getattr(module, "__name__", module)
+        symbols = dict(Registry.symbols.entries)
+
+        try:
+
+            if not static:
+                module = self.reload(importlib.import_module(module) if isinstance(module, str) else module, paths or [], reloaded)
+            else:
+                Reader.prune()
+
+            return module, list(self.walk(module, static))
+
+        except Exception as exception:
+
+            Registry.symbols.entries = symbols
+
+            logging.warning("couldn't reread %s: %s", name, exception)
+
+            if Source.listeners:
+                Source.emit("error", name, f"{type(exception).__name__}: {exception}")
+
+            return None
+
+    @staticmethod
+    def reload(
+        module,             # module to reload
+        paths:list,         # paths of the files that changed
+        reloaded:set=None   # names of the modules already reloaded this time, which is added to
+    )->'module':
+        """
+        description: |
+            Reloads a module with :any:`importlib.reload`, first reloading any other modules whose files are among
+            those that changed, like a submodule a package imports a class from, so the module picks up what they
+            define now. What's cached for each is pruned with :any:`Reader.prune`, and what was documented in each
+            is forgotten, until it's reread.
+        return: the module reloaded
+        """
+
+        if reloaded is None:
+            reloaded = set()
+
+        changed = {os.path.abspath(path) for path in paths}
+
+        defining = [
+            name for name, loaded in list(sys.modules.items())
+            if name != module.__name__ and name not in reloaded
+            and getattr(loaded, "__file__", None) and os.path.abspath(loaded.__file__) in changed
+        ]
+
+        for name in [*defining, module.__name__]:
+
+            if name not in reloaded:
+                importlib.reload(sys.modules[name])
+                reloaded.add(name)
+
+            for symbol in Registry.documented(name):
+                del Registry.symbols.entries[symbol]
+
+            Reader.prune(name)
+
+        return sys.modules[module.__name__]
+
+    def report(self,
+        top:int=10  # how many of the slowest resources to include
+    )->dict:
+        """
+        description: Report of how long the last read took, by resource and phase, if timed
+        return: :any:`Timings.report` of the last read, or None if not timed
+        """
+
+        if self.timings is None:
+            return None
+
+        return self.timings.report(top)
+
+    @staticmethod
+    def save(
+        path:str,   # where to write the text
+        text:str    # text of the document
+    )->bool:
+        """
+        description: |
+            Writes a document's text, unless the file already has exactly that text, so unchanged documents
+            keep their modification times and Sphinx doesn't rebuild them.
+
+            Texts are compared by hash. The text is written to a temporary file next to the document that's
+            then renamed over it, so the document is never left half written. A document replaced keeps its
+            permissions.
+        return: whether the document was written
+        """
+
+        if Source.digest(path) == hashlib.sha256(text.encode("utf-8")).hexdigest():
+            return False
+
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except OSError:
+            umask = os.umask(0o022)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=os.path.dirname(path) or ".", suffix=".tmp", delete=False
+        ) as file:
+            file.write(text)
+
+        try:
+            os.chmod(file.name, mode)
+            os.replace(file.name, path)
+        except OSError:
+            os.remove(file.name)
+            raise
+
+        return True
+
+    @staticmethod
+    def render(
+        document:Document   # document to render
+    )->str:
+        """
+        description: Renders a document's text
+        """
+
+        text = io.StringIO()
+        Writer(document, text).dump()
+
+        return text.getvalue()
+
+    def write(self,
+        drop:bool=False # whether to drop each document once it's written
+    )->dict:
+        """
+        description: |
+            Writes all document(s) whose text changed, leaving the rest alone. Each document is rendered
+            and written before the next, and if dropping, once written, it's no longer kept, so everything
+            read for it can go too.
+        return: paths of the documents written and unchanged
+        usage: |
+            Rerunning with nothing changed writes nothing::
+
+                instance = sphinxter.Sphinxter(yourmodule)
+
+                instance.read()
+                instance.write()
+                # {"written": ["docs/source/index.rst"], "unchanged": []}
+
+                instance.write()
+                # {"written": [], "unchanged": ["docs/source/index.rst"]}
+
+            Add :any:`Source.log` to :any:`Source.listeners` to have each document written logged.
+        """
+
+        summary = {
+            "written": [],
+            "unchanged": []
+        }
+
+        for path in list(self.documents):
+
+            document = self.documents.pop(path) if drop else self.documents[path]
+
+            if self.save(document.path, self.render(document)):
+
+                summary["written"].append(document.path)
+
+                if Source.listeners:
+                    Source.emit("document", document.path)
+
+            else:
+                summary["unchanged"].append(document.path)
+
+        return summary
+
+    def process(self)->dict:
         """
-        Reads module(s) and writes document(s) end to end
+        description: |
+            Reads module(s) and writes document(s) end to end, dropping each document once it's written.
+            Along with :any:`Reader.walk` only reading functions and classes as they're needed, that
+            keeps the documentation of only about one document in memory at a time.
+        return: paths of the documents written and unchanged
         """
 
         self.read()
-        self.write()
+        return self.write(drop=True)
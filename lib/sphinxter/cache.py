@@ -0,0 +1,361 @@
+"""
+Module for caching what's been read
+"""
+
+import os
+import pickle
+import tempfile
+
+class Cache:
+    """
+    description: Cache, optionally bounded, that counts its hits, misses, and evictions
+    document: cache
+    usage: |
+        Values are stored and retrieved by key, with every lookup counted::
+
+            import sphinxter
+
+            cache = sphinxter.Cache()
+
+            cache.get("a")
+            # None
+
+            cache.set("a", 1)
+            cache.get("a")
+            # 1
+
+            cache.stats()
+            # {
+            #     "entries": 1,
+            #     "hits": 1,
+            #     "misses": 1,
+            #     "evictions": 0
+            # }
+
+        If bounded by a size, the least recently used entries are evicted to make room::
+
+            cache = sphinxter.Cache(2)
+
+            cache.set("a", 1)
+            cache.set("b", 2)
+            cache.get("a")
+            cache.set("c", 3)
+
+            list(cache.entries.keys())
+            # [
+            #     "a",
+            #     "c"
+            # ]
+    """
+
+    size = None         # most entries to keep, None for no limit
+    entries = None      # cached values, keyed by key, least recently used first
+    hits = None         # number of lookups that found a value
+    misses = None       # number of lookups that didn't
+    evictions = None    # number of entries removed to stay within size
+
+    def __init__(self,
+        size:int=None   # most entries to keep, None for no limit
+    ):
+
+        self.size = size
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self,
+        key,            # key to lookup
+        default=None    # what to return if not found
+    ):
+        """
+        description: Retrieves a value, counting the hit or miss
+        usage: |
+            If the key isn't found, the default is returned::
+
+                import sphinxter
+
+                cache = sphinxter.Cache()
+
+                cache.get("a", 2)
+                # 2
+        """
+
+        if key in self.entries:
+            self.hits += 1
+            if self.size is not None:
+                self.entries[key] = self.entries.pop(key)
+            return self.entries[key]
+
+        self.misses += 1
+        return default
+
+    def set(self,
+        key,    # key to store under
+        value   # value to store
+    ):
+        """
+        Stores a value, evicting the least recently used if over size
+        """
+
+        self.entries.pop(key, None)
+        self.entries[key] = value
+
+        if self.size is not None:
+            while len(self.entries) > self.size:
+                del self.entries[next(iter(self.entries))]
+                self.evictions += 1
+
+    def clear(self):
+        """
+        description: Removes all entries and resets the counters, keeping the size
+        usage: |
+            ::
+
+                import sphinxter
+
+                cache = sphinxter.Cache()
+
+                cache.set("a", 1)
+                cache.get("a")
+                cache.clear()
+
+                cache.stats()
+                # {
+                #     "entries": 0,
+                #     "hits": 0,
+                #     "misses": 0,
+                #     "evictions": 0
+                # }
+        """
+
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self)->dict:
+        """
+        description: Current counters, for seeing how well the cache is doing
+        return: dict of entries, hits, misses, and evictions
+        """
+
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+class Store:
+    """
+    description: |
+        Cache persisted as files in a directory, bounded by their total size in bytes, that counts its hits,
+        misses, and evictions. Keys have to be strings safe to use as file names, like hex digests.
+    document: cache
+    usage: |
+        Values are pickled into the directory, so they're still there next run::
+
+            import tempfile
+            import sphinxter
+
+            directory = tempfile.mkdtemp()
+
+            store = sphinxter.Store(directory)
+
+            store.get("a")
+            # None
+
+            store.set("a", {"b": 1})
+
+            sphinxter.Store(directory).get("a")
+            # {
+            #     "b": 1
+            # }
+
+        When the total size goes over, the least recently used entries are evicted::
+
+            store = sphinxter.Store(tempfile.mkdtemp(), 200)
+
+            store.set("a", "a" * 100)
+            store.set("b", "b" * 100)
+
+            store.stats()
+            # {
+            #     "entries": 1,
+            #     "hits": 0,
+            #     "misses": 0,
+            #     "evictions": 1
+            # }
+    """
+
+    path = None         # directory to store entries in
+    size = None         # most total bytes to keep, None for no limit
+    hits = None         # number of lookups that found a value
+    misses = None       # number of lookups that didn't
+    evictions = None    # number of entries removed to stay within size
+    sizes = None        # bytes of each entry file, least recently used first, tallied when first needed
+    """
+    type:
+    - None
+    - dict
+    description: |
+        Only kept when bounded by size. The directory's scanned once, the first time a value's set, and after
+        that this is kept up to date as values are set and retrieved, so setting doesn't rescan the directory.
+        Entries another process adds meanwhile, like when reading in jobs, aren't counted until the next Store.
+    """
+    total = None        # total bytes of the entries in sizes
+
+    def __init__(self,
+        path:str,       # directory to store entries in, created if need be
+        size:int=None   # most total bytes to keep, None for no limit
+    ):
+
+        self.path = path
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.sizes = None
+        self.total = 0
+
+        os.makedirs(path, exist_ok=True)
+
+    def entry(self,
+        key:str # key of the entry
+    )->str:
+        """
+        description: Path of the file for an entry
+        """
+
+        return os.path.join(self.path, f"{key}.pickle")
+
+    def get(self,
+        key:str,        # key to lookup
+        default=None    # what to return if not found
+    ):
+        """
+        description: Retrieves a value, counting the hit or miss, and marking it as recently used
+        """
+
+        entry = self.entry(key)
+
+        try:
+            with open(entry, "rb") as file:
+                value = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError, TypeError):
+
+            # unreadable, or stale, like pickled from a class that's since been renamed or removed
+
+            self.misses += 1
+            return default
+
+        # another process could've evicted it since
+
+        try:
+            os.utime(entry)
+        except FileNotFoundError:
+            pass
+
+        if self.sizes is not None and entry in self.sizes:
+            self.sizes[entry] = self.sizes.pop(entry)
+
+        self.hits += 1
+        return value
+
+    def set(self,
+        key:str,    # key to store under
+        value       # value to store, which has to be picklable
+    ):
+        """
+        Stores a value, evicting the least recently used if over size
+        """
+
+        entry = self.entry(key)
+
+        if self.size is not None and self.sizes is None:
+            self.tally()
+
+        with tempfile.NamedTemporaryFile("wb", dir=self.path, suffix=".tmp", delete=False) as file:
+            pickle.dump(value, file)
+            size = file.tell()
+
+        os.replace(file.name, entry)
+
+        if self.size is None:
+            return
+
+        self.total += size - self.sizes.pop(entry, 0)
+        self.sizes[entry] = size
+
+        while self.total > self.size:
+
+            path = next(iter(self.sizes))
+
+            if path == entry:
+                break
+
+            self.total -= self.sizes.pop(path)
+
+            # another process could've evicted it already
+
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+
+    def tally(self):
+        """
+        Scans the directory for the sizes of the entries, least recently used first, and their total
+        """
+
+        self.sizes = {path: stat.st_size for path, stat in self.entries()}
+        self.total = sum(self.sizes.values())
+
+    def entries(self)->list:
+        """
+        description: Files of all the entries with their stats, least recently used first
+        """
+
+        entries = []
+
+        for found in os.scandir(self.path):
+            if found.name.endswith(".pickle"):
+                try:
+                    entries.append((found.path, found.stat()))
+                except FileNotFoundError:
+                    pass
+
+        return sorted(entries, key=lambda entry: entry[1].st_mtime_ns)
+
+    def clear(self):
+        """
+        Removes all entries and resets the counters, keeping the size
+        """
+
+        for path, _ in self.entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.sizes = None
+        self.total = 0
+
+    def stats(self)->dict:
+        """
+        description: Current counters, for seeing how well the store is doing
+        return: dict of entries, hits, misses, and evictions
+        """
+
+        return {
+            "entries": len(self.entries()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
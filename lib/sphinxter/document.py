@@ -64,9 +64,11 @@ class Document:
         Content for a Document
         """
 
-        module = None   # Name of module this content is for
-        kind = None     # Kind of resource
-        parsed = None   # The parsed documentation
+        __slots__ = {
+            "module": "Name of module this content is for",
+            "kind": "Kind of resource",
+            "parsed": "The parsed documentation"
+        }
 
         def __init__(self,
             module:str, # Name of module this content is for
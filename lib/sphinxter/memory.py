@@ -0,0 +1,169 @@
+"""
+Module for remembering documentation between runs
+"""
+
+import os
+import hashlib
+import contextlib
+import importlib.metadata
+
+from sphinxter.source import Source
+from sphinxter.parsed import Parsed
+from sphinxter.registry import Registry
+
+class Memory:
+    """
+    description: Static class for storing and recalling the documentation of modules between runs
+    document: memory
+    """
+
+    store = None    # Store of module documentation kept between runs, None to not keep any
+    """
+    type:
+    - None
+    - Store
+    description: |
+        Each module's documentation is stored keyed by its name, the hash of its file, and the sphinxter
+        version, along with hashes of every file it was read from. If any of those change, it's read again.
+    """
+
+    files = None    # paths of the files each module was read from, keyed by module name, None to not keep track
+    """
+    type:
+    - None
+    - dict
+    description: |
+        That's every file loaded reading a module, including those of classes it imports, like a package
+        re-exporting them, so :any:`Sphinxter.watch` can reread a module when any of them changes.
+    """
+
+    release = None  # version of sphinxter, looked up the first time a module's keyed
+
+    @staticmethod
+    def version()->str:
+        """
+        description: |
+            Version of sphinxter, for keeping what's stored from one version apart from another. If sphinxter
+            isn't installed, like during development, a digest of the source of all its modules is used instead,
+            as reading is spread across them.
+        """
+
+        try:
+            return importlib.metadata.version("sphinxter")
+        except importlib.metadata.PackageNotFoundError:
+            directory = os.path.dirname(__file__)
+            digests = [Source.digest(os.path.join(directory, name)) for name in sorted(os.listdir(directory)) if name.endswith(".py")]
+            return hashlib.sha256("\n".join(digests).encode()).hexdigest()
+
+    @classmethod
+    def key(cls,
+        name:str,   # full name of the module
+        path:str    # path of the module's file
+    )->str:
+        """
+        description: |
+            Key for a module in :any:`Memory.store`, from its name, the hash of its file, the sphinxter version,
+            and :any:`Registry.owners`, along with :any:`Registry.reading` if owners is set
+        return:
+            description: hex SHA-256 digest, None if the file can't be read
+            type:
+            - str
+            - None
+        """
+
+        digest = Source.digest(path)
+
+        if digest is None:
+            return None
+
+        if cls.release is None:
+            cls.release = cls.version()
+
+        reading = Registry.reading if Registry.owners is not None else None
+
+        return hashlib.sha256(f"{cls.release}\n{name}\n{path}\n{digest}\n{Registry.owners}\n{reading}".encode()).hexdigest()
+
+    @classmethod
+    def recall(cls,
+        name:str,   # full name of the module
+        key:str     # key of the module, None if not storing
+    )->dict:
+        """
+        description: |
+            Retrieves a module's documentation from :any:`Memory.store`, as long as none of the files it was
+            read from have changed since, linking it with :any:`Registry.link` as if it had just been read.
+        return:
+            description: The module's documentation, None if not found
+            type:
+            - dict
+            - None
+        """
+
+        if key is None:
+            return None
+
+        entry = cls.store.get(key)
+
+        if entry is None or any(Source.digest(path) != digest for path, digest in entry["files"].items()):
+            return None
+
+        if cls.files is not None:
+            cls.files.update({name: set(entry["files"])})
+
+        return Registry.link(entry["parsed"], entry["symbols"])
+
+    @classmethod
+    @contextlib.contextmanager
+    def loading(cls,
+        key:str # key of the module, None if not storing
+    ):
+        """
+        description: |
+            Context for reading a module that wasn't recalled. If storing it, or keeping track of :any:`Memory.files`,
+            the files loaded are kept track of in :any:`Source.loaded`, for :any:`Memory.remember`, and no longer
+            once done, even if reading fails.
+        """
+
+        if key is None and cls.files is None:
+            yield
+            return
+
+        Source.loaded = set()
+
+        try:
+            yield
+        finally:
+            Source.loaded = None
+
+    @classmethod
+    def remember(cls,
+        name:str,   # full name of the module
+        key:str,    # key of the module, None if not storing
+        parsed:dict # the module's documentation
+    ):
+        """
+        description: |
+            Stores a module's documentation in :any:`Memory.store` along with hashes of the files it was read from,
+            and what it documented in :any:`Registry.symbols`, keeping track of those files in :any:`Memory.files` too.
+            The files are only known while :any:`Memory.loading`, so it has to be within that.
+        """
+
+        loaded = Source.loaded
+
+        if loaded is None:
+            return
+
+        # everything's read now, so every file's loaded
+
+        Parsed.resolve(parsed)
+
+        if cls.files is not None:
+            cls.files.update({name: set(loaded)})
+
+        if key is None:
+            return
+
+        files = {path: Source.digest(path) for path in sorted(loaded)}
+
+        if None not in files.values():
+            cls.store.set(key, {"files": files, "parsed": parsed, "symbols": Registry.documented(name)})
@@ -0,0 +1,491 @@
+"""
+Module for parsed documentation
+"""
+
+import copy
+import collections.abc
+
+class Parsed(dict):
+    """
+    description: |
+        Parsed documentation that only reads what's expensive, like docstrings, comments, annotations, and
+        signatures, when it's first needed. The fields it's given up front, like name and kind, are there
+        right away, but getting, or even checking for, any other field reads the rest, once. Since it's a
+        dict, it can be used anywhere one is.
+    document: parsed
+    usage: |
+        Fields are read when first needed::
+
+            import sphinxter
+
+            def read():
+                print("reading")
+                return {"description": "Lazy"}
+
+            parsed = sphinxter.Parsed({"name": "lazy"}, read)
+
+            parsed["name"]
+            # 'lazy'
+
+            parsed.loader is None
+            # False
+
+            parsed["description"]
+            # 'Lazy'
+
+            parsed.loader is None
+            # True
+
+        It compares, copies, and pickles just like the dict it'll end up as::
+
+            parsed == {"name": "lazy", "description": "Lazy"}
+            # True
+    """
+
+    loader = None # function returning the rest of the fields, None once they've been read
+
+    def __init__(self,
+        fields:dict=None,   # fields known up front
+        loader=None         # function returning the rest of the fields, if any
+    ):
+
+        super().__init__(fields or {})
+        self.loader = loader
+
+    def load(self)->'Parsed':
+        """
+        description: Reads the rest of the fields, if they haven't been already
+        return: itself
+        """
+
+        if self.loader is not None:
+            fields = self.loader()
+            self.loader = None
+            dict.update(self, fields)
+
+        return self
+
+    @staticmethod
+    def resolve(
+        value # parsed documentation, or anything in it
+    ):
+        """
+        description: Reads all the fields of all the parsed documentation within, however deep
+        return: the value
+        """
+
+        if isinstance(value, Parsed):
+            value.load()
+
+        if isinstance(value, dict):
+            for item in dict.values(value):
+                Parsed.resolve(item)
+        elif isinstance(value, list):
+            for item in value:
+                Parsed.resolve(item)
+
+        return value
+
+    def __getitem__(self, key):
+        """
+        Gets a field, reading the rest first if it isn't one known up front
+        """
+
+        if self.loader is not None and not dict.__contains__(self, key):
+            self.load()
+
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        """
+        Gets a field or the default, reading the rest first if it isn't one known up front
+        """
+
+        if self.loader is not None and not dict.__contains__(self, key):
+            self.load()
+
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        """
+        Whether there's a field, reading the rest first if it isn't one known up front
+        """
+
+        return dict.__contains__(self, key) or (self.loader is not None and dict.__contains__(self.load(), key))
+
+    def __iter__(self):
+        """
+        Iterates over all the fields, reading the rest first
+        """
+
+        return dict.__iter__(self.load())
+
+    def __len__(self):
+        """
+        Number of all the fields, reading the rest first
+        """
+
+        return dict.__len__(self.load())
+
+    def __eq__(self, other):
+        """
+        Compares all the fields, reading the rest of both first
+        """
+
+        if isinstance(other, Parsed):
+            other.load()
+
+        return dict.__eq__(self.load(), other)
+
+    def __ne__(self, other):
+        """
+        Compares all the fields, reading the rest of both first
+        """
+
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        """
+        Represents all the fields, reading the rest first
+        """
+
+        return dict.__repr__(self.load())
+
+    def keys(self):
+        """
+        All the field names, reading the rest first
+        """
+
+        return dict.keys(self.load())
+
+    def values(self):
+        """
+        All the field values, reading the rest first
+        """
+
+        return dict.values(self.load())
+
+    def items(self):
+        """
+        All the fields, reading the rest first
+        """
+
+        return dict.items(self.load())
+
+    def copy(self):
+        """
+        Shallow copy of all the fields, reading the rest first
+        """
+
+        return Parsed(dict.copy(self.load()))
+
+    def __setitem__(self, key, value):
+        """
+        Sets a field, reading the rest first so it isn't overwritten
+        """
+
+        dict.__setitem__(self.load(), key, value)
+
+    def __delitem__(self, key):
+        """
+        Removes a field, reading the rest first
+        """
+
+        dict.__delitem__(self.load(), key)
+
+    def pop(self, *args):
+        """
+        Removes a field and returns it, reading the rest first
+        """
+
+        return dict.pop(self.load(), *args)
+
+    def popitem(self):
+        """
+        Removes the last field and returns it, reading the rest first
+        """
+
+        return dict.popitem(self.load())
+
+    def setdefault(self, key, default=None):
+        """
+        Gets a field, setting it if not there, reading the rest first
+        """
+
+        return dict.setdefault(self.load(), key, default)
+
+    def update(self, *args, **kwargs):
+        """
+        Sets fields, reading the rest first so they aren't overwritten
+        """
+
+        dict.update(self.load(), *args, **kwargs)
+
+    def clear(self):
+        """
+        Removes all the fields, without reading the rest
+        """
+
+        self.loader = None
+        dict.clear(self)
+
+    def __reduce__(self):
+        """
+        Pickles all the fields, reading the rest first
+        """
+
+        return (Parsed, (dict(dict.items(self.load())),))
+
+    def __deepcopy__(self, memo):
+        """
+        Deep copy that, if the rest hasn't been read, shares reading it with the original
+        """
+
+        if self.loader is None:
+            return Parsed(copy.deepcopy(dict(dict.items(self)), memo))
+
+        # share the reading with the original, copying what it reads
+
+        return Parsed(
+            copy.deepcopy(dict(dict.items(self)), memo),
+            lambda: copy.deepcopy(dict(dict.items(self.load())))
+        )
+
+
+class Compact(collections.abc.Mapping):
+    """
+    description: |
+        Compact, read only, version of parsed documentation. Only the values are kept, in a tuple, with
+        the keys kept once for every parsed dict with the same keys, making it a fraction of the size of
+        a dict. It's a Mapping, so it can be used like a read only dict, to get, check for, and go through
+        fields, and compares equal to the dict it came from.
+    document: parsed
+    usage: |
+        Parsed documentation is made compact, however deep::
+
+            import sphinxter
+
+            compact = sphinxter.Compact.compact({
+                "name": "func",
+                "parameters": [
+                    {
+                        "name": "a",
+                        "description": "The a"
+                    }
+                ]
+            })
+
+            compact["parameters"][0]["description"]
+            # 'The a'
+
+            "usage" in compact
+            # False
+
+            compact == {"name": "func", "parameters": [{"name": "a", "description": "The a"}]}
+            # True
+
+        It isn't a dict though, so to get back a dict, say for json, use dict()::
+
+            compact.dict()
+            # {
+            #     "name": "func",
+            #     "parameters": [
+            #         {
+            #             "name": "a",
+            #             "description": "The a"
+            #         }
+            #     ]
+            # }
+    """
+
+    __slots__ = {
+        "data": "values of the fields, in the same order as their keys"
+    }
+
+    fields = ()     # keys of every Compact of this shape, in order
+    positions = {}  # position of each value, keyed by key
+    shapes = {}     # classes for each shape, keyed by their keys
+    """
+    type: dict
+    description: |
+        Each set of keys, in order, gets its own subclass, shared by every parsed dict with those
+        keys. That's where the keys live, so each instance only has to hold its values.
+    """
+
+    def __init__(self,
+        data:tuple  # values of the fields, in the same order as their keys
+    ):
+
+        self.data = data
+
+    @staticmethod
+    def shape(
+        fields:tuple # keys, in order
+    )->type:
+        """
+        description: The class for parsed dicts with these keys, making it the first time
+        """
+
+        shape = Compact.shapes.get(fields)
+
+        if shape is None:
+            shape = type("Compact", (Compact,), {
+                "__slots__": (),
+                "fields": fields,
+                "positions": {field: position for position, field in enumerate(fields)}
+            })
+            Compact.shapes[fields] = shape
+
+        return shape
+
+    @staticmethod
+    def make(
+        fields:tuple, # keys, in order
+        values:tuple  # values, in the same order
+    )->'Compact':
+        """
+        description: Makes a Compact from its keys and values
+        """
+
+        return Compact.shape(fields)(values)
+
+    @staticmethod
+    def compact(
+        value # parsed documentation, or anything in it
+    ):
+        """
+        description: Makes every dict within compact, however deep, reading any lazy documentation first
+        return: the value, with its dicts compact
+        """
+
+        if isinstance(value, dict):
+            return Compact.make(tuple(value.keys()), tuple(Compact.compact(item) for item in value.values()))
+
+        if isinstance(value, list):
+            return [Compact.compact(item) for item in value]
+
+        return value
+
+    def dict(self)->dict:
+        """
+        description: Plain dict version, however deep
+        """
+
+        return {field: Compact.expand(value) for field, value in zip(self.fields, self.data)}
+
+    @staticmethod
+    def expand(
+        value # compact documentation, or anything in it
+    ):
+        """
+        description: Makes every Compact within a plain dict, however deep
+        return: the value, with its Compacts as dicts
+        """
+
+        if isinstance(value, Compact):
+            return value.dict()
+
+        if isinstance(value, list):
+            return [Compact.expand(item) for item in value]
+
+        return value
+
+    def __getitem__(self, key):
+        """
+        Gets a field
+        """
+
+        return self.data[self.positions[key]]
+
+    def get(self, key, default=None):
+        """
+        Gets a field, or the default if it's not there
+        """
+
+        position = self.positions.get(key)
+
+        return default if position is None else self.data[position]
+
+    def __contains__(self, key):
+        """
+        Whether there's a field
+        """
+
+        return key in self.positions
+
+    def __iter__(self):
+        """
+        Iterates over the keys, like a dict
+        """
+
+        return iter(self.fields)
+
+    def __len__(self):
+        """
+        Number of fields
+        """
+
+        return len(self.fields)
+
+    def keys(self):
+        """
+        All the keys
+        """
+
+        return self.fields
+
+    def values(self):
+        """
+        All the values
+        """
+
+        return self.data
+
+    def items(self):
+        """
+        All the fields, as key value pairs
+        """
+
+        return tuple(zip(self.fields, self.data))
+
+    def __eq__(self, other):
+        """
+        Compares the fields, with a dict or another Compact
+        """
+
+        if isinstance(other, Compact):
+            return self.fields == other.fields and self.data == other.data
+
+        if isinstance(other, dict):
+            return len(other) == len(self.fields) and all(
+                field in other and other[field] == value for field, value in zip(self.fields, self.data)
+            )
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        """
+        Compares the fields, with a dict or another Compact
+        """
+
+        equal = self.__eq__(other)
+
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        """
+        Represents the fields like a dict
+        """
+
+        return repr(dict(zip(self.fields, self.data)))
+
+    def __reduce__(self):
+        """
+        Pickles the keys and values, as the class for its shape can't be
+        """
+
+        return (Compact.make, (self.fields, self.data))
@@ -0,0 +1,371 @@
+"""
+Module for parsing docstrings and comments
+"""
+
+import sys
+import copy
+import yaml
+
+from sphinxter.cache import Cache
+from sphinxter.source import Source
+
+class Parser:
+    """
+    description: Static class for parsing docstrings and comments into dict's
+    document: parser
+    """
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader) # YAML loader to use, the C one if libyaml is installed
+
+    parses = Cache(10000) # parsed docstrings and comments, keyed by their text, least recently used evicted
+    """
+    type: Cache
+    description: |
+        The same docstrings and comments, like "The id of the record", tend to be repeated across many
+        routines, so each is only parsed once. Change parses.size to tune it, checking parses.stats()
+        to see how often it hits and evicts.
+    """
+
+    interns = ("name", "kind", "type") # keys whose strings are interned, along with every key
+    """
+    type: tuple[str]
+    description: |
+        Names, kinds, and types like "str" repeat across every routine, so :any:`Parser.intern` makes each
+        one a single shared string, keeping what's read smaller and comparing it quicker.
+    """
+
+    @classmethod
+    def intern(cls,
+        value,          # parsed value to intern
+        strings=False   # whether to intern strings themselves, not just keys
+    ):
+        """
+        description: |
+            Interns a parsed value with :any:`sys.intern`, recursively. Every dict key is interned, as are strings
+            under any of the keys in :any:`Parser.interns`, but not descriptions and the like, which rarely repeat.
+        return: the same value with its keys and names interned
+        usage: |
+            ::
+
+                import sys
+                import sphinxter
+
+                parsed = sphinxter.Parser.intern({"".join(["ty", "pe"]): ["".join(["s", "tr"]), "None"]})
+
+                list(parsed.keys())[0] is sys.intern("type")
+                # True
+
+                parsed["type"][0] is sys.intern("str")
+                # True
+        """
+
+        if isinstance(value, dict):
+            return {
+                sys.intern(key) if isinstance(key, str) else key: cls.intern(item, key in cls.interns)
+                for key, item in value.items()
+            }
+
+        if isinstance(value, list):
+            return [cls.intern(item, strings) for item in value]
+
+        if strings and isinstance(value, str):
+            return sys.intern(value)
+
+        return value
+
+    @staticmethod
+    def prose(
+        text:str # stripped text to check
+    )->bool:
+        """
+        description: |
+            Whether text is a single line that YAML would load as that same string, so it can skip YAML
+            entirely. It has to start with a letter, have nothing that could make it a mapping or a comment,
+            and not be something like yes or null, which YAML would load as a bool or None.
+        usage: |
+            ::
+
+                import sphinxter
+
+                sphinxter.Parser.prose("A plain function")
+                # True
+
+                sphinxter.Parser.prose("description: An exact function")
+                # False
+
+                sphinxter.Parser.prose("yes")
+                # False
+        """
+
+        if not text or not text[0].isalpha() or not text.isprintable() or ":" in text or "#" in text:
+            return False
+
+        for _, regexp in yaml.SafeLoader.yaml_implicit_resolvers.get(text[0], []):
+            if regexp.match(text):
+                return False
+
+        return True
+
+    @classmethod
+    def parse(cls,
+            docstring:str # the docstring (or string after an attribute)
+        )->dict:
+        """
+        description: |
+            Parses a docstring into YAML, defaulting to description
+
+            Single lines of prose, checked by :any:`Parser.prose`, are used as the description without
+            loading YAML at all. Everything else is loaded with :any:`Parser.loader`, except anything with
+            a !, which libyaml reads differently as a tag, like an empty string rather than None for "a: !",
+            so that's loaded with the pure Python loader.
+
+            Results are remembered in :any:`Parser.parses`, with a deep copy returned each time, so callers
+            are free to change what they get back.
+        return:
+            description: The parsed doctring
+        usage: |
+            If you just have a plain docstring, it'll return a dict
+            with that docstring as the description::
+
+                import sphinxter
+
+                def plain():
+                    \"""
+                    A plain function
+                    \"""
+
+                sphinxter.Parser.parse(plain.__doc__)
+                # {
+                #     "description": "A plain function"
+                # }
+
+            If you have straight YAML it's return that as is::
+
+                def exact():
+                    \"""
+                    description: An exact function
+                    \"""
+
+                sphinxter.Parser.parse(exact.__doc__)
+                # {
+                #     "description": "An exact function"
+                # }
+
+            If the string is blank, it'll return an empty dict::
+
+                sphinxter.Parser.parse("")
+                # {}
+        """
+
+        if not docstring:
+            return {}
+
+        parsed = cls.parses.get(docstring)
+
+        if parsed is None:
+
+            text = docstring.strip(" \t\r\n")
+
+            if cls.prose(text):
+                parsed = {"description": text}
+            else:
+                with Source.timed("yaml"):
+                    parsed = yaml.load(docstring, Loader=cls.loader if "!" not in docstring else yaml.SafeLoader)
+                if isinstance(parsed, str):
+                    parsed = {"description": parsed}
+                parsed = cls.intern(parsed)
+
+            cls.parses.set(docstring, parsed)
+
+        return copy.deepcopy(parsed)
+
+    @classmethod
+    def update(cls,
+        primary:dict,   # The parsed dict to update
+        secondary:dict, # The parsed dict to update with
+        skip=None       # What dict keys to skip for updating
+    ):
+        """
+        description: Updates an existing parsed dict with another, concatenating the descriptions
+        parameters:
+            skip:
+                type:
+                - None
+                - str
+                - list(str)
+        usage: |
+            This is used mainly to combine short and long descriptions::
+
+                import sphinxter
+
+                class Example:
+
+                    attribute = None # This is an attribute
+                    \"""
+                    description: It's one of my favorites
+                    type: str
+                    \"""
+
+                primary = {
+                    "description": "This is an attribute"
+                }
+
+                secondary = {
+                    "description": "It's one of my favorites",
+                    "type": "str"
+                }
+
+                sphinxter.Parser.update(primary, secondary)
+                primary
+                # {
+                #     "description": "This is an attribute\\n\\nIt's one of my favorites",
+                #     "type": "str"
+                # }
+
+            It's also used to inject __init___ into a class, but not overwriting what matters::
+
+                class Example:
+                    \"""
+                    An example class
+                    \"""
+
+                    def __init__(self,
+                        foo:str # The foo arg
+                    ):
+
+                        return True
+
+                primary = {
+                    "name": "Example",
+                    "description": "An example class"
+                }
+
+                secondary = {
+                    "name": "Example.__init__",
+                    "signature": "(foo: str)",
+                    "parameters": [
+                        {
+                            "name": "foo",
+                            "description": "The foo arg",
+                            "type": "str"
+                        }
+                    ]
+                }
+
+                sphinxter.Parser.update(primary, secondary, "name")
+                primary
+                # {
+                #     "name": "Example",
+                #     "description": "An example class",
+                #     "signature": "(foo: str)",
+                #     "parameters": [
+                #         {
+                #             "name": "foo",
+                #             "description": "The foo arg",
+                #             "type": "str"
+                #         }
+                #     ]
+                # }
+        """
+
+        if skip is None:
+            skip = []
+
+        if not isinstance(skip, list):
+            skip = [skip]
+
+        for name, value in secondary.items():
+
+            if name in skip:
+                continue
+
+            if name == "description" and "description" in primary:
+                primary[name] += "\n\n" + value
+            else:
+                primary[name] = value
+
+    @classmethod
+    def comments(cls,
+        resource # what to read the parameter comments from
+    )->dict:
+        """
+        description: Reads parameters comments from a function or method
+        return: dict of parsed comments, keyed by parameter
+        parameters:
+            resource:
+                type:
+                - function
+                - method
+        usage: |
+            You can put comments after parameters in a function or method and they
+            can be parsed as YAML, just like a docstring.
+
+            Say this code is in the test.example module::
+
+                def func(
+                    a:int,   # The a
+                    b:'str', # The b
+                    *args,   #
+                    **kwargs # a: 1
+                             # b: 2
+                ):
+                    pass
+
+            You can extra the comments like so::
+
+                import sphinxter
+                import test.example
+
+                sphinxter.Parser.comments(test.example.func)
+                # {
+                #     "a": {
+                #         "description": "The a"
+                #     },
+                #     "args": {},
+                #     "b": {
+                #         "description": "The b"
+                #     },
+                #     "kwargs": {
+                #         "a": 1,
+                #         "b": 2
+                #     }
+                # }
+        """
+
+        file = Source.file(resource)
+        start, end, _ = file.locate(resource)
+
+        return cls.remarks(resource.__name__, file.parameters(start, end))
+
+    @classmethod
+    def remarks(cls,
+        name:str,       # name of the function, for listeners
+        comments:dict   # comment text for each parameter, None if there's no comment
+    )->dict:
+        """
+        description: Parses parameters comments
+        return: dict of parsed comments, keyed by parameter
+        usage: |
+            Parameters without comments are still included::
+
+                import sphinxter
+
+                sphinxter.Parser.remarks("func", {"a": "The a", "b": None})
+                # {
+                #     "a": {
+                #         "description": "The a"
+                #     },
+                #     "b": {}
+                # }
+        """
+
+        parseds = {}
+
+        for param, comment in comments.items():
+            parseds[param] = {}
+            if comment is not None:
+                if Source.listeners:
+                    Source.emit("parameter", name, param)
+                parseds[param].update(cls.parse(comment))
+
+        return parseds
@@ -4,14 +4,18 @@ Module for reading documentation from resources
 
 # pylint: disable=too-many-branches, too-many-locals, too-few-public-methods
 
-import io
+import os
+import copy
 import ast
 import inspect
-import token
-import tokenize
-import yaml
 
-import logging
+from sphinxter.cache import Cache
+from sphinxter.source import Source
+from sphinxter.parser import Parser
+from sphinxter.parsed import Parsed
+from sphinxter.signatures import Signatures
+from sphinxter.registry import Registry
+from sphinxter.memory import Memory
 
 class Reader:
     """
@@ -19,389 +23,131 @@ class Reader:
     document: reader
     """
 
-    @staticmethod
-    def source(
-        resource # what to extract the source from
+    classes = Cache() # documentation of classes read, and the files read for them, keyed by class
+    """
+    type: Cache
+    description: |
+        Classes imported into other modules, like packages re-exporting them in __init__.py, are
+        read only once a run, with every reader getting its own copy of the documentation.
+    """
+
+    @classmethod
+    def reset(cls):
+        """
+        Clears everything cached, starting a new run
+        """
+
+        Source.files.clear()
+        Parser.parses.clear()
+        cls.classes.clear()
+        Registry.symbols.clear()
+        Signatures.annotated.clear()
+        Signatures.signatures.clear()
+
+    @classmethod
+    def prune(cls,
+        name:str=None   # name of a module that's been reloaded, None if just rereading files
     ):
         """
-        description: Reads the source, removing any overall indent
-        parameters:
-            resource:
-                type:
-                - module
-                - function
-                - class
-                - method
-        return:
-            description: The non-indented source
-            type: str
+        description: |
+            Drops what's cached that's out of date, like the functions and classes of a module that's been
+            reloaded, and files that have changed since they were read, so rereading over and over, like
+            when watching, doesn't keep everything ever read.
         usage: |
-            Consider the sub class in a test.example module::
+            ::
 
-                class Complex:
+                import sphinxter
+                import test.example
 
-                    class Subber:
-                        \"""
-                        Sub class
-                        \"""
+                sphinxter.Reader.reset()
+                sphinxter.Reader.routine(test.example.func).load()
 
-                        pass
+                sphinxter.Signatures.signatures.stats()["entries"]
+                # 1
 
-            The source for Subber would be indented from inspect.getsource()
-            which can't be parsed properly because of the initial indent::
+                sphinxter.Reader.prune("test.example")
 
-                import inspect
-                import test.example
+                sphinxter.Signatures.signatures.stats()["entries"]
+                # 0
+        """
 
-                inspect.getsource(test.example.Complex.Subber)
-                #     class Subber:
-                #         \"""
-                #         Sub class
-                #         \"""
-                #         pass
-                #
+        for key in list(Source.files.entries):
 
-            This prevents that problem::
+            try:
+                stat = os.stat(key[0])
+                current = (key[0], stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                current = (key[0], None, None)
 
-                import sphinxter
-                import test.example
+            if key != current:
+                del Source.files.entries[key]
 
-                sphinxter.Reader.source(test.example.Complex.Subber)
-                # class Subber:
-                #     \"""
-                #     Sub class
-                #     \"""
-                #     pass
-                #
-        """
+        if name is None:
+            return
 
-        indent = None
-        lines = []
+        for cache in [cls.classes, Signatures.annotated, Signatures.signatures]:
+            for key in list(cache.entries):
 
-        for line in inspect.getsourcelines(resource)[0]:
+                # signatures are keyed by routine and whether bound
 
-            if indent is None:
-                indent = 0
-                for letter in line:
-                    if letter in [' ', "\t"]:
-                        indent += 1
-                    else:
-                        break
+                resource = key[0] if isinstance(key, tuple) else key
 
-            lines.append(line[indent:])
+                if getattr(getattr(resource, "__func__", resource), "__module__", None) == name:
+                    del cache.entries[key]
+
+    @staticmethod
+    def source(
+        resource # what to extract the source from
+    )->str:
+        """
+        description: Reads the source, removing any overall indent, with :any:`Source.source`
+        """
 
-        return "".join(lines)
+        return Source.source(resource)
 
     @staticmethod
     def parse(
             docstring:str # the docstring (or string after an attribute)
         )->dict:
         """
-        description: Parses a docstring into YAML, defaulting to description
-        return:
-            description: The parsed doctring
-        usage: |
-            If you just have a plain docstring, it'll return a dict
-            with that docstring as the description::
-
-                import sphinxter
-
-                def plain():
-                    \"""
-                    A plain function
-                    \"""
-
-                sphinxter.Reader.parse(plain.__doc__)
-                # {
-                #     "description": "A plain function"
-                # }
-
-            If you have straight YAML it's return that as is::
-
-                def exact():
-                    \"""
-                    description: An exact function
-                    \"""
-
-                sphinxter.Reader.parse(exact.__doc__)
-                # {
-                #     "description": "An exact function"
-                # }
-
-            If the string is blank, it'll return an empty dict::
-
-                sphinxter.Reader.parse("")
-                # {}
+        description: Parses a docstring into YAML, defaulting to description, with :any:`Parser.parse`
         """
 
-        if docstring:
-            parsed = yaml.safe_load(docstring)
-            if isinstance(parsed, str):
-                parsed = {"description": parsed}
-        else:
-            parsed = {}
-
-        return parsed
+        return Parser.parse(docstring)
 
-    @classmethod
-    def update(cls,
+    @staticmethod
+    def update(
         primary:dict,   # The parsed dict to update
         secondary:dict, # The parsed dict to update with
         skip=None       # What dict keys to skip for updating
     ):
         """
-        description: Updates an existing parsed dict with another, concatenating the descriptions
-        parameters:
-            skip:
-                type:
-                - None
-                - str
-                - list(str)
-        usage: |
-            This is used mainly to combine short and long descriptions::
-
-                import sphinxter
-
-                class Example:
-
-                    attribute = None # This is an attribute
-                    \"""
-                    description: It's one of my favorites
-                    type: str
-                    \"""
-
-                primary = {
-                    "description": "This is an attribute"
-                }
-
-                secondary = {
-                    "description": "It's one of my favorites",
-                    "type": "str"
-                }
-
-                sphinxter.Reader.update(primary, secondary)
-                primary
-                # {
-                #     "description": "This is an attribute\\n\\nIt's one of my favorites",
-                #     "type": "str"
-                # }
-
-            It's also used to inject __init___ into a class, but not overwriting what matters::
-
-                class Example:
-                    \"""
-                    An example class
-                    \"""
-
-                    def __init__(self,
-                        foo:str # The foo arg
-                    ):
-
-                        return True
-
-                primary = {
-                    "name": "Example",
-                    "description": "An example class"
-                }
-
-                secondary = {
-                    "name": "Example.__init__",
-                    "signature": "(foo: str)",
-                    "parameters": [
-                        {
-                            "name": "foo",
-                            "description": "The foo arg",
-                            "type": "str"
-                        }
-                    ]
-                }
-
-                sphinxter.Reader.update(primary, secondary, "name")
-                primary
-                # {
-                #     "name": "Example",
-                #     "description": "An example class",
-                #     "signature": "(foo: str)",
-                #     "parameters": [
-                #         {
-                #             "name": "foo",
-                #             "description": "The foo arg",
-                #             "type": "str"
-                #         }
-                #     ]
-                # }
+        description: Updates an existing parsed dict with another, concatenating the descriptions, with :any:`Parser.update`
         """
 
-        if skip is None:
-            skip = []
+        Parser.update(primary, secondary, skip)
 
-        if not isinstance(skip, list):
-            skip = [skip]
-
-        for name, value in secondary.items():
-
-            if name in skip:
-                continue
-
-            if name == "description" and "description" in primary:
-                primary[name] += "\n\n" + value
-            else:
-                primary[name] = value
-
-    @classmethod
-    def comments(cls,
+    @staticmethod
+    def comments(
         resource # what to read the parameter comments from
     )->dict:
         """
-        description: Reads parameters comments from a function or method
+        description: Reads parameters comments from a function or method, with :any:`Parser.comments`
         return: dict of parsed comments, keyed by parameter
-        parameters:
-            resource:
-                type:
-                - function
-                - method
-        usage: |
-            You can put comments after parameters in a function or method and they
-            can be parsed as YAML, just like a docstring.
-
-            Say this code is in the test.example module::
-
-                def func(
-                    a:int,   # The a
-                    b:'str', # The b
-                    *args,   #
-                    **kwargs # a: 1
-                             # b: 2
-                ):
-                    pass
-
-            You can extra the comments like so::
-
-                import sphinxter
-                import test.example
-
-                sphinxter.Reader.comments(test.example.func)
-                # {
-                #     "a": {
-                #         "description": "The a"
-                #     },
-                #     "args": {},
-                #     "b": {
-                #         "description": "The b"
-                #     },
-                #     "kwargs": {
-                #         "a": 1,
-                #         "b": 2
-                #     }
-                # }
         """
 
-        parens = 0
-        param = None
-        params = False
-        name = False
-        comments = {}
-        parseds = {}
-
-        source = io.StringIO(cls.source(resource))
-
-        for parsed in tokenize.generate_tokens(source.readline):
-            if parsed.type == token.OP:
-                if parsed.string == '(':
-                    if parens == 0:
-                        params = True
-                        name = True
-                    parens += 1
-                elif parsed.string == ')':
-                    parens -= 1
-                    if parens == 0:
-                        break
-            elif parsed.type == token.NL:
-                name = True
-            elif parsed.type == token.NAME and name:
-                if params:
-                    param = parsed.string
-                    parseds[param] = {}
-                    name = False
-            elif parsed.type == token.COMMENT:
-                if param is not None:
-                    comment = parsed.string[2:].rstrip()
-                    if not comment:
-                        continue
-                    if param not in comments:
-                        comments[param] = comment
-                    else:
-                        comments[param] = f"{comments[param]}\n{comment}"
-
-        for param, comment in comments.items():
-            logging.info("%s parameter: %s", resource.__name__, param)
-            parseds[param].update(cls.parse(comment))
-
-        return parseds
+        return Parser.comments(resource)
 
     @staticmethod
     def annotations(
         resource # what to extract annotations from
     )->dict:
         """
-        description: Read annotations in a format better for updating
-        parameters:
-            resource:
-                type:
-                - function
-                - method
+        description: Read annotations in a format better for updating, with :any:`Signatures.annotations`
         return: dict of annotations, with parameters and return keys
-        usage: |
-            You can use regular annotations and they can be extracted to
-            update information about parameters and functions/methods
-            themelves.
-
-            Say this code is in the test.example module::
-
-                def func(
-                    a:int,   # The a
-                    b:'str', # The b
-                    *args,   #
-                    **kwargs # a: 1
-                             # b: 2
-                ):
-                    pass
-
-            You can extra the annotations like so::
-
-                import sphinxter
-                import test.example
-
-                sphinxter.Reader.annotations(test.example.func)
-                # {
-                #     "parameters": {
-                #         "a": {
-                #             "type": "int"
-                #         },
-                #         "b": {
-                #             "type": "str"
-                #         }
-                #     },
-                #     "return": {}
-                # }
         """
 
-        parseds = {
-            "parameters": {},
-            "return": {}
-        }
-
-        for name, annotation in inspect.get_annotations(resource).items():
-
-            if not isinstance(annotation, str):
-                annotation = annotation.__name__
-
-            if name == "return":
-                parseds["return"] = {"type": annotation}
-            else:
-                parseds["parameters"][name] = {"type": annotation}
-
-        return parseds
+        return Signatures.annotations(resource)
 
     @classmethod
     def routine(cls,
@@ -705,35 +451,54 @@ class Reader:
                 # }
         """
 
-        logging.info("routine: %s", resource.__name__)
+        if Source.listeners:
+            Source.emit("routine", resource.__name__)
 
         if isinstance(resource, staticmethod):
             kind = "staticmethod"
-            signature = inspect.signature(resource)
-            annotations = cls.annotations(resource)
         elif isinstance(resource, classmethod):
             kind = "classmethod"
-            signature = inspect.signature(resource.__func__)
-            annotations = cls.annotations(resource.__func__)
         else:
             kind = "method"
-            signature = inspect.signature(resource)
-            annotations = cls.annotations(resource)
 
-        if method and not isinstance(resource, (staticmethod)):
-            signature = signature.replace(parameters=list(signature.parameters.values())[1:])
+        def load():
+
+            function = resource.__func__ if isinstance(resource, (classmethod, staticmethod)) else resource
+
+            with Source.timing("module", function.__module__, lazy=True), \
+                 Source.timing("method" if method else "function", Registry.symbol(function)):
+                names, signature = Signatures.signature(resource, bound=method and not isinstance(resource, staticmethod))
+                annotations = Signatures.annotations(resource.__func__ if isinstance(resource, classmethod) else resource)
+
+                parsed = {
+                    "name": resource.__name__,
+                    "signature": signature
+                }
 
-        parsed = {
-            "name": resource.__name__,
-            "signature": str(signature)
-        }
+                parsed["kind"] = kind if method else "function"
 
-        parsed["kind"] = kind if method else "function"
+                return cls.combine(parsed, names, Parser.comments(resource), annotations, resource.__doc__)
+
+        return Parsed({"name": resource.__name__, "kind": kind if method else "function"}, load)
+
+    @classmethod
+    def combine(cls,
+        parsed:dict,        # the parsed dict of the routine to update
+        names:list,         # names of the parameters, in order
+        comments:dict,      # parsed comments, keyed by parameter
+        annotations:dict,   # annotations, with parameters and return keys
+        docstring:str       # docstring of the routine
+    )->dict:
+        """
+        description: |
+            Combines parameter comments, annotations, and the docstring of a routine into
+            its parsed dict, the way :any:`Reader.routine` describes.
+        return: The updated parsed dict
+        """
 
         lookup = {}
-        comments = cls.comments(resource)
 
-        for name in signature.parameters:
+        for name in names:
 
             parsed.setdefault("parameters", [])
 
@@ -747,7 +512,7 @@ class Reader:
             parsed["parameters"].append(parameter)
             lookup[name] = parameter
 
-        for parsed_name, parsed_value in cls.parse(resource.__doc__).items():
+        for parsed_name, parsed_value in Parser.parse(docstring).items():
             if parsed_name == "parameters":
                 for parameter_name, parameter_value in parsed_value.items():
                     parameter_parsed = {"description": parameter_value} if isinstance(parameter_value, str) else parameter_value
@@ -854,40 +619,52 @@ class Reader:
                 # }
         """
 
-        parseds = {}
-        targets = []
+        file = Source.file(resource)
+        _, _, nodes = file.locate(resource)
 
-        nodes = ast.parse(cls.source(resource))
+        return cls.assignments(file, nodes)
+
+    @classmethod
+    def assignments(cls,
+        file:'Source.File', # file the nodes are from
+        nodes:ast.AST       # module or class node to read the attributes of
+    )->dict:
+        """
+        description: Reads attributes from the body of a module or class node, the way :any:`Reader.attributes` describes
+        return: dict of parsed attributes, keyed by name
+        """
 
-        if inspect.isclass(resource):
-            nodes = nodes.body[0]
+        parseds = {}
+        targets = []
 
         for node in nodes.body:
 
             if targets and isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
 
-                logging.info("attribute docstring: %s", '-'.join(targets))
+                if Source.listeners:
+                    Source.emit("attribute", "docstring", '-'.join(targets))
 
-                parsed = cls.parse(node.value.value)
+                parsed = Parser.parse(node.value.value)
                 for target in targets:
-                    cls.update(parseds[target], parsed)
+                    Parser.update(parseds[target], parsed)
 
             elif isinstance(node, ast.Assign):
 
-                targets = [target.id for target in node.targets]
+                # only names, not unpacking or setting attributes of something else
+
+                targets = [target.id for target in node.targets if isinstance(target, ast.Name)]
 
                 for target in targets:
                     parseds.setdefault(target, {})
 
-                source = io.StringIO(inspect.getsourcelines(resource)[0][node.end_lineno - 1][node.end_col_offset + 1:])
+                comment = file.remark(node.end_lineno)
 
-                for tokenized in tokenize.generate_tokens(source.readline):
-                    if tokenized.type == token.COMMENT:
-                        comment = tokenized.string[2:].rstrip()
-                        logging.info("attribute comment: %s", '-'.join(targets))
-                        parsed = cls.parse(comment)
-                        for target in targets:
-                            parseds[target] = parsed
+                if comment is not None:
+                    if Source.listeners:
+                        Source.emit("attribute", "comment", '-'.join(targets))
+                    parsed = Parser.parse(comment)
+                    for target in targets:
+                        parseds[target] = parsed
 
             else:
 
@@ -900,7 +677,11 @@ class Reader:
         resource # what to extract documentation from
     )->dict:
         """
-        description: Reads all the documentation from a class for :any:`Writer.cls`
+        description: |
+            Reads all the documentation from a class for :any:`Writer.cls`
+
+            Only attributes assigned in the class body, along with any __slots__, are documented, not
+            others in its __dict__, like _abc_impl added by ABCMeta or anything set on it afterwards.
         parameters:
             resource:
                 type: class
@@ -1223,53 +1004,124 @@ class Reader:
                 #     "methods": [],
                 #     "name": "Basic"
                 # }
+
+            Each class is only read once a run, however many modules import it, but every call gets its own copy::
+
+                parsed = sphinxter.Reader.cls(test.example.Basic)
+                parsed["name"] = "Changed"
+
+                sphinxter.Reader.cls(test.example.Basic)["name"]
+                # 'Basic'
         """
 
-        logging.info("class: %s", resource.__name__)
+        memo = cls.classes.get(resource)
 
-        parsed = {
-            "name": resource.__name__,
-            "kind": "exception" if Exception in resource.__bases__ else "class",
-            "attributes": [],
-            "methods": [],
-            "classes": [],
-            "exceptions": []
-        }
+        if memo is None:
 
-        parsed.update(cls.parse(resource.__doc__))
+            if Source.listeners:
+                Source.emit("class", resource.__name__)
 
-        if "__init__" in resource.__dict__:
-            cls.update(parsed, cls.routine(resource.__init__, method=True), skip=["name", "kind"])
+            files = set()
 
-        attributes = cls.attributes(resource)
+            def load():
 
-        for name, attr in {name: inspect.getattr_static(resource, name) for name in sorted(resource.__dict__.keys())}.items():
+                # track the files read for this class, even if not storing, in case a stored module imports it later
 
-            if (inspect.isfunction(attr) or isinstance(attr, (staticmethod, classmethod))):
+                loaded = Source.loaded
+                Source.loaded = set()
 
-                if name != "__init__":
-                    parsed["methods"].append(cls.routine(attr, method=True))
+                try:
 
-            elif inspect.isclass(attr):
+                    with Source.timing("module", resource.__module__, lazy=True), Source.timing("class", Registry.symbol(resource)):
+                        parsed = {
+                            "name": resource.__name__,
+                            "kind": "exception" if Exception in resource.__bases__ else "class",
+                            "attributes": [],
+                            "methods": [],
+                            "classes": [],
+                            "exceptions": []
+                        }
 
-                cls_parsed = cls.cls(attr)
+                        parsed.update(Parser.parse(resource.__doc__))
 
-                if cls_parsed["kind"] == "exception":
-                    parsed["exceptions"].append(cls_parsed)
-                else:
-                    parsed["classes"].append(cls_parsed)
+                        if "__init__" in resource.__dict__:
+                            Parser.update(parsed, cls.routine(resource.__init__, method=True), skip=["name", "kind"])
 
-            elif name in resource.__dict__ and not name.startswith('__') and not name.endswith('__'):
+                        attributes = cls.attributes(resource)
 
-                attribute = {
-                    "name": name
-                }
+                        members = {name: inspect.getattr_static(resource, name) for name in sorted(resource.__dict__.keys())}
 
-                cls.update(attribute, attributes[name])
+                        for name, attr in members.items():
 
-                parsed["attributes"].append(attribute)
+                            if (inspect.isfunction(attr) or isinstance(attr, (staticmethod, classmethod))):
 
-        return parsed
+                                if name != "__init__":
+                                    parsed["methods"].append(cls.routine(attr, method=True).load())
+
+                            elif inspect.isclass(attr):
+
+                                cls_parsed = cls.cls(attr).load()
+
+                                if cls_parsed["kind"] == "exception":
+                                    parsed["exceptions"].append(cls_parsed)
+                                else:
+                                    parsed["classes"].append(cls_parsed)
+
+                            elif inspect.ismemberdescriptor(attr):
+
+                                # __slots__, described if a dict
+
+                                slots = resource.__dict__.get("__slots__")
+
+                                attribute = {
+                                    "name": name
+                                }
+
+                                Parser.update(attribute, Parser.parse(slots.get(name) if isinstance(slots, dict) else None))
+
+                                parsed["attributes"].append(attribute)
+
+                            elif name in attributes and not name.startswith('__') and not name.endswith('__'):
+
+                                # only what's assigned in the source, not what's added like _abc_impl by ABCMeta
+
+                                attribute = {
+                                    "name": name
+                                }
+
+                                Parser.update(attribute, attributes[name])
+
+                                parsed["attributes"].append(attribute)
+
+                finally:
+
+                    files.update(Source.loaded)
+                    Source.loaded = loaded
+
+                if loaded is not None:
+                    loaded.update(files)
+
+                return parsed
+
+            memo = (
+                Parsed({
+                    "name": resource.__name__,
+                    "kind": "exception" if Exception in resource.__bases__ else "class"
+                }, load),
+                files
+            )
+
+            cls.classes.set(resource, memo)
+
+        parsed, files = memo
+
+        # if storing, the files read for this class are needed now
+
+        if Source.loaded is not None:
+            parsed.load()
+            Source.loaded.update(files)
+
+        return copy.deepcopy(parsed)
 
     @classmethod
     def module(cls,
@@ -1708,43 +1560,173 @@ class Reader:
                 # }
         """
 
-        logging.info("module: %s", resource.__name__)
+        key = Memory.key(resource.__name__, inspect.getsourcefile(resource)) if Memory.store is not None else None
+
+        with Source.timing("module", resource.__name__):
+
+            parsed = Memory.recall(resource.__name__, key)
+
+            if parsed is not None:
+                return parsed
+
+            with Memory.loading(key):
+                parsed = cls.gather(cls.walk(resource))
+                Memory.remember(resource.__name__, key, parsed)
+
+        return parsed
+
+    @classmethod
+    def walk(cls,
+        resource # module to read
+    ):
+        """
+        description: |
+            Reads a module one resource at a time, the module itself first, then its functions, classes, and
+            exceptions, each as it's read, the same order :any:`Sphinxter.read` adds them to documents. The
+            module's documentation doesn't hold on to them, so each can be dropped as soon as it's been used.
+
+            What's kept in :any:`Memory.store` is a whole module, so it's not used here, but :any:`Reader.module`
+            puts what's walked together to store it.
+        parameters:
+            resource:
+                type: module
+        return:
+            description: Iterator of the module's name, the kind of resource, and the resource's documentation
+            type: Iterator[tuple]
+        usage: |
+            ::
+
+                import sphinxter
+                import test.example
 
-        parsed = {
-            "name": resource.__name__,
-            "attributes": [],
-            "functions": [],
-            "classes": [],
-            "exceptions": []
-        }
+                [(module, kind, parsed["name"]) for module, kind, parsed in sphinxter.Reader.walk(test.example)]
+                # [
+                #     ('test.example', 'module', 'test.example'),
+                #     ('test.example', 'function', 'func'),
+                #     ('test.example', 'class', 'Complex'),
+                #     ('test.example', 'exception', 'Basic')
+                # ]
+        """
 
-        parsed.update(cls.parse(resource.__doc__))
+        if Source.listeners:
+            Source.emit("module", resource.__name__)
 
-        attributes = cls.attributes(resource)
+        with Source.timing("module", resource.__name__):
 
-        for name, attr in {name: inspect.getattr_static(resource, name) for name in dir(resource)}.items():
+            parsed = {
+                "name": resource.__name__,
+                "attributes": []
+            }
 
-            if inspect.isfunction(attr):
+            if Registry.owners is not None:
+                parsed["references"] = []
 
-                parsed["functions"].append(cls.routine(attr))
+            parsed.update(Parser.parse(resource.__doc__))
 
-            elif inspect.isclass(attr):
+            attributes = cls.attributes(resource)
+            members = {"function": [], "class": [], "exception": []}
 
-                cls_parsed = cls.cls(attr)
+            for name, attr in {name: inspect.getattr_static(resource, name) for name in dir(resource)}.items():
 
-                if cls_parsed["kind"] == "exception":
-                    parsed["exceptions"].append(cls_parsed)
-                else:
-                    parsed["classes"].append(cls_parsed)
+                if Registry.owners is not None and (inspect.isfunction(attr) or inspect.isclass(attr)):
 
-            elif name in attributes:
+                    if not Registry.owned(resource.__name__, attr):
+                        continue
 
-                attribute = {
-                    "name": name
-                }
+                    symbol = Registry.symbol(attr)
+
+                    # imported from another module that's being read, so it's documented there
 
-                cls.update(attribute, attributes[name])
+                    reading = Registry.reading if Registry.reading is not None else [attr.__module__]
 
-                parsed["attributes"].append(attribute)
+                    if attr.__module__ != resource.__name__ and attr.__module__ in reading:
+                        reference = symbol
+                    else:
+                        reference = Registry.symbols.get(symbol)
+
+                    if reference is not None:
+                        parsed["references"].append({
+                            "name": name,
+                            "kind": "function" if inspect.isfunction(attr) else "exception" if Exception in attr.__bases__ else "class",
+                            "reference": reference
+                        })
+                        continue
+
+                    Registry.symbols.set(symbol, f"{resource.__name__}.{name}")
+
+                if inspect.isfunction(attr):
+
+                    members["function"].append(attr)
+
+                elif inspect.isclass(attr):
+
+                    members["exception" if Exception in attr.__bases__ else "class"].append(attr)
+
+                elif name in attributes:
+
+                    attribute = {
+                        "name": name
+                    }
+
+                    Parser.update(attribute, attributes[name])
+
+                    parsed["attributes"].append(attribute)
+
+        yield resource.__name__, "module", parsed
+
+        for kind, resources in members.items():
+
+            # dropping each as it's read
+
+            resources.reverse()
+
+            while resources:
+                attr = resources.pop()
+                yield resource.__name__, kind, cls.routine(attr) if kind == "function" else cls.cls(attr)
+
+    @staticmethod
+    def gather(
+        records # module name, kind, and documentation of a module's resources, module first, like :any:`Reader.walk` yields
+    )->dict:
+        """
+        description: Puts a module's records back together into its documentation, like :any:`Reader.module` returns
+        return: documentation of the module
+        """
+
+        records = iter(records)
+        _, _, parsed = next(records)
+
+        plurals = {"function": "functions", "class": "classes", "exception": "exceptions"}
+
+        for plural in plurals.values():
+            parsed[plural] = []
+
+        for _, kind, resource in records:
+            parsed[plurals[kind]].append(resource)
 
         return parsed
+
+    @staticmethod
+    def records(
+        parsed:dict # documentation of a module, which is taken apart
+    ):
+        """
+        description: |
+            Takes a module's documentation apart into records, like :any:`Reader.walk` yields. The module's
+            record no longer has its functions, classes, or exceptions, as they're their own records.
+        return:
+            description: Iterator of the module's name, the kind of resource, and the resource's documentation
+            type: Iterator[tuple]
+        """
+
+        plurals = [("function", "functions"), ("class", "classes"), ("exception", "exceptions")]
+        members = [(kind, parsed.pop(plural, [])) for kind, plural in plurals]
+
+        yield parsed["name"], "module", parsed
+
+        for kind, resources in members:
+
+            resources.reverse()
+
+            while resources:
+                yield parsed["name"], kind, resources.pop()
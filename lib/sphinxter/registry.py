@@ -0,0 +1,141 @@
+"""
+Module for registering where functions and classes are documented
+"""
+
+from sphinxter.cache import Cache
+
+class Registry:
+    """
+    description: Static class for keeping track of where functions and classes are documented
+    document: registry
+    """
+
+    owners = None   # names of packages whose functions and classes to read, None to read everything
+    """
+    type:
+    - None
+    - list[str]
+    description: |
+        When set, :any:`Reader.module` only reads functions and classes defined in the module itself or in one
+        of these packages, skipping anything imported from the standard library or third parties.
+
+        Each function and class is documented in the module that defines it, going by its __module__, and
+        just referenced in any other module importing it, like a package re-exporting it. If the module that
+        defines it isn't in :any:`Registry.reading`, it's documented in the first module read that has it
+        instead, and registered in :any:`Registry.symbols` so any others just reference it there.
+    """
+
+    reading = None  # names of the modules being read this run, None if every module is
+    """
+    type:
+    - None
+    - list[str]
+    description: |
+        Only matters with :any:`Registry.owners` set, to tell whether what's imported from another module
+        will be documented there. :any:`Sphinxter` sets it to everything it's reading that isn't static.
+    """
+
+    symbols = Cache() # where functions and classes have been documented, keyed by where they're defined
+
+    @classmethod
+    def owned(cls,
+        module:str, # name of the module being read
+        resource    # function or class found in it
+    )->bool:
+        """
+        description: |
+            Whether a function or class belongs to the module being read, or any of :any:`Registry.owners`,
+            going by its __module__. Everything belongs if owners isn't set.
+        """
+
+        if cls.owners is None:
+            return True
+
+        owner = getattr(resource, "__module__", None) or ""
+
+        return owner == module or any(owner == package or owner.startswith(f"{package}.") for package in cls.owners or [])
+
+    @staticmethod
+    def symbol(
+        resource # function or class
+    )->str:
+        """
+        description: Full name of where a function or class is defined, for registering it in :any:`Registry.symbols`
+        usage: |
+            ::
+
+                import sphinxter
+
+                sphinxter.Registry.symbol(sphinxter.Reader)
+                # 'sphinxter.reader.Reader'
+        """
+
+        return f"{resource.__module__}.{resource.__qualname__}"
+
+    @classmethod
+    def documented(cls,
+        module:str  # name of the module
+    )->dict:
+        """
+        description: What's been documented in a module, from :any:`Registry.symbols`, for :any:`Registry.link` to register elsewhere
+        return: where each function and class is documented, keyed by where it's defined
+        usage: |
+            ::
+
+                import sphinxter
+
+                sphinxter.Registry.symbols.set("sphinxter.reader.Reader", "sphinxter.Reader")
+
+                sphinxter.Registry.documented("sphinxter")
+                # {
+                #     "sphinxter.reader.Reader": "sphinxter.Reader"
+                # }
+        """
+
+        return {symbol: where for symbol, where in cls.symbols.entries.items() if where.rsplit(".", 1)[0] == module}
+
+    @classmethod
+    def link(cls,
+        parsed:dict,    # documentation of a module, read with :any:`Registry.owners` set
+        symbols:dict    # where functions and classes were documented reading it, keyed by where they're defined
+    )->dict:
+        """
+        description: |
+            Registers the functions and classes of a module's documentation read elsewhere, like in another
+            process or a previous run, turning those already documented this run into references, just as
+            if :any:`Reader.module` had read it here. What was documented where comes along separately, like
+            from :any:`Registry.documented` in the process that read it.
+        return: the module's documentation, changed in place
+        """
+
+        defined = {where: symbol for symbol, where in symbols.items()}
+
+        if not defined:
+            return parsed
+
+        for kind, plural in [("function", "functions"), ("class", "classes"), ("exception", "exceptions")]:
+
+            resources = []
+
+            for resource in parsed[plural]:
+
+                where = f"{parsed['name']}.{resource['name']}"
+                symbol = defined.get(where)
+                reference = cls.symbols.get(symbol) if symbol is not None else None
+
+                if reference is None or reference == where:
+                    if symbol is not None:
+                        cls.symbols.set(symbol, where)
+                    resources.append(resource)
+                else:
+                    parsed["references"].append({
+                        "name": resource["name"],
+                        "kind": kind,
+                        "reference": reference
+                    })
+
+            parsed[plural] = resources
+
+        parsed["references"].sort(key=lambda reference: reference["name"])
+
+        return parsed
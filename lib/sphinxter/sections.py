@@ -0,0 +1,1091 @@
+"""
+Module for writing out the sections of documents
+"""
+
+class Sections:
+    """
+    description: |
+        Base class for writing out the sections of each resource's documentation, and the lines
+        they're made of, that :any:`Writer` builds its documents from
+    document: sections
+    """
+
+    document = None # document object to write out
+    file = None     # file handle to write out to
+    buffer = None   # text to write out once the whole document's done, None if writing as it goes
+    indents = None  # indent prefixes, by how many times indented
+
+    plans = {
+        "module": ["description", "usage", "attributes", "references"],
+        "function": ["description", "routine", "usage"],
+        "method": ["description", "routine", "usage"],
+        "class": ["description", "definition", "routine", "usage", "attributes", "methods", "classes", "exceptions"],
+        "attribute": ["type", "description"]
+    }
+    """
+    type: dict
+    description: |
+        Sections to write for each kind of resource, in order, after its directive. Each section is
+        written by a method of the same name, unless there's a custom one in :any:`Sections.emitters`.
+        Classes and exceptions both use the class plan, as all kinds of methods use the method plan.
+    """
+
+    emitters = {}   # custom sections, functions taking the writer, parsed documentation, and indent, keyed by section
+    compiled = {}   # what writes each section of each kind, compiled from the plans, keyed by Writer class and kind
+    """
+    type: dict
+    description: |
+        Compiled once for each kind, the first time it's written by each class, so a subclass overriding
+        the methods writing sections gets its own.
+    """
+
+    def __init__(self,
+        document:'sphinxter.Document',  # document object to write out
+        file                            # file handle like object to write to
+    ):
+        """
+        usage: |
+            To add a section of your own, give it a function to write it, and add it to the plans it's
+            part of::
+
+                import io
+                import unittest.mock
+                import sphinxter
+
+                def examples(writer, parsed, indent):
+                    if "examples" not in parsed:
+                        return
+                    writer.line("**Examples**", indent, before=True, after=True)
+                    for example in parsed["examples"]:
+                        writer.line(f"* {example}", indent)
+
+                with unittest.mock.patch.multiple(
+                    sphinxter.Writer,
+                    emitters={"examples": examples},
+                    plans=dict(sphinxter.Writer.plans, function=["description", "examples"]),
+                    compiled={}
+                ):
+
+                    document = sphinxter.Document(None, "test.example", None, '    ')
+                    handle = io.StringIO()
+
+                    sphinxter.Writer(document, handle).function({
+                        "name": "func",
+                        "signature": "()",
+                        "description": "A func",
+                        "examples": ["func()"]
+                    })
+
+                handle.getvalue()
+                #
+                # .. function:: func()
+                #
+                #     A func
+                #
+                #     **Examples**
+                #
+                #     * func()
+                #
+
+            Like the sections already there, a custom section does nothing if there's nothing for it.
+
+            Plans are compiled into :any:`Sections.compiled` the first time each kind's written, so change
+            them beforehand, like when importing, or clear it after.
+        """
+
+        self.document = document
+        self.file = file
+        self.indents = []
+
+    def prefix(self,
+        indent:int  # How many times to indent
+    )->str:
+        """
+        description: The indent prefix, built once for each depth
+        usage: |
+            ::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '  ')
+                writer = sphinxter.Writer(document, io.StringIO())
+
+                writer.prefix(2)
+                # '    '
+        """
+
+        while len(self.indents) <= indent:
+            self.indents.append(self.document.indent * len(self.indents))
+
+        return self.indents[indent]
+
+    def write(self,
+        text:str    # Text to write out
+    ):
+        """
+        description: |
+            Writes text to the buffer, if writing a whole document with :any:`Writer.dump`, or else
+            straight to the filehandle
+        """
+
+        if self.buffer is not None:
+            self.buffer.append(text)
+        else:
+            self.file.write(text)
+
+    def line(self,
+        line:str='',        # Text to write out
+        indent:int=0,       # How many times to indent
+        before:bool=False,  # Whether to put a blankline before
+        after:bool=False    # Whether to put a blankline after
+    ):
+        """
+        description: Writes a line of text to the filehandle
+        usage: |
+            This can just write a line of text::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                writer.line("Hello, world!")
+                handle.getvalue()
+                # Hello, world!
+                #
+
+            It can indent::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                writer.line("Hello, world!", indent=1)
+                handle.getvalue()
+                #     Hello, world!
+                #
+
+            And it can add lines (with no indent) before and after::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                writer.line("Hello, world!", indent=1, before=True, after=True)
+                handle.getvalue()
+                #
+                #     Hello, world!
+                #
+                #
+        """
+
+        text = f"{(self.prefix(indent) + line).rstrip()}\n"
+
+        if before:
+            text = f"\n{text}"
+
+        if after:
+            text = f"{text}\n"
+
+        self.write(text)
+
+    def lines(self,
+        lines:str,          # Multil\ine text to write out
+        indent:int  ,       # How many times to indent
+        before:bool=False,  # Whether to put a blankline before
+        after:bool=False    # Whether to put a blankline after
+    ):
+        """
+        description: Writes lines of text to the filehandle
+        usage: |
+            This can just write lines of text::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                writer.lines("Hello\\nworld!", indent=0)
+                handle.getvalue()
+                # Hello
+                # world!
+                #
+
+            It can indent::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                writer.lines("Hello\\nworld!", indent=1)
+                handle.getvalue()
+                #     Hello
+                #     world!
+                #
+
+            And it can add lines (with no indent) before and after::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                writer.lines("Hello\\nworld!", indent=1, before=True, after=True)
+                handle.getvalue()
+                #
+                #     Hello
+                #     world!
+                #
+                #
+        """
+
+        prefix = self.prefix(indent)
+
+        text = "".join(f"{(prefix + line).rstrip()}\n" for line in lines.split("\n"))
+
+        if before:
+            text = f"\n{text}"
+
+        if after:
+            text = f"{text}\n"
+
+        self.write(text)
+
+    @staticmethod
+    def types(
+        types:'str or list' # Type(s) to write out
+    ):
+        """
+        description: Takes a str of type or list of str of type and returns a str
+        usage: |
+            If just a single type, it returns that::
+
+                import sphinxter
+
+                sphinxter.Sections.types("str")
+                # "str"
+
+            If a list of types, return types, concatenated with ' or '::
+
+                sphinxter.Sections.types(["str", "list"])
+                # "str or list"
+        """
+
+        if not isinstance(types, list):
+            types = [types]
+
+        return " or ".join(types)
+
+    def plan(self,
+        kind:str    # kind of resource, one of the keys of :any:`Sections.plans`
+    )->list:
+        """
+        description: |
+            What writes each section for a kind of resource, compiled from :any:`Sections.plans` the first
+            time, a custom section from :any:`Sections.emitters` or else the method of the same name
+        return: list of functions, each taking the writer, parsed documentation, and indent
+        usage: |
+            ::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                writer = sphinxter.Writer(document, io.StringIO())
+
+                [emitter.__name__ for emitter in writer.plan("attribute")]
+                # [
+                #     "type",
+                #     "description"
+                # ]
+        """
+
+        plan = self.compiled.get((type(self), kind))
+
+        if plan is None:
+            plan = self.compiled[(type(self), kind)] = [
+                self.emitters.get(section) or getattr(type(self), section) for section in self.plans[kind]
+            ]
+
+        return plan
+
+    def render(self,
+        kind:str,       # kind of resource, one of the keys of :any:`Sections.plans`
+        parsed:dict,    # parsed documentation
+        indent:int      # amount to indent by
+    ):
+        """
+        description: |
+            Writes each section planned for a kind of resource, each only writing if there's
+            documentation for it
+        usage: |
+            ::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                writer.render("attribute", {"name": "big", "description": "stuff", "type": "int"}, 1)
+                handle.getvalue()
+                #     :type: int
+                #
+                #     stuff
+                #
+        """
+
+        for emitter in self.plan(kind):
+            emitter(self, parsed, indent)
+
+    def description(self,
+        parsed:dict,    # parsed documentation
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes description if present, preceeding with a blank line
+        usage: |
+
+            If there's a description in the documentation, it writes it out with a preceeding blank line::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "description": "It is what it is"
+                }
+
+                writer.description(parsed, indent=1)
+                handle.getvalue()
+                #
+                #     It is what it is
+                #
+
+            If there's no description, it does nothing::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {}
+
+                writer.description(parsed, indent=1)
+                handle.getvalue()
+                #
+        """
+
+        if "description" not in parsed:
+            return
+
+        self.lines(parsed["description"].rstrip(), indent, before=True)
+
+    def parameter(self,
+        parsed:dict,    # parsed documentation for a parameter
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes parameter documentation
+        usage: |
+
+            If there's only a name::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "name": "arg"
+                }
+
+                writer.parameter(parsed, indent=1)
+                handle.getvalue()
+                #     :param arg: arg
+                #
+
+            If there's also a description::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "name": "arg",
+                    "description": "an argument"
+                }
+
+                writer.parameter(parsed, indent=1)
+                handle.getvalue()
+                #     :param arg: an argument
+                #
+
+            If there's also a type::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "name": "arg",
+                    "description": "an argument",
+                    "type": "bool"
+                }
+
+                writer.parameter(parsed, indent=1)
+                handle.getvalue()
+                #     :param arg: an argument
+                #     :type arg: bool
+                #
+        """
+
+        if "description" in parsed:
+            self.line(f":param {parsed['name']}: {parsed['description']}", indent)
+        else:
+            self.line(f":param {parsed['name']}: {parsed['name']}", indent)
+
+        if "type" in parsed:
+            self.line(f":type {parsed['name']}: {self.types(parsed['type'])}", indent)
+
+    def parameters(self,
+        parsed:dict,    # parsed documentation possibly keyed by parameters
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes parameters if present
+        usage: |
+            If parameters are present, write them::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "parameters": [
+                        {
+                            "name": "small"
+                        },
+                        {
+                            "name": "big",
+                            "description": "stuff",
+                            "type": "int"
+                        }
+                    ]
+                }
+
+                writer.parameters(parsed, 1)
+                handle.getvalue()
+                #     :param small: small
+                #     :param big: stuff
+                #     :type big: int
+                #
+
+            If not, do nothing::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {}
+
+                writer.parameters(parsed, 1)
+                handle.getvalue()
+                #
+        """
+
+        if "parameters" not in parsed:
+            return
+
+        for parameter in parsed["parameters"]:
+            self.parameter(parameter, indent)
+
+    def returns(self,
+        parsed:dict,    # parsed documentation possibly keyed by return
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes return information if present
+        usage: |
+            If there's a description::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "return": {
+                        "description": "stuff"
+                    }
+                }
+
+                writer.returns(parsed, 1)
+                handle.getvalue()
+                #     :return: stuff
+                #
+
+            If there's also a type::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "return": {
+                        "description": "stuff",
+                        "type": "int"
+                    }
+                }
+
+                writer.returns(parsed, 1)
+                handle.getvalue()
+                #     :return: stuff
+                #     :rtype: int
+                #
+
+            If there's only a type::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "return": {
+                        "type": "int"
+                    }
+                }
+
+                writer.returns(parsed, 1)
+                handle.getvalue()
+                #     :rtype: int
+                #
+
+            If there's nothing, do nothing::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {}
+
+                writer.returns(parsed, 1)
+                handle.getvalue()
+                #
+        """
+
+        if "return" not in parsed:
+            return
+
+        if "description" in parsed['return']:
+            self.line(f":return: {parsed['return']['description']}", indent)
+
+        if "type" in parsed['return']:
+            self.line(f":rtype: {self.types(parsed['return']['type'])}", indent)
+
+    def raises(self,
+        parsed:dict,    # parsed documentation possibly keyed by raises
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes raises information if present
+        usage: |
+            If there's raises, write them (alphabetically)::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "raises": {
+                        "Exception": "whoops",
+                        "Error": "oh no"
+                    }
+                }
+
+                writer.raises(parsed, 1)
+                handle.getvalue()
+                #     :raises Error: oh no
+                #     :raises Exception: whoops
+                #
+
+            If there's nothing, do nothing::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {}
+
+                writer.raises(parsed, 1)
+                handle.getvalue()
+                #
+        """
+
+        if "raises" not in parsed:
+            return
+
+        for exception in sorted(parsed["raises"].keys()):
+            self.line(f":raises {exception}: {parsed['raises'][exception]}", indent)
+
+    def routine(self,
+        parsed:dict,    # parsed documentation possibly keyed by parameters, return, and/or raises
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes documentation for that which can be excuted
+        usage: |
+            If there's parameters, return, and/or raises, write them, preceeding by a blank line::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "parameters": [
+                        {
+                            "name": "small"
+                        },
+                        {
+                            "name": "big",
+                            "description": "stuff",
+                            "type": "int"
+                        }
+                    ],
+                    "return": {
+                        "description": "stuff",
+                        "type": "int"
+                    },
+                    "raises": {
+                        "Exception": "whoops",
+                        "Error": "oh no"
+                    }
+                }
+
+                writer.routine(parsed, 1)
+                handle.getvalue()
+                #
+                #     :param small: small
+                #     :param big: stuff
+                #     :type big: int
+                #     :return: stuff
+                #     :rtype: int
+                #     :raises Error: oh no
+                #     :raises Exception: whoops
+                #
+
+            If there's nothing, do nothing::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {}
+
+                writer.routine(parsed, 1)
+                handle.getvalue()
+                #
+        """
+
+        if (
+            "parameters" not in parsed and
+            "return" not in parsed and
+            "raises" not in parsed
+        ):
+            return
+
+        self.line()
+        self.parameters(parsed, indent)
+        self.returns(parsed, indent)
+        self.raises(parsed, indent)
+
+    def usage(self,
+        parsed:dict,    # parsed documentation possibly keyed by usage
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes a usage block if present
+        usage: |
+            If there's usages, write with a header and proper blank lines::
+
+                import io
+                import yaml
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                def example():
+                    \"""
+                    usage: |
+                        Here's a neat trick::
+
+                            print("Hello, world!")
+
+                        Cool, huh?
+                    \"""
+
+                parsed = yaml.safe_load(example.__doc__)
+                # {
+                #     "usage": "Here's a neat trick::\\n\\n    print(\\"Hello, world!\\")\\n\\nCool, huh?\\n"
+                # }
+
+                writer.usage(parsed, 1)
+                handle.getvalue()
+                #
+                #     **Usage**
+                #
+                #     Here's a neat trick::
+                #
+                #         print("Hello, world!")
+                #
+                #     Cool, huh?
+                #
+
+            If there's nothing, do nothing::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {}
+
+                writer.usage(parsed, 1)
+                handle.getvalue()
+                #
+        """
+
+        if "usage" not in parsed:
+            return
+
+        self.line("**Usage**", indent, before=True, after=True)
+        self.lines(parsed["usage"].rstrip(), indent)
+
+    def type(self,
+        parsed:dict,    # parsed documentation possibly keyed by type
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes an attribute's type if present
+        usage: |
+            If there's a type::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                writer.type({"type": ["int", "None"]}, 1)
+                handle.getvalue()
+                #     :type: int or None
+                #
+
+            If there's nothing, do nothing::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                writer.type({}, 1)
+                handle.getvalue()
+                #
+        """
+
+        if "type" not in parsed:
+            return
+
+        self.line(f":type: {self.types(parsed['type'])}", indent)
+
+    def attribute(self,
+        parsed:dict,    # parsed documentation for an attribute
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes attribute content, preceeded by a blank line
+        usage: |
+            If there's just a name::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "name": "small"
+                }
+
+                writer.attribute(parsed, 1)
+                handle.getvalue()
+                #
+                #     .. attribute:: small
+                #
+
+            If there's a description and type::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "name": "big",
+                    "description": "stuff",
+                    "type": "int"
+                }
+
+                writer.attribute(parsed, 1)
+                handle.getvalue()
+                #
+                #     .. attribute:: big
+                #         :type: int
+                #
+                #         stuff
+                #
+        """
+
+        self.line(f".. attribute:: {parsed['name']}", indent, before=True)
+        self.render("attribute", parsed, indent+1)
+
+    def attributes(self,
+        parsed:dict,    # parsed documentation possibly containing attributes
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes attributes content if present
+        usage: |
+            If there's attributes::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "attributes": [
+                        {
+                            "name": "small"
+                        },
+                        {
+                            "name": "big",
+                            "description": "stuff",
+                            "type": "int"
+                        }
+                    ]
+                }
+
+                writer.attributes(parsed, indent=1)
+                handle.getvalue()
+                #
+                #     .. attribute:: small
+                #
+                #     .. attribute:: big
+                #         :type: int
+                #
+                #         stuff
+                #
+
+            If there's nothing, do nothing::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {}
+
+                writer.attributes(parsed, 1)
+                handle.getvalue()
+                #
+        """
+        if "attributes" not in parsed:
+            return
+
+        for attribute in parsed["attributes"]:
+            self.attribute(attribute, indent)
+
+    def references(self,
+        parsed:dict,    # parsed documentation possibly containing references
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes references to functions and classes documented elsewhere if present
+        usage: |
+            If there's references, write them as a list with a header::
+
+                import io
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "references": [
+                        {
+                            "name": "Reader",
+                            "kind": "class",
+                            "reference": "sphinxter.reader.Reader"
+                        },
+                        {
+                            "name": "func",
+                            "kind": "function",
+                            "reference": "test.example.func"
+                        }
+                    ]
+                }
+
+                writer.references(parsed, indent=1)
+                handle.getvalue()
+                #
+                #     **References**
+                #
+                #     * :py:class:`Reader <sphinxter.reader.Reader>`
+                #     * :py:func:`func <test.example.func>`
+                #
+
+            If there's nothing, do nothing::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {}
+
+                writer.references(parsed, 1)
+                handle.getvalue()
+                #
+        """
+
+        if not parsed.get("references"):
+            return
+
+        roles = {
+            "function": "func",
+            "class": "class",
+            "exception": "exc"
+        }
+
+        self.line("**References**", indent, before=True, after=True)
+
+        for reference in parsed["references"]:
+            self.line(f"* :py:{roles[reference['kind']]}:`{reference['name']} <{reference['reference']}>`", indent)
+
+    def definition(self,
+        parsed:dict,    # parsed documentation possibly keyed by definition
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes a definition block if present, for describing how to define a class, ie models
+        usage: |
+            If there's definition, write with a header and proper blank lines::
+
+                import io
+                import yaml
+                import sphinxter
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                class Example():
+                    \"""
+                    definition: |
+                        Try this::
+
+                            class Example:
+                                pass
+                    \"""
+
+                parsed = yaml.safe_load(Example.__doc__)
+                # {
+                #     "definition": "Try this::\\n\\n    class Example:\\n        pass\\n"
+                # }
+
+                writer.definition(parsed, 1)
+                handle.getvalue()
+                #
+                #     **Definition**
+                #
+                #     Try this::
+                #
+                #         class Example:
+                #             pass
+                #
+
+            If there's nothing, do nothing::
+
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {}
+
+                writer.definition(parsed, 1)
+                handle.getvalue()
+                #
+        """
+
+        if "definition" not in parsed:
+            return
+
+        self.line("**Definition**", indent, before=True, after=True)
+        self.lines(parsed["definition"].rstrip(), indent)
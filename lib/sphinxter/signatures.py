@@ -0,0 +1,444 @@
+"""
+Module for reading signatures and annotations
+"""
+
+# pylint: disable=too-many-branches, too-many-locals
+
+import sys
+import ast
+import copy
+import types
+import inspect
+
+from sphinxter.cache import Cache
+from sphinxter.source import Source
+
+class Signatures:
+    """
+    description: Static class for reading the signatures and annotations of routines
+    document: signatures
+    """
+
+    annotated = Cache() # annotations of routines read, keyed by the function itself
+    """
+    type: Cache
+    description: |
+        Annotations are never evaluated, just formatted as text, which takes a moment for big typed
+        codebases, so each function's are only formatted once a run.
+    """
+
+    signatures = Cache() # parameter names and signatures of routines read, keyed by routine and whether bound
+    """
+    type: Cache
+    description: |
+        :any:`inspect.signature` is one of the slowest parts of reading, so signatures are built from the code
+        object instead, with :any:`Signatures.code_signature`, and each is only built once a run.
+    """
+
+    @classmethod
+    def annotations(cls,
+        resource # what to extract annotations from
+    )->dict:
+        """
+        description: |
+            Read annotations in a format better for updating
+
+            Nothing is evaluated. Annotations are read as written from the function's node in the source, with
+            :any:`Signatures.static_annotations`, so generics like dict[str, list[int]] come out exactly and their
+            targets don't have to be importable. If there's no source, the annotations are formatted from
+            __annotations__ instead, with :any:`Signatures.annotation`, which leaves strings as they are, like
+            those from "from __future__ import annotations".
+
+            Results are remembered in :any:`Signatures.annotated`, with a deep copy returned each time.
+        parameters:
+            resource:
+                type:
+                - function
+                - method
+        return: dict of annotations, with parameters and return keys
+        usage: |
+            You can use regular annotations and they can be extracted to
+            update information about parameters and functions/methods
+            themelves.
+
+            Say this code is in the test.example module::
+
+                def func(
+                    a:int,   # The a
+                    b:'str', # The b
+                    *args,   #
+                    **kwargs # a: 1
+                             # b: 2
+                ):
+                    pass
+
+            You can extra the annotations like so::
+
+                import sphinxter
+                import test.example
+
+                sphinxter.Signatures.annotations(test.example.func)
+                # {
+                #     "parameters": {
+                #         "a": {
+                #             "type": "int"
+                #         },
+                #         "b": {
+                #             "type": "str"
+                #         }
+                #     },
+                #     "return": {}
+                # }
+        """
+
+        parseds = cls.annotated.get(resource)
+
+        if parseds is None:
+
+            try:
+                node = Source.file(resource).locate(resource)[2]
+            except (OSError, TypeError):
+                node = None
+
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == inspect.unwrap(resource).__name__:
+                parseds = cls.static_annotations(node)
+            else:
+
+                parseds = {
+                    "parameters": {},
+                    "return": {}
+                }
+
+                for name, annotation in getattr(resource, "__annotations__", {}).items():
+
+                    if name == "return":
+                        parseds["return"] = {"type": cls.annotation(annotation)}
+                    else:
+                        parseds["parameters"][name] = {"type": cls.annotation(annotation)}
+
+            cls.annotated.set(resource, parseds)
+
+        return copy.deepcopy(parseds)
+
+    @staticmethod
+    def annotation(
+        annotation # annotation value to format
+    )->str:
+        """
+        description: |
+            Text of an annotation value, without evaluating anything. Strings are used as they are, classes
+            by their names, and anything else, like typing generics, as :any:`inspect.formatannotation` would.
+        usage: |
+            ::
+
+                import typing
+                import sphinxter
+
+                sphinxter.Signatures.annotation("dict[str, int]")
+                # 'dict[str, int]'
+
+                sphinxter.Signatures.annotation(int)
+                # 'int'
+
+                sphinxter.Signatures.annotation(dict[str, list[int]])
+                # 'dict[str, list[int]]'
+
+                sphinxter.Signatures.annotation(typing.Optional[int])
+                # 'Optional[int]'
+        """
+
+        if isinstance(annotation, str):
+            return sys.intern(annotation)
+
+        if isinstance(annotation, type) and not isinstance(annotation, types.GenericAlias):
+            return sys.intern(annotation.__name__)
+
+        return sys.intern(inspect.formatannotation(annotation))
+
+    @classmethod
+    def signature(cls,
+        resource,           # routine to build the signature of
+        bound:bool=False    # whether to drop the first parameter, like self or cls
+    )->tuple:
+        """
+        description: |
+            Parameter names and signature of a routine, formatted like str(inspect.signature()).
+
+            Plain functions, including those of classmethods and staticmethods, are built from their code
+            objects with :any:`Signatures.code_signature`. Anything else, like builtins, partials, or functions
+            wrapped by decorators, falls back to :any:`inspect.signature`.
+
+            Results are remembered in :any:`Signatures.signatures`.
+        return: names of the parameters and the signature
+        usage: |
+            ::
+
+                import sphinxter
+                import test.example
+
+                sphinxter.Signatures.signature(test.example.func)
+                # (['a', 'b', 'args', 'kwargs'], "(a: int, b: 'str', *args, **kwargs)")
+
+                sphinxter.Signatures.signature(test.example.Complex.__init__, bound=True)
+                # (['a', 'b', 'args', 'kwargs'], '(a, b, *args, **kwargs)')
+
+                sphinxter.Signatures.signature(len)
+                # (['obj'], '(obj, /)')
+        """
+
+        key = (resource, bound)
+        found = cls.signatures.get(key)
+
+        if found is None:
+
+            with Source.timed("signature"):
+                function = resource.__func__ if isinstance(resource, (classmethod, staticmethod)) else resource
+
+                if inspect.isfunction(function) and not hasattr(function, "__wrapped__") and not hasattr(function, "__signature__"):
+                    found = cls.code_signature(function, bound)
+                else:
+
+                    signature = inspect.signature(function)
+
+                    if bound:
+                        signature = signature.replace(parameters=list(signature.parameters.values())[1:])
+
+                    found = (list(signature.parameters), str(signature))
+
+            cls.signatures.set(key, found)
+
+        return list(found[0]), found[1]
+
+    @staticmethod
+    def code_signature(
+        function,           # plain function to build the signature of
+        bound:bool=False    # whether to drop the first parameter, like self or cls
+    )->tuple:
+        """
+        description: |
+            Builds the parameter names and signature of a function from its code object, defaults, and
+            annotations, formatted exactly like str(inspect.signature()) would, without unwrapping anything
+        return: names of the parameters and the signature
+        usage: |
+            ::
+
+                import sphinxter
+
+                def meth(self, a:int, /, b:'str'=None, *, c=1, **d)->list:
+                    pass
+
+                sphinxter.Signatures.code_signature(meth, bound=True)
+                # (['a', 'b', 'c', 'd'], "(a: int, /, b: 'str' = None, *, c=1, **d) -> list")
+        """
+
+        code = function.__code__
+        names = code.co_varnames
+        annotations = function.__annotations__
+        defaults = function.__defaults__ or ()
+        kwdefaults = function.__kwdefaults__ or {}
+
+        positionals = code.co_argcount
+        keywords = code.co_kwonlyargcount
+        vararg = names[positionals + keywords] if code.co_flags & 0x04 else None # inspect.CO_VARARGS
+        kwarg = names[positionals + keywords + (vararg is not None)] if code.co_flags & 0x08 else None # inspect.CO_VARKEYWORDS
+
+        first = positionals - len(defaults)
+        parameters = []
+
+        for index, name in enumerate(names[:positionals]):
+            kind = inspect.Parameter.POSITIONAL_ONLY if index < code.co_posonlyargcount else inspect.Parameter.POSITIONAL_OR_KEYWORD
+            parameters.append((name, kind, defaults[index - first] if index >= first else inspect.Parameter.empty))
+
+        if vararg is not None:
+            parameters.append((vararg, inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.empty))
+
+        for name in names[positionals:positionals + keywords]:
+            parameters.append((name, inspect.Parameter.KEYWORD_ONLY, kwdefaults.get(name, inspect.Parameter.empty)))
+
+        if kwarg is not None:
+            parameters.append((kwarg, inspect.Parameter.VAR_KEYWORD, inspect.Parameter.empty))
+
+        if bound:
+            parameters = parameters[1:]
+
+        formatted = []
+        starred = False
+
+        for index, (name, kind, default) in enumerate(parameters):
+
+            if kind == inspect.Parameter.KEYWORD_ONLY and not starred:
+                formatted.append("*")
+
+            if kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.KEYWORD_ONLY):
+                starred = True
+
+            text = name
+
+            if name in annotations:
+                text += f": {inspect.formatannotation(annotations[name])}"
+                if default is not inspect.Parameter.empty:
+                    text += f" = {repr(default)}"
+            elif default is not inspect.Parameter.empty:
+                text += f"={repr(default)}"
+
+            if kind == inspect.Parameter.VAR_POSITIONAL:
+                text = f"*{text}"
+            elif kind == inspect.Parameter.VAR_KEYWORD:
+                text = f"**{text}"
+
+            formatted.append(text)
+
+            if kind == inspect.Parameter.POSITIONAL_ONLY and (index + 1 == len(parameters) or parameters[index + 1][1] != kind):
+                formatted.append("/")
+
+        signature = f"({', '.join(formatted)})"
+
+        if "return" in annotations:
+            signature += f" -> {inspect.formatannotation(annotations['return'])}"
+
+        return [name for name, _, _ in parameters], signature
+
+    @staticmethod
+    def static_annotations(
+        node:ast.AST # function node to extract annotations from
+    )->dict:
+        """
+        description: Read annotations from a function node, as written in the source
+        return: dict of annotations, with parameters and return keys
+        usage: |
+            String annotations are used as is, everything else as it's written::
+
+                import ast
+                import sphinxter
+
+                node = ast.parse("def func(a:int, b:'str', c:dict[str, int])->list: pass").body[0]
+
+                sphinxter.Signatures.static_annotations(node)
+                # {
+                #     "parameters": {
+                #         "a": {
+                #             "type": "int"
+                #         },
+                #         "b": {
+                #             "type": "str"
+                #         },
+                #         "c": {
+                #             "type": "dict[str, int]"
+                #         }
+                #     },
+                #     "return": {
+                #         "type": "list"
+                #     }
+                # }
+        """
+
+        parseds = {
+            "parameters": {},
+            "return": {}
+        }
+
+        arguments = node.args
+        arguments = [*arguments.posonlyargs, *arguments.args, arguments.vararg, *arguments.kwonlyargs, arguments.kwarg]
+
+        for argument in arguments:
+            if argument is not None and argument.annotation is not None:
+                parseds["parameters"][argument.arg] = {"type": Signatures.static_annotation(argument.annotation)}
+
+        if node.returns is not None:
+            parseds["return"] = {"type": Signatures.static_annotation(node.returns)}
+
+        return parseds
+
+    @staticmethod
+    def static_annotation(
+        node:ast.AST # annotation node
+    )->str:
+        """
+        description: Text of an annotation node, using string annotations as is
+        """
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return sys.intern(node.value)
+
+        return sys.intern(ast.unparse(node))
+
+    @staticmethod
+    def static_signature(
+        node:ast.AST,       # function node to build the signature from
+        bound:bool=False    # whether to drop the first parameter, like self or cls
+    )->tuple:
+        """
+        description: |
+            Builds the parameter names and signature of a function node, formatted like
+            str(inspect.signature()) would, except defaults are as written in the source
+        return: names of the parameters and the signature
+        usage: |
+            ::
+
+                import ast
+                import sphinxter
+
+                node = ast.parse("def meth(self, a:int, /, b:'str'=None, *, c=1, **d)->list: pass").body[0]
+
+                sphinxter.Signatures.static_signature(node, bound=True)
+                # (['a', 'b', 'c', 'd'], "(a: int, /, b: 'str' = None, *, c=1, **d) -> list")
+        """
+
+        arguments = node.args
+        defaults = [None] * (len(arguments.posonlyargs) + len(arguments.args) - len(arguments.defaults)) + arguments.defaults
+
+        parameters = []
+
+        for index, argument in enumerate([*arguments.posonlyargs, *arguments.args]):
+            parameters.append(("", argument, defaults[index]))
+            if index == len(arguments.posonlyargs) - 1:
+                parameters.append(("/", None, None))
+
+        if arguments.vararg is not None:
+            parameters.append(("*", arguments.vararg, None))
+        elif arguments.kwonlyargs:
+            parameters.append(("*", None, None))
+
+        for argument, default in zip(arguments.kwonlyargs, arguments.kw_defaults):
+            parameters.append(("", argument, default))
+
+        if arguments.kwarg is not None:
+            parameters.append(("**", arguments.kwarg, None))
+
+        if bound:
+            for index, (_, argument, _) in enumerate(parameters):
+                if argument is not None:
+                    parameters.pop(index)
+                    break
+            if parameters and parameters[0][1] is None and parameters[0][0] == "/":
+                parameters.pop(0)
+
+        names = []
+        formatted = []
+
+        for prefix, argument, default in parameters:
+
+            if argument is None:
+                formatted.append(prefix)
+                continue
+
+            names.append(argument.arg)
+            text = f"{prefix}{argument.arg}"
+
+            if argument.annotation is not None:
+                annotation = argument.annotation
+                text += f": {repr(annotation.value) if isinstance(annotation, ast.Constant) else ast.unparse(annotation)}"
+                if default is not None:
+                    text += f" = {ast.unparse(default)}"
+            elif default is not None:
+                text += f"={ast.unparse(default)}"
+
+            formatted.append(text)
+
+        signature = f"({', '.join(formatted)})"
+
+        if node.returns is not None:
+            returns = node.returns
+            signature += f" -> {repr(returns.value) if isinstance(returns, ast.Constant) else ast.unparse(returns)}"
+
+        return names, signature
@@ -0,0 +1,581 @@
+"""
+Module for reading source files
+"""
+
+# pylint: disable=too-many-branches, too-few-public-methods
+
+import io
+import os
+import sys
+import ast
+import bisect
+import inspect
+import linecache
+import hashlib
+import itertools
+import contextlib
+import token
+import tokenize
+
+import logging
+
+from sphinxter.cache import Cache
+
+class Source:
+    """
+    description: Static class for reading source files, and telling listeners and timings what's read from them
+    document: source
+    """
+
+    files = Cache() # source files read, keyed by filename, modification time, and size
+    """
+    type: Cache
+    description: |
+        Each file is read, tokenized, and parsed at most once, with every resource in
+        that file sliced out of the same :any:`Source.File`. Check files.stats() to see
+        how many reads were saved.
+    """
+
+    loaded = None   # paths of files loaded while reading a module that's to be stored
+
+    timings = None  # Timings of reading each resource, None to not time anything
+    """
+    type:
+    - None
+    - Timings
+    description: |
+        When set, each module, class, and routine read is timed, along with the phases of reading them:
+        loading source, tokenizing, parsing the AST, loading YAML, and building signatures. When not, the
+        only cost is checking this is None.
+    """
+
+    listeners = []  # callables told of everything read, like :any:`Source.log`
+    """
+    type: list[callable]
+    description: |
+        Each listener is called with the event and the names it's about, as each module, class, routine,
+        parameter comment, and attribute is read:
+
+        * module, name
+        * class, name
+        * routine, name
+        * parameter, name of the routine, name of the parameter
+        * attribute, docstring or comment, names of the attribute
+
+        With no listeners, the only cost is checking there aren't any. Add :any:`Source.log` to log them all.
+    """
+
+    class File:
+        """
+        description: Lines of a source file, tokenized and parsed into an AST only when first needed
+        """
+
+        name = None     # path of the file
+        lines = None    # lines of the file, including line endings
+        tokens = None   # tokens of the entire file, once tokenized
+        rows = None     # starting row of each token, for slicing tokens by line
+        remarks = None  # text of each comment, keyed by row
+        comments = None # comment text of each function's parameters, keyed by first line, then parameter
+        nodes = None    # AST of the entire file, once parsed
+        classes = None  # class nodes, keyed by qualified name
+        routines = None # function nodes, keyed by first line (including decorators)
+
+        def __init__(self,
+            name:str,   # path of the file
+            lines:list  # lines of the file, including line endings
+        ):
+
+            self.name = name
+            self.lines = lines
+
+        def tokenize(self,
+            start:int=1,    # first line to include tokens from
+            end:int=None    # last line to include tokens from, default is the end of the file
+        ):
+            """
+            description: Tokens starting on the lines requested, tokenizing the file if needed
+            return:
+                description: Iterator of tokens
+                type: Iterator[tokenize.TokenInfo]
+            """
+
+            if self.tokens is None:
+                with Source.timed("tokenize"):
+                    self.tokens = list(tokenize.generate_tokens(io.StringIO("".join(self.lines)).readline))
+                    self.rows = [parsed.start[0] for parsed in self.tokens]
+
+            first = bisect.bisect_left(self.rows, start)
+            last = len(self.rows) if end is None else bisect.bisect_right(self.rows, end)
+
+            return itertools.islice(self.tokens, first, last)
+
+        def remark(self,
+            row:int # line to find the comment on
+        )->str:
+            """
+            description: |
+                The text of the comment on a line, without the leading '# ', finding
+                all the comments in the file in one pass the first time.
+            return:
+                description: The comment text or None if there's no comment on the line
+                type:
+                - str
+                - None
+            """
+
+            if self.remarks is None:
+                self.remarks = {}
+                for parsed in self.tokenize():
+                    if parsed.type == token.COMMENT:
+                        self.remarks[parsed.start[0]] = parsed.string[2:].rstrip()
+
+            return self.remarks.get(row)
+
+        def parameters(self,
+            start:int,  # first line of the function
+            end:int     # last line of the function
+        )->dict:
+            """
+            description: |
+                Finds the parameters of a function and the comments after them, finding those of
+                all the functions in the file in one pass the first time.
+            return: comment text for each parameter, None if there's no comment, keyed by parameter
+            """
+
+            if self.comments is None:
+
+                self.parse()
+
+                starts = sorted(self.routines)
+                position = 0
+                signatures = {}
+                self.comments = {}
+
+                for parsed in self.tokenize():
+
+                    while position < len(starts) and starts[position] <= parsed.start[0]:
+                        signatures[starts[position]] = self.Signature()
+                        position += 1
+
+                    for first in list(signatures):
+                        if signatures[first].read(parsed):
+                            self.comments[first] = signatures.pop(first).comments
+
+                for first, signature in signatures.items():
+                    self.comments[first] = signature.comments
+
+            if start in self.comments:
+                return dict(self.comments[start])
+
+            # not found by the AST, so just this function
+
+            signature = self.Signature()
+
+            for parsed in self.tokenize(start, end):
+                if signature.read(parsed):
+                    break
+
+            return signature.comments
+
+        class Signature:
+            """
+            description: Reads a function's parameters and the comments after them, one token at a time
+            """
+
+            parens = None   # how deep in parentheses
+            param = None    # current parameter
+            params = None   # whether in the parameters yet
+            name = None     # whether the next name is a parameter
+            comments = None # comment text for each parameter, None if there's no comment, keyed by parameter
+
+            def __init__(self):
+
+                self.parens = 0
+                self.params = False
+                self.name = False
+                self.comments = {}
+
+            def read(self,
+                parsed:tokenize.TokenInfo # the next token
+            )->bool:
+                """
+                description: Reads the next token
+                return: whether the parameters are done
+                """
+
+                if parsed.type == token.OP:
+                    if parsed.string == '(':
+                        if self.parens == 0:
+                            self.params = True
+                            self.name = True
+                        self.parens += 1
+                    elif parsed.string == ')':
+                        self.parens -= 1
+                        if self.parens == 0:
+                            return True
+                elif parsed.type == token.NL:
+                    self.name = True
+                elif parsed.type == token.NAME and self.name:
+                    if self.params:
+                        self.param = sys.intern(parsed.string)
+                        self.comments.setdefault(self.param, None)
+                        self.name = False
+                elif parsed.type == token.COMMENT:
+                    if self.param is not None:
+                        comment = parsed.string[2:].rstrip()
+                        if comment:
+                            if self.comments[self.param] is None:
+                                self.comments[self.param] = comment
+                            else:
+                                self.comments[self.param] = f"{self.comments[self.param]}\n{comment}"
+
+                return False
+
+        def parse(self)->ast.Module:
+            """
+            description: AST of the file, parsing and indexing if needed
+            """
+
+            if self.nodes is None:
+                with Source.timed("ast"):
+                    self.nodes = ast.parse("".join(self.lines), self.name)
+                    self.classes = {}
+                    self.routines = {}
+                    self.index(self.nodes, "")
+
+            return self.nodes
+
+        def index(self,
+            node:ast.AST,   # node whose children to index
+            prefix:str      # qualified name prefix of the children
+        ):
+            """
+            description: |
+                Indexes classes by their qualified names and functions by their first lines,
+                the same way inspect would find them, keeping the first found.
+            """
+
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, ast.ClassDef):
+                    self.classes.setdefault(f"{prefix}{child.name}", child)
+                    self.index(child, f"{prefix}{child.name}.")
+                elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    self.routines.setdefault(child.decorator_list[0].lineno if child.decorator_list else child.lineno, child)
+                    self.index(child, f"{prefix}{child.name}.<locals>.")
+                else:
+                    self.index(child, prefix)
+
+        def locate(self,
+            resource # what to find in the file
+        )->tuple:
+            """
+            description: Finds where a resource is in this file
+            parameters:
+                resource:
+                    type:
+                    - module
+                    - function
+                    - class
+                    - method
+            return:
+                description: first line, last line, and the AST node if found
+                type: tuple
+            """
+
+            resource = inspect.unwrap(resource)
+            nodes = self.parse()
+
+            if inspect.ismodule(resource):
+                return 1, len(self.lines), nodes
+
+            if inspect.isclass(resource):
+
+                node = self.classes.get(resource.__qualname__)
+
+                if node is None:
+                    raise OSError('could not find class definition')
+
+                start = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+
+                return start, node.end_lineno, node
+
+            if inspect.ismethod(resource):
+                resource = resource.__func__
+
+            start = resource.__code__.co_firstlineno
+            node = self.routines.get(start)
+
+            if node is not None:
+                return start, node.end_lineno, node
+
+            return start, start + len(inspect.getblock(self.lines[start - 1:])) - 1, None
+
+    @classmethod
+    def emit(cls,
+        event:str,  # what happened
+        *names      # names of what it happened to
+    ):
+        """
+        description: Tells every listener in :any:`Source.listeners` of an event
+        usage: |
+            Listeners can be anything callable, like a counter::
+
+                import collections
+                import unittest.mock
+                import sphinxter
+
+                counts = collections.Counter()
+
+                def count(event, *names, counts=counts):
+                    counts[event] += 1
+
+                with unittest.mock.patch.object(sphinxter.Source, "listeners", [count]):
+                    sphinxter.Source.emit("routine", "func")
+                    sphinxter.Source.emit("parameter", "func", "a")
+                    sphinxter.Source.emit("parameter", "func", "b")
+
+                dict(counts)
+                # {
+                #     "routine": 1,
+                #     "parameter": 2
+                # }
+        """
+
+        for listener in cls.listeners:
+            listener(event, *names)
+
+    @staticmethod
+    def log(
+        event:str,  # what happened
+        *names      # names of what it happened to
+    ):
+        """
+        description: |
+            Listener that logs each event at info level, with messages like "routine: func" or
+            "func parameter: a". Add it to :any:`Source.listeners` to log everything read.
+        """
+
+        if event == "parameter":
+            logging.info("%s parameter: %s", *names)
+        elif event == "attribute":
+            kind, name = names
+            logging.info("attribute docstring: %s" if kind == "docstring" else "attribute comment: %s", name)
+        elif event in ("routine", "class", "module"):
+            logging.info(event + ": %s", *names)
+        else:
+            logging.info("%s: %s", event, " ".join(str(name) for name in names))
+
+    @classmethod
+    def timing(cls,
+        kind:str,           # kind of resource
+        name:str,           # full name of the resource
+        lazy:bool=False     # whether it's time spent lazily loading part of the resource, after it was read
+    ):
+        """
+        description: |
+            Context for timing reading a resource in :any:`Source.timings`, doing nothing if not timing.
+
+            If lazy, the time's added to the resource without counting it as read again, and only if nothing
+            else is being timed, since then it's already part of what is. That's how functions and classes
+            loaded after their module was read still count towards the module's total.
+
+            A resource already being timed, like a module :any:`Reader.module` is walking, isn't timed again.
+        """
+
+        if cls.timings is None or (lazy and cls.timings.stack):
+            return contextlib.nullcontext()
+
+        if any(frame[0]["kind"] == kind and frame[0]["name"] == name for frame in cls.timings.stack):
+            return contextlib.nullcontext()
+
+        return cls.timings.resource(kind, name, count=not lazy)
+
+    @classmethod
+    def timed(cls,
+        phase:str   # phase of reading
+    ):
+        """
+        description: Context for timing a phase of reading in :any:`Source.timings`, doing nothing if not timing
+        """
+
+        if cls.timings is None:
+            return contextlib.nullcontext()
+
+        return cls.timings.phase(phase)
+
+    @classmethod
+    def file(cls,
+        resource # what to find the source file of
+    )->'Source.File':
+        """
+        description: Retrieves the source file of a resource, reading it only if it's new or has changed
+        parameters:
+            resource:
+                type:
+                - module
+                - function
+                - class
+                - method
+        usage: |
+            The lines of the file are read the first time, and reused after::
+
+                import sphinxter
+                import test.example
+
+                sphinxter.Reader.reset()
+
+                sphinxter.Source.file(test.example).name.endswith("example.py")
+                # True
+
+                sphinxter.Source.file(test.example.Complex) is sphinxter.Source.file(test.example)
+                # True
+
+                sphinxter.Source.files.stats()
+                # {
+                #     "entries": 1,
+                #     "hits": 2,
+                #     "misses": 1,
+                #     "evictions": 0
+                # }
+        """
+
+        resource = inspect.unwrap(resource)
+
+        return cls.load(inspect.getsourcefile(resource) or inspect.getfile(resource), resource)
+
+    @classmethod
+    def load(cls,
+        name:str,       # path of the file
+        resource=None   # what's in the file, for finding source through its module's loader
+    )->'Source.File':
+        """
+        description: Retrieves a source file by path, reading it only if it's new or has changed
+        usage: |
+            Files can be loaded without importing anything::
+
+                import sphinxter
+
+                sphinxter.Source.load("test/example.py").lines[10]
+                # 'a = None # The a team\\n'
+        """
+
+        try:
+            stat = os.stat(name)
+            key = (name, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            key = (name, None, None)
+
+        if cls.loaded is not None:
+            cls.loaded.add(name)
+
+        file = cls.files.get(key)
+
+        if file is None:
+
+            with cls.timed("source"):
+                module = inspect.getmodule(resource, name) if resource is not None else None
+                linecache.checkcache(name)
+                lines = linecache.getlines(name, module.__dict__ if module is not None else None)
+
+            if not lines:
+                raise OSError('could not get source code')
+
+            file = cls.File(name, lines)
+            cls.files.set(key, file)
+
+        return file
+
+    @classmethod
+    def source(cls,
+        resource # what to extract the source from
+    ):
+        """
+        description: Reads the source, removing any overall indent
+        parameters:
+            resource:
+                type:
+                - module
+                - function
+                - class
+                - method
+        return:
+            description: The non-indented source
+            type: str
+        usage: |
+            Consider the sub class in a test.example module::
+
+                class Complex:
+
+                    class Subber:
+                        \"""
+                        Sub class
+                        \"""
+
+                        pass
+
+            The source for Subber would be indented from inspect.getsource()
+            which can't be parsed properly because of the initial indent::
+
+                import inspect
+                import test.example
+
+                inspect.getsource(test.example.Complex.Subber)
+                #     class Subber:
+                #         \"""
+                #         Sub class
+                #         \"""
+                #         pass
+                #
+
+            This prevents that problem::
+
+                import sphinxter
+                import test.example
+
+                sphinxter.Source.source(test.example.Complex.Subber)
+                # class Subber:
+                #     \"""
+                #     Sub class
+                #     \"""
+                #     pass
+                #
+        """
+
+        indent = None
+        lines = []
+
+        file = cls.file(resource)
+        start, end, _ = file.locate(resource)
+
+        for line in file.lines[start - 1:end]:
+
+            if indent is None:
+                indent = 0
+                for letter in line:
+                    if letter in [' ', "\t"]:
+                        indent += 1
+                    else:
+                        break
+
+            lines.append(line[indent:])
+
+        return "".join(lines)
+
+    @staticmethod
+    def digest(
+        path:str # path of the file
+    )->str:
+        """
+        description: Hash of a file's contents
+        return:
+            description: hex SHA-256 digest, None if the file can't be read
+            type:
+            - str
+            - None
+        """
+
+        try:
+            with open(path, "rb") as file:
+                return hashlib.sha256(file.read()).hexdigest()
+        except (OSError, TypeError):
+            return None
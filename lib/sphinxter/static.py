@@ -0,0 +1,309 @@
+"""
+Module for reading documentation from source, without importing
+"""
+
+import os
+import sys
+import ast
+
+from sphinxter.source import Source
+from sphinxter.parser import Parser
+from sphinxter.signatures import Signatures
+from sphinxter.memory import Memory
+from sphinxter.reader import Reader
+
+class Static:
+    """
+    description: Static class for reading doc strings and comments into dict's from source, without importing anything
+    document: static
+    """
+
+    @staticmethod
+    def modulename(
+        path:str # path of the module's file
+    )->str:
+        """
+        description: Figures out the full name of a module from its path, by going up through packages
+        usage: |
+            Packages are any directories with an __init__.py::
+
+                import sphinxter
+
+                sphinxter.Static.modulename("lib/sphinxter/reader.py")
+                # 'sphinxter.reader'
+
+                sphinxter.Static.modulename("lib/sphinxter/__init__.py")
+                # 'sphinxter'
+        """
+
+        directory, name = os.path.split(os.path.abspath(path))
+
+        names = [] if name == "__init__.py" else [os.path.splitext(name)[0]]
+
+        while os.path.exists(os.path.join(directory, "__init__.py")):
+            directory, package = os.path.split(directory)
+            names.insert(0, package)
+
+        return sys.intern(".".join(names))
+
+    @classmethod
+    def routine(cls,
+        file:'Source.File', # file the node is from
+        node:ast.AST,       # function node to read from
+        method:bool=False   # whether this is a method
+    )->dict:
+        """
+        description: Reads all the documentation from a function node, the same as :any:`Reader.routine` but without importing
+        return: dict of routine documentation
+        """
+
+        if Source.listeners:
+            Source.emit("routine", node.name)
+
+        with Source.timing("method" if method else "function", f"{node.name} ({file.name}:{node.lineno})"):
+            decorators = [decorator.id for decorator in node.decorator_list if isinstance(decorator, ast.Name)]
+
+            if "staticmethod" in decorators:
+                kind = "staticmethod"
+            elif "classmethod" in decorators:
+                kind = "classmethod"
+            else:
+                kind = "method"
+
+            with Source.timed("signature"):
+                names, signature = Signatures.static_signature(node, bound=method and kind != "staticmethod")
+
+            parsed = {
+                "name": node.name,
+                "signature": signature
+            }
+
+            parsed["kind"] = kind if method else "function"
+
+            start = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+            comments = Parser.remarks(node.name, file.parameters(start, node.end_lineno))
+
+            return Reader.combine(parsed, names, comments, Signatures.static_annotations(node), ast.get_docstring(node, clean=False))
+
+    @staticmethod
+    def members(
+        node:ast.AST # module or class node
+    )->dict:
+        """
+        description: Functions, classes, and attributes defined in the body of a node, last definition winning
+        return: nodes keyed by name
+        """
+
+        members = {}
+
+        for child in node.body:
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                members[child.name] = child
+            elif isinstance(child, ast.Assign):
+                for target in child.targets:
+                    if isinstance(target, ast.Name):
+                        members[target.id] = child
+
+        return members
+
+    @classmethod
+    def cls(cls,
+        file:'Source.File', # file the node is from
+        node:ast.ClassDef   # class node to read from
+    )->dict:
+        """
+        description: Reads all the documentation from a class node, the same as :any:`Reader.cls` but without importing
+        return: dict of class documentation
+        """
+
+        if Source.listeners:
+            Source.emit("class", node.name)
+
+        with Source.timing("class", f"{node.name} ({file.name}:{node.lineno})"):
+            parsed = {
+                "name": node.name,
+                "kind": "exception" if any(isinstance(base, ast.Name) and base.id == "Exception" for base in node.bases) else "class",
+                "attributes": [],
+                "methods": [],
+                "classes": [],
+                "exceptions": []
+            }
+
+            parsed.update(Parser.parse(ast.get_docstring(node, clean=False)))
+
+            members = cls.members(node)
+
+            if isinstance(members.get("__init__"), (ast.FunctionDef, ast.AsyncFunctionDef)):
+                Parser.update(parsed, cls.routine(file, members["__init__"], method=True), skip=["name", "kind"])
+
+            attributes = Reader.assignments(file, node)
+
+            for name in sorted(members.keys()):
+
+                member = members[name]
+
+                if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+
+                    if name != "__init__":
+                        parsed["methods"].append(cls.routine(file, member, method=True))
+
+                elif isinstance(member, ast.ClassDef):
+
+                    cls_parsed = cls.cls(file, member)
+
+                    if cls_parsed["kind"] == "exception":
+                        parsed["exceptions"].append(cls_parsed)
+                    else:
+                        parsed["classes"].append(cls_parsed)
+
+                elif name in attributes and not name.startswith('__') and not name.endswith('__'):
+
+                    attribute = {
+                        "name": name
+                    }
+
+                    Parser.update(attribute, attributes[name])
+
+                    parsed["attributes"].append(attribute)
+
+            return parsed
+
+    @classmethod
+    def module(cls,
+        file:'Source.File', # file of the module
+        name:str            # full name of the module
+    )->dict:
+        """
+        description: |
+            Reads all the documentation from a module's file, the same as :any:`Reader.module` but without importing.
+            Only what's defined in the module itself is included, as imports aren't followed.
+        return: dict of module documentation
+        """
+
+        if Source.listeners:
+            Source.emit("module", name)
+
+        nodes = file.parse()
+
+        parsed = {
+            "name": name,
+            "attributes": [],
+            "functions": [],
+            "classes": [],
+            "exceptions": []
+        }
+
+        parsed.update(Parser.parse(ast.get_docstring(nodes, clean=False)))
+
+        members = cls.members(nodes)
+        attributes = Reader.assignments(file, nodes)
+
+        for member_name in sorted(members.keys()):
+
+            member = members[member_name]
+
+            if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+
+                parsed["functions"].append(cls.routine(file, member))
+
+            elif isinstance(member, ast.ClassDef):
+
+                cls_parsed = cls.cls(file, member)
+
+                if cls_parsed["kind"] == "exception":
+                    parsed["exceptions"].append(cls_parsed)
+                else:
+                    parsed["classes"].append(cls_parsed)
+
+            elif member_name in attributes:
+
+                attribute = {
+                    "name": member_name
+                }
+
+                Parser.update(attribute, attributes[member_name])
+
+                parsed["attributes"].append(attribute)
+
+        return parsed
+
+    @classmethod
+    def read(cls,
+        path:str # path of a module's file or a package's directory
+    )->list:
+        """
+        description: |
+            Reads all the documentation from a module file or a package directory using only its source,
+            never importing anything. That means the dependencies of what's being documented don't need to
+            be installed and no module level code is run.
+
+            Signatures are rebuilt from the source, with defaults as they were written, and types come from
+            annotations as they were written, without evaluating them. Since nothing's imported, only what's
+            defined in each module is included, not what it imports.
+        return: list of module documentation, like :any:`Reader.module` returns, ordered by module name
+        usage: |
+            Reading a module from its file gives the same as reading it after importing::
+
+                import sphinxter
+                import test.example
+
+                imported = sphinxter.Reader.module(test.example)
+                imported["name"] = "example"
+
+                sphinxter.Static.read("test/example.py") == [imported]
+                # True
+
+            Reading a directory reads the package and all its modules and subpackages::
+
+                [parsed["name"] for parsed in sphinxter.Static.read("lib/sphinxter")]
+                # [
+                #     "sphinxter",
+                #     "sphinxter.cache",
+                #     "sphinxter.document",
+                #     "sphinxter.memory",
+                #     "sphinxter.parsed",
+                #     "sphinxter.parser",
+                #     "sphinxter.reader",
+                #     "sphinxter.registry",
+                #     "sphinxter.sections",
+                #     "sphinxter.signatures",
+                #     "sphinxter.source",
+                #     "sphinxter.static",
+                #     "sphinxter.timings",
+                #     "sphinxter.unittest",
+                #     "sphinxter.writer"
+                # ]
+        """
+
+        paths = [path]
+
+        if os.path.isdir(path):
+
+            paths = []
+
+            for directory, directories, names in os.walk(path):
+
+                directories[:] = [name for name in directories if os.path.exists(os.path.join(directory, name, "__init__.py"))]
+
+                for name in names:
+                    if name.endswith(".py"):
+                        paths.append(os.path.join(directory, name))
+
+        modules = sorted((cls.modulename(source), source) for source in paths)
+
+        parseds = []
+
+        for name, source in modules:
+
+            with Source.timing("module", name):
+                key = Memory.key(name, source) if Memory.store is not None else None
+                parsed = Memory.recall(name, key)
+
+                if parsed is None:
+                    with Memory.loading(key):
+                        parsed = cls.module(Source.load(source), name)
+                        Memory.remember(name, key, parsed)
+
+                parseds.append(parsed)
+
+        return parseds
@@ -0,0 +1,169 @@
+"""
+Module for timing what's read
+"""
+
+import time
+import contextlib
+
+class Timings:
+    """
+    description: |
+        Wall time and counts of reading each resource, broken down into the phases of reading it.
+
+        Resources are timed in total, including anything read while reading them, like the methods of
+        a class, and on their own, without that. Phases are timed both for the resource being read at
+        the time and for the whole run.
+    document: timings
+    usage: |
+        Resources and phases are timed with context managers::
+
+            import sphinxter
+
+            timings = sphinxter.Timings()
+
+            with timings.resource("class", "yourmodule.Thing"):
+                with timings.phase("yaml"):
+                    pass
+                with timings.resource("method", "yourmodule.Thing.do"):
+                    with timings.phase("signature"):
+                        pass
+
+            [timing["name"] for timing in timings.report()["resources"]]
+            # [
+            #     "yourmodule.Thing",
+            #     "yourmodule.Thing.do"
+            # ]
+
+            timings.report()["phases"]["yaml"]["count"]
+            # 1
+    """
+
+    phases = None       # time and count of each phase for the whole run, keyed by phase
+    resources = None    # time, count, and phases of each resource, keyed by kind and name
+    stack = None        # resources being read, innermost last, with the seconds spent reading what they read
+
+    def __init__(self):
+
+        self.phases = {}
+        self.resources = {}
+        self.stack = []
+
+    @contextlib.contextmanager
+    def resource(self,
+        kind:str,           # kind of resource, like module, class, or method
+        name:str,           # full name of the resource
+        count:bool=True     # whether to count reading it, False to just add time to it, like what it loads lazily
+    ):
+        """
+        description: Times reading a resource, counting it each time unless told not to
+        """
+
+        timing = self.resources.get((kind, name))
+
+        if timing is None:
+            timing = self.resources[(kind, name)] = {
+                "kind": kind,
+                "name": name,
+                "count": 0,
+                "seconds": 0.0,
+                "own": 0.0,
+                "phases": {}
+            }
+
+        if count:
+            timing["count"] += 1
+
+        frame = [timing, 0.0]
+        self.stack.append(frame)
+
+        start = time.perf_counter()
+
+        try:
+            yield timing
+        finally:
+
+            seconds = time.perf_counter() - start
+
+            self.stack.pop()
+
+            timing["seconds"] += seconds
+            timing["own"] += seconds - frame[1]
+
+            if self.stack:
+                self.stack[-1][1] += seconds
+
+    @contextlib.contextmanager
+    def phase(self,
+        name:str    # phase of reading, like source, tokenize, ast, yaml, or signature
+    ):
+        """
+        description: Times a phase of reading, for the resource being read and the whole run
+        """
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+
+            seconds = time.perf_counter() - start
+
+            phases = [self.phases]
+
+            if self.stack:
+                phases.append(self.stack[-1][0]["phases"])
+
+            for timed in phases:
+                timed.setdefault(name, {"count": 0, "seconds": 0.0})
+                timed[name]["count"] += 1
+                timed[name]["seconds"] += seconds
+
+    def merge(self,
+        timings:'Timings'   # timings to add to these, like those from another process
+    ):
+        """
+        Adds other timings to these
+        """
+
+        for name, timed in timings.phases.items():
+            self.phases.setdefault(name, {"count": 0, "seconds": 0.0})
+            self.phases[name]["count"] += timed["count"]
+            self.phases[name]["seconds"] += timed["seconds"]
+
+        for key, timed in timings.resources.items():
+
+            timing = self.resources.setdefault(key, {
+                "kind": timed["kind"],
+                "name": timed["name"],
+                "count": 0,
+                "seconds": 0.0,
+                "own": 0.0,
+                "phases": {}
+            })
+
+            timing["count"] += timed["count"]
+            timing["seconds"] += timed["seconds"]
+            timing["own"] += timed["own"]
+
+            for name, phase in timed["phases"].items():
+                timing["phases"].setdefault(name, {"count": 0, "seconds": 0.0})
+                timing["phases"][name]["count"] += phase["count"]
+                timing["phases"][name]["seconds"] += phase["seconds"]
+
+    def report(self,
+        top:int=10  # how many of the slowest resources to include
+    )->dict:
+        """
+        description: |
+            Structured report of the timings, with the phases of the whole run, every resource in the
+            order first read, and the slowest resources by the time spent reading them on their own
+        return: dict of phases, resources, and slowest
+        """
+
+        resources = list(self.resources.values())
+
+        return {
+            "phases": self.phases,
+            "resources": resources,
+            "slowest": sorted(resources, key=lambda timing: timing["own"], reverse=True)[:top]
+        }
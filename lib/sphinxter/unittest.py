@@ -38,6 +38,7 @@ import json
 import inspect
 import traceback
 import unittest
+import collections.abc
 import sphinxter
 
 class CodeException(Exception):
@@ -626,7 +627,7 @@ class TestCase(unittest.TestCase):
             for index, item in enumerate(section):
                 self.assertSphinxterSection(item, location=f"{location}[{index}]" if location else f"[{index}]", evaluate=evaluate)
 
-        elif isinstance(section, dict):
+        elif isinstance(section, collections.abc.Mapping):
 
             for name, item in section.items():
                 if name not in ["methods", "classes", "exceptions"]:
@@ -4,627 +4,32 @@ Module for writing out documents
 
 # pylint: disable=too-many-lines
 
-class Writer:
-    """
-    description: Class for writing out documents (rst)
-    document: writer
-    """
-
-    document = None # document object to write out
-    file = None     # file handle to write out to
-
-    def __init__(self,
-        document:'sphinxter.Document',  # document object to write out
-        file                            # file handle like object to write to
-    ):
-
-        self.document = document
-        self.file = file
-
-    def line(self,
-        line:str='',        # Text to write out
-        indent:int=0,       # How many times to indent
-        before:bool=False,  # Whether to put a blankline before
-        after:bool=False    # Whether to put a blankline after
-    ):
-        """
-        description: Writes a line of text to the filehandle
-        usage: |
-            This can just write a line of text::
-
-                import io
-                import sphinxter
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                writer.line("Hello, world!")
-                handle.getvalue()
-                # Hello, world!
-                #
-
-            It can indent::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                writer.line("Hello, world!", indent=1)
-                handle.getvalue()
-                #     Hello, world!
-                #
-
-            And it can add lines (with no indent) before and after::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                writer.line("Hello, world!", indent=1, before=True, after=True)
-                handle.getvalue()
-                #
-                #     Hello, world!
-                #
-                #
-        """
-
-        if before:
-            self.file.write("\n")
-
-        self.file.write(f"{self.document.indent * indent}{line}".rstrip())
-
-        self.file.write("\n")
-
-        if after:
-            self.file.write("\n")
-
-    def lines(self,
-        lines:str,          # Multil\ine text to write out
-        indent:int  ,       # How many times to indent
-        before:bool=False,  # Whether to put a blankline before
-        after:bool=False    # Whether to put a blankline after
-    ):
-        """
-        description: Writes lines of text to the filehandle
-        usage: |
-            This can just write lines of text::
-
-                import io
-                import sphinxter
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                writer.lines("Hello\\nworld!", indent=0)
-                handle.getvalue()
-                # Hello
-                # world!
-                #
-
-            It can indent::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                writer.lines("Hello\\nworld!", indent=1)
-                handle.getvalue()
-                #     Hello
-                #     world!
-                #
-
-            And it can add lines (with no indent) before and after::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                writer.lines("Hello\\nworld!", indent=1, before=True, after=True)
-                handle.getvalue()
-                #
-                #     Hello
-                #     world!
-                #
-                #
-        """
-
-        if before:
-            self.file.write("\n")
-
-        for line in lines.split("\n"):
-            self.line(line, indent)
-
-        if after:
-            self.file.write("\n")
-
-    @staticmethod
-    def types(
-        types:'str or list' # Type(s) to write out
-    ):
-        """
-        description: Takes a str of type or list of str of type and returns a str
-        usage: |
-            If just a single type, it returns that::
-
-                import sphinxter
-
-                sphinxter.Writer.types("str")
-                # "str"
-
-            If a list of types, return types, concatenated with ' or '::
-
-                sphinxter.Writer.types(["str", "list"])
-                # "str or list"
-        """
-
-        if not isinstance(types, list):
-            types = [types]
-
-        return " or ".join(types)
-
-    def description(self,
-        parsed:dict,    # parsed documentation
-        indent:int      # amount to indent by
-    ):
-        """
-        description: Writes description if present, preceeding with a blank line
-        usage: |
-
-            If there's a description in the documentation, it writes it out with a preceeding blank line::
-
-                import io
-                import sphinxter
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "description": "It is what it is"
-                }
-
-                writer.description(parsed, indent=1)
-                handle.getvalue()
-                #
-                #     It is what it is
-                #
-
-            If there's no description, it does nothing::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {}
-
-                writer.description(parsed, indent=1)
-                handle.getvalue()
-                #
-        """
-
-        if "description" not in parsed:
-            return
-
-        self.lines(parsed["description"].rstrip(), indent, before=True)
-
-    def parameter(self,
-        parsed:dict,    # parsed documentation for a parameter
-        indent:int      # amount to indent by
-    ):
-        """
-        description: Writes parameter documentation
-        usage: |
-
-            If there's only a name::
-
-                import io
-                import sphinxter
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "name": "arg"
-                }
-
-                writer.parameter(parsed, indent=1)
-                handle.getvalue()
-                #     :param arg: arg
-                #
-
-            If there's also a description::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "name": "arg",
-                    "description": "an argument"
-                }
-
-                writer.parameter(parsed, indent=1)
-                handle.getvalue()
-                #     :param arg: an argument
-                #
-
-            If there's also a type::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "name": "arg",
-                    "description": "an argument",
-                    "type": "bool"
-                }
-
-                writer.parameter(parsed, indent=1)
-                handle.getvalue()
-                #     :param arg: an argument
-                #     :type arg: bool
-                #
-        """
-
-        if "description" in parsed:
-            self.line(f":param {parsed['name']}: {parsed['description']}", indent)
-        else:
-            self.line(f":param {parsed['name']}: {parsed['name']}", indent)
-
-        if "type" in parsed:
-            self.line(f":type {parsed['name']}: {self.types(parsed['type'])}", indent)
-
-    def parameters(self,
-        parsed:dict,    # parsed documentation possibly keyed by parameters
-        indent:int      # amount to indent by
-    ):
-        """
-        description: Writes parameters if present
-        usage: |
-            If parameters are present, write them::
-
-                import io
-                import sphinxter
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "parameters": [
-                        {
-                            "name": "small"
-                        },
-                        {
-                            "name": "big",
-                            "description": "stuff",
-                            "type": "int"
-                        }
-                    ]
-                }
-
-                writer.parameters(parsed, 1)
-                handle.getvalue()
-                #     :param small: small
-                #     :param big: stuff
-                #     :type big: int
-                #
-
-            If not, do nothing::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {}
-
-                writer.parameters(parsed, 1)
-                handle.getvalue()
-                #
-        """
-
-        if "parameters" not in parsed:
-            return
-
-        for parameter in parsed["parameters"]:
-            self.parameter(parameter, indent)
-
-    def returns(self,
-        parsed:dict,    # parsed documentation possibly keyed by return
-        indent:int      # amount to indent by
-    ):
-        """
-        description: Writes return information if present
-        usage: |
-            If there's a description::
-
-                import io
-                import sphinxter
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "return": {
-                        "description": "stuff"
-                    }
-                }
-
-                writer.returns(parsed, 1)
-                handle.getvalue()
-                #     :return: stuff
-                #
-
-            If there's also a type::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "return": {
-                        "description": "stuff",
-                        "type": "int"
-                    }
-                }
-
-                writer.returns(parsed, 1)
-                handle.getvalue()
-                #     :return: stuff
-                #     :rtype: int
-                #
-
-            If there's only a type::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "return": {
-                        "type": "int"
-                    }
-                }
-
-                writer.returns(parsed, 1)
-                handle.getvalue()
-                #     :rtype: int
-                #
-
-            If there's nothing, do nothing::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {}
-
-                writer.returns(parsed, 1)
-                handle.getvalue()
-                #
-        """
-
-        if "return" not in parsed:
-            return
-
-        if "description" in parsed['return']:
-            self.line(f":return: {parsed['return']['description']}", indent)
-
-        if "type" in parsed['return']:
-            self.line(f":rtype: {self.types(parsed['return']['type'])}", indent)
-
-    def raises(self,
-        parsed:dict,    # parsed documentation possibly keyed by raises
-        indent:int      # amount to indent by
-    ):
-        """
-        description: Writes raises information if present
-        usage: |
-            If there's raises, write them (alphabetically)::
-
-                import io
-                import sphinxter
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "raises": {
-                        "Exception": "whoops",
-                        "Error": "oh no"
-                    }
-                }
-
-                writer.raises(parsed, 1)
-                handle.getvalue()
-                #     :raises Error: oh no
-                #     :raises Exception: whoops
-                #
-
-            If there's nothing, do nothing::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {}
-
-                writer.raises(parsed, 1)
-                handle.getvalue()
-                #
-        """
-
-        if "raises" not in parsed:
-            return
-
-        for exception in sorted(parsed["raises"].keys()):
-            self.line(f":raises {exception}: {parsed['raises'][exception]}", indent)
-
-    def routine(self,
-        parsed:dict,    # parsed documentation possibly keyed by parameters, return, and/or raises
-        indent:int      # amount to indent by
-    ):
-        """
-        description: Writes documentation for that which can be excuted
-        usage: |
-            If there's parameters, return, and/or raises, write them, preceeding by a blank line::
-
-                import io
-                import sphinxter
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "parameters": [
-                        {
-                            "name": "small"
-                        },
-                        {
-                            "name": "big",
-                            "description": "stuff",
-                            "type": "int"
-                        }
-                    ],
-                    "return": {
-                        "description": "stuff",
-                        "type": "int"
-                    },
-                    "raises": {
-                        "Exception": "whoops",
-                        "Error": "oh no"
-                    }
-                }
-
-                writer.routine(parsed, 1)
-                handle.getvalue()
-                #
-                #     :param small: small
-                #     :param big: stuff
-                #     :type big: int
-                #     :return: stuff
-                #     :rtype: int
-                #     :raises Error: oh no
-                #     :raises Exception: whoops
-                #
-
-            If there's nothing, do nothing::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {}
-
-                writer.routine(parsed, 1)
-                handle.getvalue()
-                #
-        """
-
-        if (
-            "parameters" not in parsed and
-            "return" not in parsed and
-            "raises" not in parsed
-        ):
-            return
-
-        self.line()
-        self.parameters(parsed, indent)
-        self.returns(parsed, indent)
-        self.raises(parsed, indent)
-
-    def usage(self,
-        parsed:dict,    # parsed documentation possibly keyed by usage
-        indent:int      # amount to indent by
-    ):
-        """
-        description: Writes a usage block if present
-        usage: |
-            If there's usages, write with a header and proper blank lines::
-
-                import io
-                import yaml
-                import sphinxter
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                def example():
-                    \"""
-                    usage: |
-                        Here's a neat trick::
-
-                            print("Hello, world!")
-
-                        Cool, huh?
-                    \"""
-
-                parsed = yaml.safe_load(example.__doc__)
-                # {
-                #     "usage": "Here's a neat trick::\\n\\n    print(\\"Hello, world!\\")\\n\\nCool, huh?\\n"
-                # }
-
-                writer.usage(parsed, 1)
-                handle.getvalue()
-                #
-                #     **Usage**
-                #
-                #     Here's a neat trick::
-                #
-                #         print("Hello, world!")
-                #
-                #     Cool, huh?
-                #
-
-            If there's nothing, do nothing::
+import hashlib
+import inspect
 
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {}
-
-                writer.usage(parsed, 1)
-                handle.getvalue()
-                #
-        """
+from sphinxter.source import Source
+from sphinxter.memory import Memory
+from sphinxter.sections import Sections
 
-        if "usage" not in parsed:
-            return
+class Writer(Sections):
+    """
+    description: Class for writing out documents (rst)
+    document: writer
+    """
 
-        self.line("**Usage**", indent, before=True, after=True)
-        self.lines(parsed["usage"].rstrip(), indent)
+    fragments = None # fragments written last time, keyed by hash, while dumping with a store
+    rendered = None  # fragments written this time, keyed by hash, while dumping with a store
+    store = None    # Store of the fragments of each document kept between runs, None to not keep any
+    """
+    description: |
+        What's written for each function, class, and module is kept as a fragment, keyed by a hash of
+        its parsed documentation and how much it's indented, so rewriting a document only renders the
+        resources that changed, and the rest is just joined together. The fragments of a document are
+        kept together, keyed by its path and the :any:`Writer.settings` they were written with, so
+        each document is a single lookup.
+    """
+    version = None  # version of sphinxter, looked up the first time it's needed
+    digests = {}    # digests of the source files of Writer classes and custom sections, keyed by class or function
 
     def function(self,
         parsed:dict,    # entire parsed documentation for a function
@@ -743,127 +148,7 @@ class Writer:
         """
 
         self.line(f".. function:: {parsed['name']}{parsed['signature']}", indent, before=True)
-
-        self.description(parsed, indent+1)
-        self.routine(parsed, indent+1)
-        self.usage(parsed, indent+1)
-
-    def attribute(self,
-        parsed:dict,    # parsed documentation for an attribute
-        indent:int      # amount to indent by
-    ):
-        """
-        description: Writes attribute content, preceeded by a blank line
-        usage: |
-            If there's just a name::
-
-                import io
-                import sphinxter
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "name": "small"
-                }
-
-                writer.attribute(parsed, 1)
-                handle.getvalue()
-                #
-                #     .. attribute:: small
-                #
-
-            If there's a description and type::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "name": "big",
-                    "description": "stuff",
-                    "type": "int"
-                }
-
-                writer.attribute(parsed, 1)
-                handle.getvalue()
-                #
-                #     .. attribute:: big
-                #         :type: int
-                #
-                #         stuff
-                #
-        """
-
-        self.line(f".. attribute:: {parsed['name']}", indent, before=True)
-
-        if "type" in parsed:
-            self.line(f":type: {self.types(parsed['type'])}", indent+1)
-
-        self.description(parsed, indent+1)
-
-    def attributes(self,
-        parsed:dict,    # parsed documentation possibly containing attributes
-        indent:int      # amount to indent by
-    ):
-        """
-        description: Writes attributes content if present
-        usage: |
-            If there's attributes::
-
-                import io
-                import sphinxter
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {
-                    "attributes": [
-                        {
-                            "name": "small"
-                        },
-                        {
-                            "name": "big",
-                            "description": "stuff",
-                            "type": "int"
-                        }
-                    ]
-                }
-
-                writer.attributes(parsed, indent=1)
-                handle.getvalue()
-                #
-                #     .. attribute:: small
-                #
-                #     .. attribute:: big
-                #         :type: int
-                #
-                #         stuff
-                #
-
-            If there's nothing, do nothing::
-
-                document = sphinxter.Document(None, "test.example", None, '    ')
-                handle = io.StringIO()
-
-                writer = sphinxter.Writer(document, handle)
-
-                parsed = {}
-
-                writer.attributes(parsed, 1)
-                handle.getvalue()
-                #
-        """
-        if "attributes" not in parsed:
-            return
-
-        for attribute in parsed["attributes"]:
-            self.attribute(attribute, indent)
+        self.render("function", parsed, indent+1)
 
     def method(self,
         parsed:dict,    # entire parsed documentation for a method
@@ -1123,24 +408,19 @@ class Writer:
                 #
         """
 
-        self.line()
-        self.line(f".. {parsed['kind']}:: {parsed['name']}{parsed['signature']}", indent)
+        self.line(f".. {parsed['kind']}:: {parsed['name']}{parsed['signature']}", indent, before=True)
+        self.render("method", parsed, indent+1)
 
-        self.description(parsed, indent+1)
-        self.routine(parsed, indent+1)
-        self.usage(parsed, indent+1)
-
-    def definition(self,
-        parsed:dict,    # parsed documentation possibly keyed by definition
+    def methods(self,
+        parsed:dict,    # parsed documentation possibly containing methods
         indent:int      # amount to indent by
     ):
         """
-        description: Writes a definition block if present, for describing how to define a class, ie models
+        description: Writes methods content if present
         usage: |
-            If there's definition, write with a header and proper blank lines::
+            ::
 
                 import io
-                import yaml
                 import sphinxter
 
                 document = sphinxter.Document(None, "test.example", None, '    ')
@@ -1148,50 +428,112 @@ class Writer:
 
                 writer = sphinxter.Writer(document, handle)
 
-                class Example():
-                    \"""
-                    definition: |
-                        Try this::
+                parsed = {
+                    "methods": [
+                        {
+                            "name": "meth",
+                            "kind": "method",
+                            "signature": "()",
+                            "description": "Some method"
+                        }
+                    ]
+                }
 
-                            class Example:
-                                pass
-                    \"""
+                writer.methods(parsed, 1)
+                handle.getvalue()
+                #
+                #     .. method:: meth()
+                #
+                #         Some method
+                #
+        """
 
-                parsed = yaml.safe_load(Example.__doc__)
-                # {
-                #     "definition": "Try this::\\n\\n    class Example:\\n        pass\\n"
-                # }
+        for method in parsed.get("methods", []):
+            self.method(method, indent)
+
+    def classes(self,
+        parsed:dict,    # parsed documentation possibly containing classes
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes classes content if present
+        usage: |
+            ::
+
+                import io
+                import sphinxter
 
-                writer.definition(parsed, 1)
+                document = sphinxter.Document(None, "test.example", None, '    ')
+                handle = io.StringIO()
+
+                writer = sphinxter.Writer(document, handle)
+
+                parsed = {
+                    "classes": [
+                        {
+                            "name": "Inner",
+                            "kind": "class",
+                            "description": "Inner class",
+                            "methods": [],
+                            "classes": [],
+                            "exceptions": []
+                        }
+                    ]
+                }
+
+                writer.classes(parsed, 1)
                 handle.getvalue()
                 #
-                #     **Definition**
-                #
-                #     Try this::
+                #     .. class:: Inner
                 #
-                #         class Example:
-                #             pass
+                #         Inner class
                 #
+        """
+
+        for cls in parsed.get("classes", []):
+            self.cls(cls, indent)
+
+    def exceptions(self,
+        parsed:dict,    # parsed documentation possibly containing exceptions
+        indent:int      # amount to indent by
+    ):
+        """
+        description: Writes exceptions content if present
+        usage: |
+            ::
 
-            If there's nothing, do nothing::
+                import io
+                import sphinxter
 
                 document = sphinxter.Document(None, "test.example", None, '    ')
                 handle = io.StringIO()
 
                 writer = sphinxter.Writer(document, handle)
 
-                parsed = {}
+                parsed = {
+                    "exceptions": [
+                        {
+                            "name": "Oops",
+                            "kind": "exception",
+                            "description": "Inner exception",
+                            "methods": [],
+                            "classes": [],
+                            "exceptions": []
+                        }
+                    ]
+                }
 
-                writer.definition(parsed, 1)
+                writer.exceptions(parsed, 1)
                 handle.getvalue()
                 #
+                #     .. exception:: Oops
+                #
+                #         Inner exception
+                #
         """
 
-        if "definition" not in parsed:
-            return
-
-        self.line("**Definition**", indent, before=True, after=True)
-        self.lines(parsed["definition"].rstrip(), indent)
+        for cls in parsed.get("exceptions", []):
+            self.cls(cls, indent)
 
     def cls(self,
         parsed:dict,    # entire parsed documentation for a class
@@ -1630,21 +972,7 @@ class Writer:
         """
 
         self.line(f".. {parsed['kind']}:: {parsed['name']}{parsed.get('signature', '')}", indent, before=True)
-
-        self.description(parsed, indent+1)
-        self.definition(parsed, indent+1)
-        self.routine(parsed, indent+1)
-        self.usage(parsed, indent+1)
-        self.attributes(parsed, indent+1)
-
-        for method in parsed["methods"]:
-            self.method(method, indent+1)
-
-        for cls in parsed["classes"]:
-            self.cls(cls, indent+1)
-
-        for cls in parsed["exceptions"]:
-            self.cls(cls, indent+1)
+        self.render("class", parsed, indent+1)
 
     def module(self,
         parsed:dict,    # entire parsed documentation for a class
@@ -2125,10 +1453,7 @@ class Writer:
         """
 
         self.line(f".. module:: {parsed['name']}", indent, before=True)
-
-        self.description(parsed, indent)
-        self.usage(parsed, indent)
-        self.attributes(parsed, indent)
+        self.render("module", parsed, indent)
 
     def toctree(self,
         paths:'list[str]',  # paths for the toc
@@ -2167,9 +1492,112 @@ class Writer:
         for path in paths:
             self.line(path, indent+1)
 
+    def settings(self)->str:
+        """
+        description: |
+            Everything other than the documentation itself that changes what's written, the sphinxter
+            version, the Writer class and the source of it and everything it's made from, the indent,
+            and the plans and sections, along with the source of any custom ones
+        """
+
+        if Writer.version is None:
+            Writer.version = Memory.version()
+
+        classes = [writer for writer in type(self).__mro__ if issubclass(writer, Sections)]
+        emitters = {section: f"{emitter.__module__}.{emitter.__qualname__}" for section, emitter in self.emitters.items()}
+
+        return "\n".join([
+            Writer.version,
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            *[self.source(resource) for resource in classes + list(self.emitters.values())],
+            repr(self.document.indent),
+            repr(self.plans),
+            repr(emitters)
+        ])
+
+    @classmethod
+    def source(cls,
+        resource    # class or function
+    )->str:
+        """
+        description: |
+            Digest of the source file of a class or function, so editing it changes the :any:`Writer.settings`,
+            looked up once for each
+        return: hex SHA-256 digest, empty if the source can't be found
+        """
+
+        digest = cls.digests.get(resource)
+
+        if digest is None:
+
+            try:
+                path = inspect.getsourcefile(resource)
+            except TypeError:
+                path = None
+
+            digest = cls.digests[resource] = Source.digest(path) or ""
+
+        return digest
+
+    def fragment(self,
+        kind:str,       # kind of resource, module, function, class, or exception
+        parsed:dict,    # parsed documentation
+        indent:int=0    # amount to indent by
+    ):
+        """
+        description: |
+            Writes a module, function, or class, reusing what was written last time if dumping with
+            a :any:`Writer.store` and its documentation and indent haven't changed
+        usage: |
+            With a store, the second time the same document's written, nothing's rendered again::
+
+                import io
+                import tempfile
+                import unittest.mock
+                import sphinxter
+
+                document = sphinxter.Document("docs/source/index.rst", "test.example", None, '    ')
+                document.add("test.example", "function", {"name": "func", "signature": "()"}, 0)
+
+                with unittest.mock.patch.object(sphinxter.Writer, "store", sphinxter.Store(tempfile.mkdtemp())):
+
+                    first = io.StringIO()
+                    sphinxter.Writer(document, first).dump()
+
+                    with unittest.mock.patch.object(sphinxter.Writer, "function") as function:
+                        second = io.StringIO()
+                        sphinxter.Writer(document, second).dump()
+
+                function.call_count
+                # 0
+
+                second.getvalue() == first.getvalue()
+                # True
+        """
+
+        write = self.module if kind == "module" else self.function if kind == "function" else self.cls
+
+        if self.rendered is None:
+            write(parsed, indent)
+            return
+
+        key = hashlib.sha256(f"{kind}\n{indent}\n{parsed!r}".encode()).hexdigest()
+        text = self.fragments.get(key)
+
+        if text is None:
+
+            start = len(self.buffer)
+            write(parsed, indent)
+
+            text = "".join(self.buffer[start:])
+            del self.buffer[start:]
+
+        self.buffer.append(text)
+        self.rendered[key] = text
+
     def dump(self):
         """
-        description: Writes out an entire document
+        description: Writes out an entire document, rendering it all first so it's written out at once
         usage: |
             Give the entire test.example module::
 
@@ -2743,29 +2171,47 @@ class Writer:
                 #
         """
 
-        self.line(".. created by sphinxter")
-        self.line(".. default-domain:: py")
+        self.buffer = []
+
+        if self.store is not None:
+            key = hashlib.sha256(f"{self.settings()}\n{self.document.path}".encode()).hexdigest()
+            self.fragments = self.store.get(key, {})
+            self.rendered = {}
+
+        try:
+            self.line(".. created by sphinxter")
+            self.line(".. default-domain:: py")
+
+            self.line(self.document.title, before=True)
+            self.line('=' * len(self.document.title))
+
+            if self.document.toctree:
+                self.toctree(self.document.toctree)
+
+            module = None
+
+            for index in sorted(self.document.contents.keys()):
+                for content in self.document.contents[index]:
 
-        self.line(self.document.title, before=True)
-        self.line('=' * len(self.document.title))
+                    if content.kind == "module":
+                        self.fragment("module", content.parsed)
+                        module = content.module
+                    elif module != content.module:
+                        module = content.module
+                        self.line(f".. currentmodule:: {module}", before=True)
 
-        if self.document.toctree:
-            self.toctree(self.document.toctree)
+                    if content.kind in ["function", "class", "exception"]:
+                        self.fragment(content.kind, content.parsed)
 
-        module = None
+            self.file.write("".join(self.buffer))
 
-        for index in sorted(self.document.contents.keys()):
-            for content in self.document.contents[index]:
+            # only keeping what was used this time, so fragments of what's changed don't pile up
 
-                if content.kind == "module":
-                    self.module(content.parsed)
-                    module = content.module
-                elif module != content.module:
-                    module = content.module
-                    self.line(f".. currentmodule:: {module}", before=True)
+            if self.rendered is not None and self.rendered != self.fragments:
+                self.store.set(key, self.rendered)
 
-                if content.kind == "function":
-                    self.function(content.parsed)
+        finally:
 
-                if content.kind in ["class", "exception"]:
-                    self.cls(content.parsed)
+            self.buffer = None
+            self.fragments = None
+            self.rendered = None
@@ -18,8 +18,18 @@ setup(
     package_dir = {'': 'lib'},
     py_modules = [
         'sphinxter',
+        'sphinxter.cache',
+        'sphinxter.source',
+        'sphinxter.parser',
+        'sphinxter.parsed',
+        'sphinxter.signatures',
+        'sphinxter.registry',
+        'sphinxter.memory',
         'sphinxter.reader',
+        'sphinxter.static',
+        'sphinxter.timings',
         'sphinxter.document',
+        'sphinxter.sections',
         'sphinxter.writer',
         'sphinxter.unittest'
     ],
@@ -1,16 +1,67 @@
+import os
+import pickle
+import sys
+import tempfile
 import unittest
 import unittest.mock
 
 import sphinxter
+import sphinxter.unittest
 from test import example
 import test.test_sphinxter.test_reader
 import test.test_sphinxter.test_writer
 
 
+class TestSettings(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def test___init__(self):
+
+        settings = sphinxter.Sphinxter.Settings(jobs=2)
+
+        self.assertEqual(settings.jobs, 2)
+        self.assertIsNone(settings.cache)
+        self.assertEqual(settings.__dict__, {"jobs": 2})
+
+        with self.assertRaisesRegex(TypeError, "unknown setting 'job'"):
+            sphinxter.Sphinxter.Settings(job=2)
+
+        with self.assertRaises(TypeError):
+            sphinxter.Sphinxter.Settings(__init__=None)
+
+        self.assertEqual(pickle.loads(pickle.dumps(settings)).jobs, 2)
+
+        self.assertSphinxter(sphinxter.Sphinxter.Settings)
+
+
 class TestSphinxter(unittest.TestCase):
 
     maxDiff = None
 
+    def setUp(self):
+
+        sphinxter.Reader.reset()
+
+        # reading sets these for everything after, so put them back however a test leaves them
+
+        for cls, name in [
+            (sphinxter.Registry, "owners"),
+            (sphinxter.Registry, "reading"),
+            (sphinxter.Memory, "store"),
+            (sphinxter.Memory, "files"),
+            (sphinxter.Writer, "store"),
+            (sphinxter.Source, "timings")
+        ]:
+            self.addCleanup(setattr, cls, name, getattr(cls, name))
+
+    def assertDocuments(self, expected, actual):
+
+        self.assertEqual(list(actual.documents.keys()), list(expected.documents.keys()))
+
+        for path, document in expected.documents.items():
+            self.assertEqual(sphinxter.Sphinxter.render(actual.documents[path]), sphinxter.Sphinxter.render(document))
+
     def test___init__(self):
 
         # defaults
@@ -21,16 +72,41 @@ class TestSphinxter(unittest.TestCase):
         self.assertEqual(instance.base, "docs/source")
         self.assertEqual(instance.indent, '    '
         )
+        self.assertIsNone(instance.settings.cache)
+        self.assertEqual(instance.settings.cache_size, 100*1024*1024)
+        self.assertIsNone(instance.settings.jobs)
+        self.assertFalse(instance.settings.discover)
+        self.assertIsNone(instance.settings.include)
+        self.assertIsNone(instance.settings.exclude)
+        self.assertIsNone(instance.settings.owners)
+        self.assertFalse(instance.settings.compact)
+        self.assertFalse(instance.settings.timed)
+        self.assertIsNone(instance.timings)
 
         # values
 
-        instance = sphinxter.Sphinxter("people", "stuff", "things", "stuffins", "thingies")
+        instance = sphinxter.Sphinxter(
+            "people", "stuff", "things", "stuffins", "thingies",
+            cache="cachey", cache_size=7, jobs=2, discover=True, include=["in"], exclude=["ex"], owners=["own"], compact=True, timed=True
+        )
 
         self.assertEqual(instance.modules, ["people"])
         self.assertEqual(instance.titles, "stuff")
         self.assertEqual(instance.toctree, "things")
         self.assertEqual(instance.base, "stuffins")
         self.assertEqual(instance.indent, "thingies")
+        self.assertEqual(instance.settings.cache, "cachey")
+        self.assertEqual(instance.settings.cache_size, 7)
+        self.assertEqual(instance.settings.jobs, 2)
+        self.assertTrue(instance.settings.discover)
+        self.assertEqual(instance.settings.include, ["in"])
+        self.assertEqual(instance.settings.exclude, ["ex"])
+        self.assertEqual(instance.settings.owners, ["own"])
+        self.assertTrue(instance.settings.compact)
+        self.assertTrue(instance.settings.timed)
+
+        with self.assertRaises(TypeError):
+            sphinxter.Sphinxter("people", job=2)
 
     def test_document(self):
 
@@ -103,6 +179,129 @@ class TestSphinxter(unittest.TestCase):
         self.assertEqual(instance.documents["full"].contents[10][0].kind, "thingies")
         self.assertEqual(instance.documents["full"].contents[10][0].parsed, parsed)
 
+    def test_submodules(self):
+
+        self.assertEqual(sphinxter.Sphinxter.submodules(sphinxter), [
+            "sphinxter",
+            "sphinxter.cache",
+            "sphinxter.document",
+            "sphinxter.memory",
+            "sphinxter.parsed",
+            "sphinxter.parser",
+            "sphinxter.reader",
+            "sphinxter.registry",
+            "sphinxter.sections",
+            "sphinxter.signatures",
+            "sphinxter.source",
+            "sphinxter.static",
+            "sphinxter.timings",
+            "sphinxter.unittest",
+            "sphinxter.writer"
+        ])
+
+        self.assertEqual(sphinxter.Sphinxter.submodules(sphinxter, include=["sphinxter", "*.*er"], exclude=["*.reader"]), [
+            "sphinxter",
+            "sphinxter.parser",
+            "sphinxter.writer"
+        ])
+
+        self.assertEqual(sphinxter.Sphinxter.submodules(example), ["test.example"])
+        self.assertEqual(sphinxter.Sphinxter.submodules(example, exclude=["test.*"]), [])
+
+    def test_load(self):
+
+        self.assertEqual(sphinxter.Sphinxter.load("test.example", False), ([test.test_sphinxter.test_reader.TestReader.MODULE], {}, None))
+        self.assertIsNone(sphinxter.Memory.store)
+
+        self.assertEqual(sphinxter.Sphinxter.load(example.__file__, True)[0][0]["name"], "example")
+
+        sphinxter.Reader.reset()
+
+        parseds, _, timings = sphinxter.Sphinxter.load("test.example", False, sphinxter.Sphinxter.Settings(timed=True))
+
+        self.assertEqual(parseds, [test.test_sphinxter.test_reader.TestReader.MODULE])
+        self.assertIsInstance(timings, sphinxter.Timings)
+        self.assertIn(("method", "test.example.Complex.meth"), timings.resources)
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            sphinxter.Sphinxter.load("test.example", False, sphinxter.Sphinxter.Settings(cache=directory, cache_size=1024*1024))
+
+            self.assertEqual(sphinxter.Memory.store.path, directory)
+            self.assertEqual(sphinxter.Memory.store.size, 1024*1024)
+            self.assertEqual(sphinxter.Memory.store.stats()["entries"], 1)
+
+        sphinxter.Registry.symbols.set("sphinxter.reader.Reader", "sphinxter.Reader")
+
+        parseds, symbols, _ = sphinxter.Sphinxter.load("sphinxter.reader", False, sphinxter.Sphinxter.Settings(owners=["sphinxter"]), ["sphinxter.reader"])
+
+        self.assertEqual(sphinxter.Registry.owners, ["sphinxter"])
+        self.assertEqual(sphinxter.Registry.reading, ["sphinxter.reader"])
+        self.assertEqual(parseds[0]["references"], [])
+        self.assertEqual(symbols, {
+            "sphinxter.cache.Cache": "sphinxter.reader.Cache",
+            "sphinxter.memory.Memory": "sphinxter.reader.Memory",
+            "sphinxter.parsed.Parsed": "sphinxter.reader.Parsed",
+            "sphinxter.parser.Parser": "sphinxter.reader.Parser",
+            "sphinxter.reader.Reader": "sphinxter.reader.Reader",
+            "sphinxter.registry.Registry": "sphinxter.reader.Registry",
+            "sphinxter.signatures.Signatures": "sphinxter.reader.Signatures",
+            "sphinxter.source.Source": "sphinxter.reader.Source"
+        })
+
+    def test_prepare(self):
+
+        sphinxter.Parser.parse("a: 1")
+
+        instance = sphinxter.Sphinxter(example, owners=["test"], timed=True)
+        instance.documents["index"] = None
+        instance.prepare()
+
+        self.assertEqual(instance.documents, {})
+
+        self.assertEqual(sphinxter.Parser.parses.stats()["entries"], 0)
+        self.assertIsNone(sphinxter.Memory.store)
+        self.assertIsNone(sphinxter.Writer.store)
+        self.assertEqual(sphinxter.Registry.owners, ["test"])
+        self.assertIs(sphinxter.Source.timings, instance.timings)
+
+    def test_sources(self):
+
+        self.assertEqual(sphinxter.Sphinxter([example, "test/example.py"]).sources(), [
+            (example, False),
+            ("test/example.py", True)
+        ])
+
+        self.assertEqual(sphinxter.Sphinxter(sphinxter, discover=True, include=["*.cache"]).sources(), [
+            ("sphinxter.cache", False)
+        ])
+
+    def test_reading(self):
+
+        self.assertEqual(sphinxter.Sphinxter.reading([(sphinxter, False), ("test.example", False), ("test/example.py", True)]), [
+            "sphinxter",
+            "test.example"
+        ])
+
+    def test_walk(self):
+
+        self.assertEqual(
+            [(module, kind) for module, kind, _ in sphinxter.Sphinxter.walk(example, False)],
+            [(module, kind) for module, kind, _ in sphinxter.Sphinxter.walk("test.example", False)]
+        )
+
+        self.assertEqual(
+            [(module, kind) for module, kind, _ in sphinxter.Sphinxter.walk(example.__file__, True)],
+            [("example", "module"), ("example", "function"), ("example", "class"), ("example", "exception")]
+        )
+
+    def test_collect(self):
+
+        instance = sphinxter.Sphinxter(example)
+        instance.collect(sphinxter.Sphinxter.walk(example, False))
+
+        self.assertEqual([content.kind for content in instance.documents["index"].contents[0]], ["module", "function", "class", "exception"])
+
     def test_read(self):
 
         instance = sphinxter.Sphinxter(example)
@@ -111,7 +310,10 @@ class TestSphinxter(unittest.TestCase):
 
         self.assertEqual(instance.documents["index"].contents[0][0].module, "test.example")
         self.assertEqual(instance.documents["index"].contents[0][0].kind, "module")
-        self.assertEqual(instance.documents["index"].contents[0][0].parsed, test.test_sphinxter.test_reader.TestReader.MODULE)
+        self.assertEqual(instance.documents["index"].contents[0][0].parsed, {
+            name: value for name, value in test.test_sphinxter.test_reader.TestReader.MODULE.items()
+            if name not in ["functions", "classes", "exceptions"]
+        })
 
         self.assertEqual(instance.documents["index"].contents[0][1].module, "test.example")
         self.assertEqual(instance.documents["index"].contents[0][1].kind, "function")
@@ -128,23 +330,573 @@ class TestSphinxter(unittest.TestCase):
         self.assertEqual(len(instance.documents["index"].contents), 1)
         self.assertEqual(len(instance.documents["index"].contents[0]), 4)
 
-    @unittest.mock.patch('sphinxter.open', new_callable=unittest.mock.mock_open)
-    def test_write(self, mock_open):
+        self.assertEqual(sphinxter.Source.files.misses, 1)
+
+    def test_read_cache(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            instance = sphinxter.Sphinxter(example, cache=directory)
+            instance.read()
+
+            self.assertEqual(sphinxter.Memory.store.misses, 1)
+            self.assertEqual(sphinxter.Writer.store.path, os.path.join(directory, "fragments"))
+
+            instance = sphinxter.Sphinxter(example, cache=directory)
+            instance.read()
+
+            self.assertEqual(sphinxter.Memory.store.hits, 1)
+            self.assertEqual(sphinxter.Source.files.misses, 0)
+            self.assertEqual(instance.documents["index"].contents[0][0].parsed, {
+            name: value for name, value in test.test_sphinxter.test_reader.TestReader.MODULE.items()
+            if name not in ["functions", "classes", "exceptions"]
+        })
 
         instance = sphinxter.Sphinxter(example)
+        instance.read()
+
+        self.assertIsNone(sphinxter.Memory.store)
+        self.assertIsNone(sphinxter.Writer.store)
+
+    def test_read_jobs(self):
+
+        modules = [sphinxter.document, example, example.__file__, sphinxter.cache]
+
+        serial = sphinxter.Sphinxter(modules)
+        serial.read()
+
+        parallel = sphinxter.Sphinxter(modules, jobs=2)
+        parallel.read()
 
+        self.assertDocuments(serial, parallel)
+
+    def test_read_discover(self):
+
+        listed = sphinxter.Sphinxter([
+            sphinxter, sphinxter.cache, sphinxter.document, sphinxter.memory, sphinxter.parsed, sphinxter.parser,
+            sphinxter.registry, sphinxter.sections, sphinxter.signatures, sphinxter.source, sphinxter.static,
+            sphinxter.timings, sphinxter.writer
+        ])
+        listed.read()
+
+        serial = sphinxter.Sphinxter(sphinxter, discover=True, exclude=["*.reader", "*.unittest"])
+        serial.read()
+
+        parallel = sphinxter.Sphinxter(sphinxter, discover=True, exclude=["*.reader", "*.unittest"], jobs=2)
+        parallel.read()
+
+        self.assertDocuments(listed, serial)
+        self.assertDocuments(listed, parallel)
+
+    def test_read_owners(self):
+
+        modules = [sphinxter, sphinxter.cache, sphinxter.document, sphinxter.reader, example]
+
+        serial = sphinxter.Sphinxter(modules, owners=["sphinxter"])
+        serial.read()
+
+        self.assertEqual(sphinxter.Registry.owners, ["sphinxter"])
+
+        documents = {
+            path: [(content.module, content.kind, content.parsed["name"]) for content in document.contents[0]]
+            for path, document in serial.documents.items()
+        }
+
+        self.assertEqual(sphinxter.Registry.reading, [
+            "sphinxter", "sphinxter.cache", "sphinxter.document", "sphinxter.reader", "test.example"
+        ])
+
+        self.assertEqual(documents["index"], [
+            ("sphinxter", "module", "sphinxter"),
+            ("sphinxter.cache", "module", "sphinxter.cache"),
+            ("sphinxter.document", "module", "sphinxter.document"),
+            ("sphinxter.reader", "module", "sphinxter.reader"),
+            ("test.example", "module", "test.example"),
+            ("test.example", "function", "func"),
+            ("test.example", "class", "Complex"),
+            ("test.example", "exception", "Basic")
+        ])
+
+        # documented where they're defined, unless that module isn't being read
+
+        self.assertEqual(documents["reader"], [("sphinxter.reader", "class", "Reader")])
+        self.assertEqual(documents["cache"], [("sphinxter.cache", "class", "Cache"), ("sphinxter.cache", "class", "Store")])
+        self.assertEqual(documents["writer"], [("sphinxter", "class", "Writer")])
+
+        parallel = sphinxter.Sphinxter(modules, owners=["sphinxter"], jobs=2)
+        parallel.read()
+
+        self.assertDocuments(serial, parallel)
+
+        index = sphinxter.Sphinxter.render(serial.documents["index"])
+
+        self.assertIn("""
+**References**
+
+* :py:class:`Cache <sphinxter.cache.Cache>`
+* :py:class:`Document <sphinxter.document.Document>`
+* :py:class:`Reader <sphinxter.reader.Reader>`
+* :py:class:`Store <sphinxter.cache.Store>`
+
+.. module:: sphinxter.cache
+""", index)
+
+        self.assertIn("""
+.. module:: sphinxter.reader
+
+Module for reading documentation from resources
+
+**References**
+
+* :py:class:`Cache <sphinxter.cache.Cache>`
+* :py:class:`Memory <sphinxter.Memory>`
+* :py:class:`Parsed <sphinxter.Parsed>`
+* :py:class:`Parser <sphinxter.Parser>`
+* :py:class:`Registry <sphinxter.Registry>`
+* :py:class:`Signatures <sphinxter.Signatures>`
+* :py:class:`Source <sphinxter.Source>`
+
+.. module:: test.example
+""", index)
+
+        sphinxter.Sphinxter(example).read()
+
+        self.assertIsNone(sphinxter.Registry.owners)
+
+    def test_read_timed(self):
+
+        modules = [example, example.__file__]
+
+        instance = sphinxter.Sphinxter(modules)
+        instance.read()
+
+        self.assertIsNone(instance.timings)
+        self.assertIsNone(instance.report())
+
+        instance = sphinxter.Sphinxter(modules, timed=True)
         instance.read()
-        instance.write()
 
-        mock_open.assert_called_once_with("docs/source/index.rst", "w", encoding="utf-8")
+        self.assertIs(sphinxter.Source.timings, instance.timings)
+
+        report = instance.report(3)
+
+        self.assertEqual(len(report["slowest"]), 3)
+        self.assertEqual(
+            [timing["own"] for timing in report["slowest"]],
+            sorted([timing["own"] for timing in report["resources"]], reverse=True)[:3]
+        )
+
+        resources = {(timing["kind"], timing["name"]): timing for timing in report["resources"]}
+
+        self.assertIn(("module", "test.example"), resources)
+        self.assertIn(("module", "example"), resources)
+        self.assertIn(("class", "test.example.Complex"), resources)
+        self.assertIn(("method", "test.example.Complex.meth"), resources)
+        self.assertIn(("function", "test.example.func"), resources)
+        self.assertEqual(resources[("class", "test.example.Complex")]["count"], 1)
+        self.assertIn("signature", resources[("method", "test.example.Complex.meth")]["phases"])
+        self.assertGreaterEqual(resources[("class", "test.example.Complex")]["seconds"], resources[("method", "test.example.Complex.meth")]["seconds"])
+
+        # loaded lazily, after the module was read, but still part of its total
+
+        self.assertEqual(resources[("module", "test.example")]["count"], 1)
+        self.assertGreaterEqual(resources[("module", "test.example")]["seconds"], resources[("class", "test.example.Complex")]["seconds"])
+
+        for phase in ["source", "tokenize", "ast", "yaml", "signature"]:
+            self.assertIn(phase, report["phases"])
+
+        # parallel
+
+        parallel = sphinxter.Sphinxter(modules, jobs=2, timed=True)
+        parallel.read()
+
+        self.assertEqual(
+            sorted(key for key in parallel.timings.resources),
+            sorted(key for key in instance.timings.resources)
+        )
+
+    def test_read_compact(self):
+
+        modules = [sphinxter, sphinxter.document, example, example.__file__]
+
+        plain = sphinxter.Sphinxter(modules)
+        plain.read()
+
+        compact = sphinxter.Sphinxter(modules, compact=True)
+        compact.read()
+
+        self.assertIsInstance(compact.documents["index"].contents[0][0].parsed, sphinxter.Compact)
+
+        self.assertDocuments(plain, compact)
+
+    def test_read_static(self):
+
+        instance = sphinxter.Sphinxter(example.__file__)
+
+        instance.read()
+
+        self.assertEqual(instance.documents["index"].contents[0][0].module, "example")
+        self.assertEqual(instance.documents["index"].contents[0][0].kind, "module")
+        self.assertEqual(instance.documents["index"].contents[0][1].parsed, test.test_sphinxter.test_reader.TestReader.FUNCTION)
+        self.assertEqual(instance.documents["index"].contents[0][2].parsed, test.test_sphinxter.test_reader.TestReader.COMPLEX_CLASS)
+        self.assertEqual(instance.documents["index"].contents[0][3].parsed, test.test_sphinxter.test_reader.TestReader.BASIC_EXCEPTION)
+
+        self.assertEqual(len(instance.documents["index"].contents[0]), 4)
+
+    def test_save(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            path = os.path.join(directory, "index.rst")
+
+            self.assertTrue(sphinxter.Sphinxter.save(path, "text\n"))
 
-        self.assertEqual("\n" + "".join([call.args[0] for call in mock_open.return_value.write.mock_calls]), test.test_sphinxter.test_writer.TestWriter.EXAMPLE)
+            with open(path, "r", encoding="utf-8") as document:
+                self.assertEqual(document.read(), "text\n")
 
-    @unittest.mock.patch('sphinxter.open', new_callable=unittest.mock.mock_open)
-    def test_process(self, mock_open):
+            umask = os.umask(0o022)
+            os.umask(umask)
+
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o666 & ~umask)
+
+            os.chmod(path, 0o640)
+            os.utime(path, ns=(1000000000, 1000000000))
+
+            with unittest.mock.patch("tempfile.NamedTemporaryFile") as mock_temp:
+                self.assertFalse(sphinxter.Sphinxter.save(path, "text\n"))
+
+            mock_temp.assert_not_called()
+            self.assertEqual(os.stat(path).st_mtime_ns, 1000000000)
+
+            self.assertTrue(sphinxter.Sphinxter.save(path, "changed\n"))
+
+            with open(path, "r", encoding="utf-8") as document:
+                self.assertEqual(document.read(), "changed\n")
+
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o640)
+            self.assertEqual(os.listdir(directory), ["index.rst"])
+
+            with unittest.mock.patch("os.replace", side_effect=OSError("nope")):
+                with self.assertRaises(OSError):
+                    sphinxter.Sphinxter.save(path, "failed\n")
+
+            with open(path, "r", encoding="utf-8") as document:
+                self.assertEqual(document.read(), "changed\n")
+
+            self.assertEqual(os.listdir(directory), ["index.rst"])
+
+    def test_render(self):
 
         instance = sphinxter.Sphinxter(example)
 
-        instance.process()
+        instance.read()
+
+        self.assertEqual("\n" + sphinxter.Sphinxter.render(instance.documents["index"]), test.test_sphinxter.test_writer.TestWriter.EXAMPLE)
+
+    def test_write(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            path = os.path.join(directory, "index.rst")
+
+            instance = sphinxter.Sphinxter(example, base=directory)
+
+            instance.read()
+
+            listener = unittest.mock.MagicMock()
+
+            with unittest.mock.patch.object(sphinxter.Source, "listeners", [listener]):
+                self.assertEqual(instance.write(), {"written": [path], "unchanged": []})
+
+            listener.assert_called_once_with("document", path)
+
+            with open(path, "r", encoding="utf-8") as document:
+                self.assertEqual("\n" + document.read(), test.test_sphinxter.test_writer.TestWriter.EXAMPLE)
+
+            os.utime(path, ns=(1000000000, 1000000000))
+
+            self.assertEqual(instance.write(), {"written": [], "unchanged": [path]})
+            self.assertEqual(os.stat(path).st_mtime_ns, 1000000000)
+
+            self.assertEqual(instance.write(drop=True), {"written": [], "unchanged": [path]})
+            self.assertEqual(instance.documents, {})
+
+    @unittest.mock.patch.object(sphinxter.Memory, "store", None)
+    @unittest.mock.patch.object(sphinxter.Writer, "store", None)
+    def test_write_cache(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            path = os.path.join(directory, "index.rst")
+
+            instance = sphinxter.Sphinxter(example, base=directory, cache=os.path.join(directory, "cache"))
+
+            instance.read()
+            instance.write()
+
+            self.assertEqual(sphinxter.Writer.store.misses, 1)
+            self.assertEqual(sphinxter.Writer.store.stats()["entries"], 1)
+
+            os.remove(path)
+
+            instance = sphinxter.Sphinxter(example, base=directory, cache=os.path.join(directory, "cache"))
+            instance.read()
+
+            with unittest.mock.patch.object(sphinxter.Writer, "cls") as mock_cls:
+                self.assertEqual(instance.write(), {"written": [path], "unchanged": []})
+
+            mock_cls.assert_not_called()
+
+            self.assertEqual(sphinxter.Writer.store.hits, 1)
+
+            with open(path, "r", encoding="utf-8") as document:
+                self.assertEqual("\n" + document.read(), test.test_sphinxter.test_writer.TestWriter.EXAMPLE)
+
+    def test_process(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            path = os.path.join(directory, "index.rst")
+
+            instance = sphinxter.Sphinxter(example, base=directory)
+
+            self.assertEqual(instance.process(), {"written": [path], "unchanged": []})
+            self.assertEqual(instance.documents, {})
+
+            with open(path, "r", encoding="utf-8") as document:
+                self.assertEqual("\n" + document.read(), test.test_sphinxter.test_writer.TestWriter.EXAMPLE)
+
+            self.assertEqual(instance.process(), {"written": [], "unchanged": [path]})
+
+    def test_stat(self):
+
+        stats = sphinxter.Sphinxter.stat(example, False)
+
+        self.assertEqual(list(stats.keys()), [example.__file__])
+        self.assertEqual(stats[example.__file__][1], os.stat(example.__file__).st_size)
+
+        self.assertEqual(sphinxter.Sphinxter.stat("test.example", False), stats)
+        self.assertEqual(sphinxter.Sphinxter.stat(example.__file__, True), stats)
+        self.assertIn(example.__file__, sphinxter.Sphinxter.stat(os.path.dirname(example.__file__), True))
+        self.assertEqual(sphinxter.Sphinxter.stat("nope.py", True), {"nope.py": None})
+
+    def test_rewrite(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            instance = sphinxter.Sphinxter(example, base=directory)
+            records = [list(instance.walk(example, False))]
+
+            written = instance.rewrite(records, {})
+
+            path = os.path.join(directory, "index.rst")
+
+            self.assertEqual(written, {path: test.test_sphinxter.test_writer.TestWriter.EXAMPLE[1:]})
+
+            with open(path, "r", encoding="utf-8") as document:
+                self.assertEqual(document.read(), written[path])
+
+            with unittest.mock.patch('sphinxter.open') as mock_open:
+                self.assertEqual(instance.rewrite(records, written), written)
+
+            mock_open.assert_not_called()
+
+    def test_reread(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            path = os.path.join(directory, "reread.py")
+
+            with open(path, "w", encoding="utf-8") as module:
+                module.write('"""\nReread\n"""\n')
+
+            instance = sphinxter.Sphinxter(path, base=directory)
+
+            module, records = instance.reread(path, True)
+
+            self.assertEqual(module, path)
+            self.assertEqual([(module, kind) for module, kind, _ in records], [("reread", "module")])
+
+            with open(path, "w", encoding="utf-8") as module:
+                module.write('"""\nReread\n"""\n\ndef func(:\n')
+
+            listener = unittest.mock.MagicMock()
+
+            with unittest.mock.patch("logging.warning") as mock_warning, \
+                 unittest.mock.patch.object(sphinxter.Source, "listeners", [listener]):
+
+                self.assertIsNone(instance.reread(path, True))
+
+            mock_warning.assert_called_once()
+            self.assertEqual(listener.call_args.args[:2], ("error", path))
+
+    def test_watch(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            with open(os.path.join(directory, "watched.py"), "w", encoding="utf-8") as module:
+                module.write('"""\nWatched\n"""\n\ndef func():\n    """\n    A func\n    """\n')
+
+            with open(os.path.join(directory, "unwatched.py"), "w", encoding="utf-8") as module:
+                module.write('"""\ndescription: Unwatched\ndocument: other\n"""\n')
+
+            sys.path.insert(0, directory)
+
+            try:
+
+                import watched
+                import unwatched
+
+                def edit(seconds):
+
+                    self.assertEqual(seconds, 0.1)
+
+                    # broken mid edit, then fixed
+
+                    if edit.count == 0:
+                        with open(os.path.join(directory, "watched.py"), "w", encoding="utf-8") as module:
+                            module.write('"""\nWatched\n"""\n\ndef func(:\n')
+
+                    if edit.count == 1:
+
+                        with open(os.path.join(directory, "index.rst"), "r", encoding="utf-8") as document:
+                            self.assertIn("A func", document.read())
+
+                        with open(os.path.join(directory, "watched.py"), "w", encoding="utf-8") as module:
+                            module.write('"""\nWatched\n"""\n\ndef func():\n    """\n    A changed func\n    """\n')
+
+                    edit.count += 1
+
+                edit.count = 0
+
+                listener = unittest.mock.MagicMock()
+
+                with unittest.mock.patch("time.sleep", side_effect=edit), \
+                     unittest.mock.patch("logging.warning") as mock_warning, \
+                     unittest.mock.patch.object(sphinxter.Source, "listeners", [listener]):
+
+                    instance = sphinxter.Sphinxter([watched, unwatched], base=directory)
+                    instance.watch(0.1, 3)
+
+                self.assertEqual(edit.count, 3)
+
+                mock_warning.assert_called_once()
+                self.assertEqual(mock_warning.call_args.args[:2], ("couldn't reread %s: %s", "watched"))
+
+                errors = [call.args for call in listener.mock_calls if call.args[0] == "error"]
+
+                self.assertEqual(len(errors), 1)
+                self.assertEqual(errors[0][1], "watched")
+                self.assertTrue(errors[0][2].startswith("SyntaxError: "))
+
+                self.assertEqual([call.args for call in listener.mock_calls if call.args[0] == "document"], [
+                    ("document", os.path.join(directory, "index.rst")),
+                    ("document", os.path.join(directory, "other.rst")),
+                    ("document", os.path.join(directory, "index.rst"))
+                ])
+
+                with open(os.path.join(directory, "index.rst"), "r", encoding="utf-8") as document:
+                    self.assertIn("A changed func", document.read())
+
+                self.assertIs(sys.modules["watched"], watched)
+                self.assertEqual(watched.func.__doc__.strip(), "A changed func")
+
+            finally:
+
+                sys.path.remove(directory)
+                sys.modules.pop("watched", None)
+                sys.modules.pop("unwatched", None)
+
+    def test_watch_reexported(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            os.makedirs(os.path.join(directory, "reexporting"))
+
+            with open(os.path.join(directory, "reexporting", "__init__.py"), "w", encoding="utf-8") as module:
+                module.write('"""\nReexporting\n"""\n\nfrom reexporting.sub import Thing\n')
+
+            with open(os.path.join(directory, "reexporting", "sub.py"), "w", encoding="utf-8") as module:
+                module.write('"""\nSub\n"""\n\nclass Thing:\n    """\n    Version one\n    """\n')
+
+            sys.path.insert(0, directory)
+
+            try:
+
+                import reexporting
+
+                def edit(seconds):
+
+                    # only the submodule defining what the package documents changes
+
+                    if edit.count == 0:
+                        with open(os.path.join(directory, "reexporting", "sub.py"), "w", encoding="utf-8") as module:
+                            module.write('"""\nSub\n"""\n\nclass Thing:\n    """\n    Version two\n    """\n')
+
+                    edit.count += 1
+
+                edit.count = 0
+
+                with unittest.mock.patch("time.sleep", side_effect=edit):
+
+                    instance = sphinxter.Sphinxter(reexporting, base=directory)
+                    instance.watch(0.1, 2)
+
+                with open(os.path.join(directory, "index.rst"), "r", encoding="utf-8") as document:
+                    text = document.read()
+
+                self.assertIn("Version two", text)
+                self.assertNotIn("Version one", text)
+                self.assertEqual(sys.modules["reexporting.sub"].Thing.__doc__.strip(), "Version two")
+
+                self.assertIsNone(sphinxter.Memory.files)
+
+            finally:
+
+                sys.path.remove(directory)
+                sys.modules.pop("reexporting", None)
+                sys.modules.pop("reexporting.sub", None)
+
+    def test_reload(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            os.makedirs(os.path.join(directory, "reloading"))
+
+            with open(os.path.join(directory, "reloading", "__init__.py"), "w", encoding="utf-8") as module:
+                module.write('"""\nReloading\n"""\n\nfrom reloading.sub import Thing\n')
+
+            with open(os.path.join(directory, "reloading", "sub.py"), "w", encoding="utf-8") as module:
+                module.write('class Thing:\n    """\n    Version one\n    """\n')
+
+            sys.path.insert(0, directory)
+
+            try:
+
+                import reloading
+
+                sphinxter.Registry.symbols.set("reloading.sub.Thing", "reloading.Thing")
+
+                with open(os.path.join(directory, "reloading", "sub.py"), "w", encoding="utf-8") as module:
+                    module.write('class Thing:\n    """\n    Version two\n    """\n')
+
+                reloaded = set()
+
+                self.assertIs(sphinxter.Sphinxter.reload(reloading, [os.path.join(directory, "reloading", "sub.py")], reloaded), reloading)
+
+                self.assertEqual(reloaded, {"reloading", "reloading.sub"})
+                self.assertEqual(reloading.Thing.__doc__.strip(), "Version two")
+                self.assertIsNone(sphinxter.Registry.symbols.get("reloading.sub.Thing"))
+
+                # already reloaded this time, so not again
+
+                with unittest.mock.patch("importlib.reload") as mock_reload:
+                    sphinxter.Sphinxter.reload(reloading, [os.path.join(directory, "reloading", "sub.py")], reloaded)
+
+                mock_reload.assert_not_called()
+
+            finally:
 
-        self.assertEqual("\n" + "".join([call.args[0] for call in mock_open.return_value.write.mock_calls]), test.test_sphinxter.test_writer.TestWriter.EXAMPLE)
+                sys.path.remove(directory)
+                sys.modules.pop("reloading", None)
+                sys.modules.pop("reloading.sub", None)
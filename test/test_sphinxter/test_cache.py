@@ -0,0 +1,297 @@
+import unittest
+import unittest.mock
+import sphinxter.unittest
+
+import os
+import pickle
+import tempfile
+
+import sphinxter
+
+class TestCache(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def test___init__(self):
+
+        cache = sphinxter.Cache()
+
+        self.assertIsNone(cache.size)
+        self.assertEqual(cache.entries, {})
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+        self.assertEqual(cache.evictions, 0)
+
+        self.assertEqual(sphinxter.Cache(7).size, 7)
+
+        self.assertSphinxter(sphinxter.Cache)
+
+    def test_get(self):
+
+        cache = sphinxter.Cache()
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("a", 1), 1)
+        self.assertEqual(cache.misses, 2)
+
+        cache.entries["a"] = 2
+
+        self.assertEqual(cache.get("a"), 2)
+        self.assertEqual(cache.hits, 1)
+
+        cache = sphinxter.Cache(2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        self.assertEqual(list(cache.entries.keys()), ["b", "a"])
+
+        self.assertSphinxter(sphinxter.Cache.get)
+
+    def test_set(self):
+
+        cache = sphinxter.Cache()
+
+        cache.set("a", 1)
+
+        self.assertEqual(cache.entries, {"a": 1})
+
+        cache = sphinxter.Cache(2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        cache.set("c", 4)
+
+        self.assertEqual(cache.entries, {"a": 3, "c": 4})
+        self.assertEqual(cache.evictions, 1)
+
+    def test_clear(self):
+
+        cache = sphinxter.Cache(1)
+
+        cache.set("a", 1)
+        cache.set("b", 1)
+        cache.get("a")
+        cache.get("b")
+        cache.clear()
+
+        self.assertEqual(cache.size, 1)
+        self.assertEqual(cache.entries, {})
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+        self.assertEqual(cache.evictions, 0)
+
+        self.assertSphinxter(sphinxter.Cache.clear)
+
+    def test_stats(self):
+
+        cache = sphinxter.Cache()
+
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        self.assertEqual(cache.stats(), {
+            "entries": 1,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0
+        })
+
+
+class TestStore(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "store")
+
+    def tearDown(self):
+
+        self.directory.cleanup()
+
+    def test___init__(self):
+
+        store = sphinxter.Store(self.path, 7)
+
+        self.assertEqual(store.path, self.path)
+        self.assertEqual(store.size, 7)
+        self.assertEqual(store.hits, 0)
+        self.assertEqual(store.misses, 0)
+        self.assertEqual(store.evictions, 0)
+        self.assertIsNone(store.sizes)
+        self.assertEqual(store.total, 0)
+        self.assertTrue(os.path.isdir(self.path))
+
+        self.assertSphinxter(sphinxter.Store)
+
+    def test_entry(self):
+
+        self.assertEqual(sphinxter.Store(self.path).entry("a"), os.path.join(self.path, "a.pickle"))
+
+    def test_get(self):
+
+        store = sphinxter.Store(self.path)
+
+        self.assertIsNone(store.get("a"))
+        self.assertEqual(store.get("a", 1), 1)
+        self.assertEqual(store.misses, 2)
+
+        with open(store.entry("a"), "wb") as file:
+            pickle.dump({"b": 2}, file)
+
+        os.utime(store.entry("a"), ns=(0, 0))
+
+        self.assertEqual(store.get("a"), {"b": 2})
+        self.assertEqual(store.hits, 1)
+        self.assertGreater(os.stat(store.entry("a")).st_mtime_ns, 0)
+
+        with open(store.entry("c"), "wb") as file:
+            file.write(b"nope")
+
+        self.assertIsNone(store.get("c"))
+        self.assertEqual(store.misses, 3)
+
+        # pickled from what's no longer there
+
+        for stale in [b"cnope\nNope\n.", b"cos\nNope\n.", b"\x80\x09.", b"cbuiltins\nint\n(S'x'\nS'y'\nS'z'\ntR."]:
+
+            with open(store.entry("c"), "wb") as file:
+                file.write(stale)
+
+            self.assertIsNone(store.get("c"))
+
+        self.assertEqual(store.misses, 7)
+
+        # evicted by another process after it was read
+
+        with unittest.mock.patch("os.utime", side_effect=FileNotFoundError):
+            self.assertEqual(store.get("a"), {"b": 2})
+
+        self.assertEqual(store.hits, 2)
+
+        # retrieving marks it as most recently used
+
+        store = sphinxter.Store(self.path, 1000)
+        store.set("d", 4)
+        store.set("e", 5)
+        store.get("d")
+
+        self.assertEqual(list(store.sizes)[-2:], [store.entry("e"), store.entry("d")])
+
+    def test_set(self):
+
+        store = sphinxter.Store(self.path)
+
+        store.set("a", {"b": 2})
+
+        with open(store.entry("a"), "rb") as file:
+            self.assertEqual(pickle.load(file), {"b": 2})
+
+        self.assertEqual(os.listdir(self.path), ["a.pickle"])
+
+        store = sphinxter.Store(self.path, 300)
+
+        store.set("b", "b" * 100)
+        store.set("c", "c" * 100)
+        store.get("b")
+        store.set("d", "d" * 100)
+
+        self.assertEqual(sorted(os.listdir(self.path)), ["b.pickle", "d.pickle"])
+        self.assertEqual(store.evictions, 2)
+        self.assertEqual(store.total, sum(os.path.getsize(path) for path in store.sizes))
+
+        # replacing an entry only counts its new size
+
+        store.set("d", "d")
+
+        self.assertEqual(store.total, sum(os.path.getsize(path) for path in store.sizes))
+
+        # evicted by another process already
+
+        os.remove(store.entry("b"))
+        store.set("e", "e" * 300)
+
+        self.assertEqual(sorted(os.listdir(self.path)), ["e.pickle"])
+        self.assertEqual(store.evictions, 3)
+
+    def test_tally(self):
+
+        store = sphinxter.Store(self.path, 300)
+
+        store.set("a", 1)
+
+        with open(os.path.join(self.path, "b.pickle"), "wb") as file:
+            pickle.dump("b" * 100, file)
+
+        os.utime(store.entry("a"), ns=(2, 2))
+        os.utime(store.entry("b"), ns=(1, 1))
+
+        store = sphinxter.Store(self.path, 300)
+        store.tally()
+
+        self.assertEqual(list(store.sizes), [store.entry("b"), store.entry("a")])
+        self.assertEqual(store.total, os.path.getsize(store.entry("a")) + os.path.getsize(store.entry("b")))
+
+    def test_entries(self):
+
+        store = sphinxter.Store(self.path)
+
+        store.set("a", 1)
+        store.set("b", 2)
+
+        with open(os.path.join(self.path, "c.tmp"), "w", encoding="utf-8") as file:
+            file.write("c")
+
+        os.utime(store.entry("a"), ns=(2, 2))
+        os.utime(store.entry("b"), ns=(1, 1))
+
+        self.assertEqual([path for path, _ in store.entries()], [store.entry("b"), store.entry("a")])
+
+        # evicted by another process while scanning
+
+        found = unittest.mock.MagicMock()
+        found.name = "d.pickle"
+        found.stat.side_effect = FileNotFoundError
+
+        with unittest.mock.patch("os.scandir", return_value=[found]):
+            self.assertEqual(store.entries(), [])
+
+    def test_clear(self):
+
+        store = sphinxter.Store(self.path)
+
+        store.set("a", 1)
+        store.get("a")
+        store.get("b")
+
+        with unittest.mock.patch("os.remove", side_effect=FileNotFoundError):
+            store.clear()
+
+        store.clear()
+
+        self.assertEqual(store.stats(), {
+            "entries": 0,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0
+        })
+
+    def test_stats(self):
+
+        store = sphinxter.Store(self.path)
+
+        store.set("a", 1)
+        store.get("a")
+        store.get("b")
+
+        self.assertEqual(store.stats(), {
+            "entries": 1,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0
+        })
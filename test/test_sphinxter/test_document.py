@@ -15,6 +15,8 @@ class TestContent(unittest.TestCase):
         self.assertEqual(content.kind, "stuff")
         self.assertEqual(content.parsed, "things")
 
+        self.assertFalse(hasattr(content, "__dict__"))
+
 
 class TestDocument(unittest.TestCase):
 
@@ -0,0 +1,146 @@
+import unittest
+import unittest.mock
+import sphinxter.unittest
+
+import os
+import hashlib
+import tempfile
+
+import sphinxter
+import test.example
+
+class TestMemory(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        sphinxter.Reader.reset()
+
+    def test_version(self):
+
+        directory = os.path.dirname(sphinxter.reader.__file__)
+        digests = [sphinxter.Source.digest(os.path.join(directory, name)) for name in sorted(os.listdir(directory)) if name.endswith(".py")]
+
+        self.assertEqual(sphinxter.Memory.version(), hashlib.sha256("\n".join(digests).encode()).hexdigest())
+
+        # any module changing changes it
+
+        digest = sphinxter.Source.digest
+
+        with unittest.mock.patch.object(sphinxter.Source, "digest", side_effect=lambda path: "changed" if path.endswith("static.py") else digest(path)):
+            self.assertNotEqual(sphinxter.Memory.version(), hashlib.sha256("\n".join(digests).encode()).hexdigest())
+
+        with unittest.mock.patch("importlib.metadata.version", return_value="1.2.3"):
+            self.assertEqual(sphinxter.Memory.version(), "1.2.3")
+
+    def test_key(self):
+
+        key = sphinxter.Memory.key("test.example", test.example.__file__)
+
+        self.assertEqual(len(key), 64)
+        self.assertEqual(sphinxter.Memory.key("test.example", test.example.__file__), key)
+        self.assertNotEqual(sphinxter.Memory.key("example", test.example.__file__), key)
+        self.assertIsNone(sphinxter.Memory.key("nope", "nope.py"))
+
+        with unittest.mock.patch.object(sphinxter.Memory, "release", None), \
+             unittest.mock.patch.object(sphinxter.Memory, "version", return_value="1.2.3") as mock_version:
+
+            self.assertNotEqual(sphinxter.Memory.key("test.example", test.example.__file__), key)
+            sphinxter.Memory.key("example", test.example.__file__)
+
+            self.assertEqual(sphinxter.Memory.release, "1.2.3")
+            mock_version.assert_called_once_with()
+
+    def test_recall(self):
+
+        self.assertIsNone(sphinxter.Memory.recall("a", None))
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            with unittest.mock.patch.object(sphinxter.Memory, "store", sphinxter.Store(directory)), \
+                 unittest.mock.patch.object(sphinxter.Memory, "files", {}):
+
+                self.assertIsNone(sphinxter.Memory.recall("a", "a"))
+                self.assertIsNone(sphinxter.Source.loaded)
+
+                files = {test.example.__file__: sphinxter.Source.digest(test.example.__file__)}
+
+                sphinxter.Memory.store.set("a", {"files": files, "parsed": {"b": 1}, "symbols": {}})
+                self.assertEqual(sphinxter.Memory.recall("a", "a"), {"b": 1})
+                self.assertEqual(sphinxter.Memory.files, {"a": {test.example.__file__}})
+
+                sphinxter.Memory.store.set("a", {"files": {test.example.__file__: "nope"}, "parsed": {"b": 1}, "symbols": {}})
+                self.assertIsNone(sphinxter.Memory.recall("a", "a"))
+
+                # linked as if just read
+
+                parsed = {"name": "a", "functions": [{"name": "f"}], "classes": [], "exceptions": [], "references": []}
+                sphinxter.Memory.store.set("a", {"files": files, "parsed": parsed, "symbols": {"b.f": "a.f"}})
+                sphinxter.Registry.symbols.set("b.f", "b.f")
+
+                self.assertEqual(sphinxter.Memory.recall("a", "a")["references"], [{"name": "f", "kind": "function", "reference": "b.f"}])
+
+    def test_loading(self):
+
+        with sphinxter.Memory.loading(None):
+            self.assertIsNone(sphinxter.Source.loaded)
+
+        with sphinxter.Memory.loading("a"):
+            self.assertEqual(sphinxter.Source.loaded, set())
+
+        self.assertIsNone(sphinxter.Source.loaded)
+
+        with unittest.mock.patch.object(sphinxter.Memory, "files", {}):
+            with sphinxter.Memory.loading(None):
+                self.assertEqual(sphinxter.Source.loaded, set())
+
+        # reading failing doesn't leave it keeping track
+
+        with self.assertRaises(ValueError):
+            with sphinxter.Memory.loading("a"):
+                raise ValueError("nope")
+
+        self.assertIsNone(sphinxter.Source.loaded)
+
+    def test_remember(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            with unittest.mock.patch.object(sphinxter.Memory, "store", sphinxter.Store(directory)):
+
+                sphinxter.Memory.remember("a", "a", {"b": 1})
+                self.assertEqual(sphinxter.Memory.store.stats()["entries"], 0)
+
+                with sphinxter.Memory.loading(None):
+                    sphinxter.Memory.remember("a", None, {"b": 1})
+
+                self.assertEqual(sphinxter.Memory.store.stats()["entries"], 0)
+
+                sphinxter.Registry.symbols.set("c.d", "a.d")
+
+                with sphinxter.Memory.loading("a"):
+                    sphinxter.Source.loaded.add(test.example.__file__)
+                    sphinxter.Memory.remember("a", "a", {"b": 1})
+
+                self.assertEqual(sphinxter.Memory.store.get("a"), {
+                    "files": {test.example.__file__: sphinxter.Source.digest(test.example.__file__)},
+                    "parsed": {"b": 1},
+                    "symbols": {"c.d": "a.d"}
+                })
+
+                with sphinxter.Memory.loading("c"):
+                    sphinxter.Source.loaded.add("nope.py")
+                    sphinxter.Memory.remember("c", "c", {"b": 1})
+
+                self.assertIsNone(sphinxter.Memory.store.get("c"))
+
+            # keeping track of files, without storing
+
+            with unittest.mock.patch.object(sphinxter.Memory, "files", {}):
+
+                with sphinxter.Memory.loading(None):
+                    sphinxter.Source.loaded.add(test.example.__file__)
+                    sphinxter.Memory.remember("a", None, {"b": 1})
+
+                self.assertEqual(sphinxter.Memory.files, {"a": {test.example.__file__}})
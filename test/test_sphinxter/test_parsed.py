@@ -0,0 +1,289 @@
+import unittest
+import unittest.mock
+import sphinxter.unittest
+
+import copy
+import json
+import pickle
+import collections.abc
+
+import sphinxter
+import test.example
+
+class TestParsed(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        self.reads = 0
+
+    def read(self):
+
+        self.reads += 1
+
+        return {"description": "Lazy", "children": [sphinxter.Parsed({"name": "child"}, lambda: {"kind": "child"})]}
+
+    def test___init__(self):
+
+        parsed = sphinxter.Parsed()
+
+        self.assertEqual(dict.items(parsed), {}.items())
+        self.assertIsNone(parsed.loader)
+
+        parsed = sphinxter.Parsed({"name": "lazy"}, self.read)
+
+        self.assertEqual(dict.items(parsed), {"name": "lazy"}.items())
+        self.assertEqual(parsed.loader, self.read)
+
+        self.assertSphinxter(sphinxter.Parsed)
+
+    def test_load(self):
+
+        parsed = sphinxter.Parsed({"name": "lazy"}, self.read)
+
+        self.assertIs(parsed.load(), parsed)
+        self.assertIs(parsed.load(), parsed)
+        self.assertIsNone(parsed.loader)
+        self.assertEqual(self.reads, 1)
+        self.assertEqual(dict(dict.items(parsed))["description"], "Lazy")
+
+    def test_resolve(self):
+
+        parsed = sphinxter.Parsed({"name": "lazy"}, self.read)
+
+        value = [{"parsed": parsed}]
+
+        self.assertIs(sphinxter.Parsed.resolve(value), value)
+        self.assertIsNone(parsed.loader)
+        self.assertIsNone(dict.__getitem__(parsed, "children")[0].loader)
+
+    def test_reading(self):
+
+        parsed = sphinxter.Parsed({"name": "lazy"}, self.read)
+
+        self.assertEqual(parsed["name"], "lazy")
+        self.assertEqual(parsed.get("name"), "lazy")
+        self.assertIn("name", parsed)
+        self.assertEqual(self.reads, 0)
+
+        self.assertNotIn("usage", parsed)
+        self.assertEqual(self.reads, 1)
+
+        for reading in [
+            lambda parsed: parsed["description"],
+            lambda parsed: parsed.get("nope", "nope"),
+            lambda parsed: "description" in parsed,
+            lambda parsed: list(parsed),
+            len,
+            repr,
+            lambda parsed: parsed.keys(),
+            lambda parsed: parsed.values(),
+            lambda parsed: parsed.items(),
+            lambda parsed: parsed.copy(),
+            lambda parsed: parsed == {}
+        ]:
+            parsed = sphinxter.Parsed({"name": "lazy"}, self.read)
+            reading(parsed)
+            self.assertIsNone(parsed.loader)
+
+        parsed = sphinxter.Parsed({"name": "lazy"}, self.read)
+
+        self.assertEqual(len(parsed), 3)
+        self.assertEqual(list(parsed.keys()), ["name", "description", "children"])
+        self.assertEqual(json.loads(json.dumps(parsed)), {"name": "lazy", "description": "Lazy", "children": [{"name": "child", "kind": "child"}]})
+        self.assertEqual({**parsed}["description"], "Lazy")
+        self.assertEqual(repr(parsed), "{'name': 'lazy', 'description': 'Lazy', 'children': [{'name': 'child', 'kind': 'child'}]}")
+        self.assertIsInstance(parsed.copy(), sphinxter.Parsed)
+
+    def test_comparing(self):
+
+        self.assertEqual(sphinxter.Parsed({"name": "lazy"}, self.read), {"name": "lazy", "description": "Lazy", "children": [{"name": "child", "kind": "child"}]})
+        self.assertEqual({"name": "lazy", "description": "Lazy", "children": [{"name": "child", "kind": "child"}]}, sphinxter.Parsed({"name": "lazy"}, self.read))
+        self.assertEqual(sphinxter.Parsed({"name": "lazy"}, self.read), sphinxter.Parsed({"name": "lazy"}, self.read))
+        self.assertNotEqual(sphinxter.Parsed({"name": "lazy"}, self.read), {"name": "lazy"})
+
+        with self.assertRaises(TypeError):
+            hash(sphinxter.Parsed())
+
+    def test_changing(self):
+
+        for changing in [
+            lambda parsed: parsed.__setitem__("usage", "use"),
+            lambda parsed: parsed.__delitem__("description"),
+            lambda parsed: parsed.pop("description"),
+            lambda parsed: parsed.popitem(),
+            lambda parsed: parsed.setdefault("usage", "use"),
+            lambda parsed: parsed.update(usage="use")
+        ]:
+            parsed = sphinxter.Parsed({"name": "lazy"}, self.read)
+            changing(parsed)
+            self.assertIsNone(parsed.loader)
+
+        parsed = sphinxter.Parsed({"name": "lazy"}, self.read)
+        parsed["description"] = "Changed"
+        self.assertEqual(parsed["description"], "Changed")
+
+        parsed = sphinxter.Parsed({"name": "lazy"}, self.read)
+        parsed.clear()
+        self.assertEqual(parsed, {})
+        self.assertEqual(self.reads, 7)
+
+    def test_pickle(self):
+
+        parsed = pickle.loads(pickle.dumps(sphinxter.Parsed({"name": "lazy"}, self.read)))
+
+        self.assertIsInstance(parsed, sphinxter.Parsed)
+        self.assertIsNone(parsed.loader)
+        self.assertEqual(parsed["description"], "Lazy")
+
+    def test_deepcopy(self):
+
+        original = sphinxter.Parsed({"name": "lazy"}, self.read)
+
+        first = copy.deepcopy(original)
+        second = copy.deepcopy(original)
+
+        self.assertEqual(self.reads, 0)
+        self.assertEqual(first["name"], "lazy")
+
+        first["children"][0]["name"] = "changed"
+
+        self.assertEqual(second["children"][0]["name"], "child")
+        self.assertEqual(original["children"][0]["name"], "child")
+        self.assertEqual(self.reads, 1)
+
+        third = copy.deepcopy(original)
+
+        self.assertIsNone(third.loader)
+        self.assertEqual(third, original)
+        self.assertIsNot(third["children"], original["children"])
+
+class TestCompact(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    PARSED = {
+        "name": "func",
+        "parameters": [
+            {
+                "name": "a",
+                "description": "The a"
+            },
+            {
+                "name": "b",
+                "description": "The b"
+            }
+        ],
+        "return": {
+            "type": ["str", "None"]
+        }
+    }
+
+    def test_shape(self):
+
+        shape = sphinxter.Compact.shape(("name", "kind"))
+
+        self.assertIs(sphinxter.Compact.shape(("name", "kind")), shape)
+        self.assertIsNot(sphinxter.Compact.shape(("kind", "name")), shape)
+        self.assertTrue(issubclass(shape, sphinxter.Compact))
+        self.assertEqual(shape.fields, ("name", "kind"))
+        self.assertEqual(shape.positions, {"name": 0, "kind": 1})
+
+    def test_make(self):
+
+        compact = sphinxter.Compact.make(("name", "kind"), ("a", "b"))
+
+        self.assertIs(type(compact), sphinxter.Compact.shape(("name", "kind")))
+        self.assertEqual(compact.data, ("a", "b"))
+        self.assertEqual(compact["kind"], "b")
+
+    def test_compact(self):
+
+        compact = sphinxter.Compact.compact(self.PARSED)
+
+        self.assertIsInstance(compact, sphinxter.Compact)
+        self.assertIsInstance(compact["parameters"][0], sphinxter.Compact)
+        self.assertIs(type(compact["parameters"][0]), type(compact["parameters"][1]))
+        self.assertEqual(compact["return"]["type"], ["str", "None"])
+        self.assertEqual(sphinxter.Compact.compact("a"), "a")
+
+        parsed = sphinxter.Parsed({"name": "lazy"}, lambda: {"kind": "function"})
+
+        self.assertEqual(sphinxter.Compact.compact(parsed).keys(), ("name", "kind"))
+
+        self.assertSphinxter(sphinxter.Compact)
+
+    def test_dict(self):
+
+        parsed = sphinxter.Compact.compact(self.PARSED).dict()
+
+        self.assertIs(type(parsed), dict)
+        self.assertIs(type(parsed["parameters"][0]), dict)
+        self.assertEqual(parsed, self.PARSED)
+        self.assertEqual(json.loads(json.dumps(parsed)), self.PARSED)
+
+    def test_expand(self):
+
+        self.assertEqual(sphinxter.Compact.expand([sphinxter.Compact.compact({"a": 1}), 2]), [{"a": 1}, 2])
+
+    def test_mapping(self):
+
+        compact = sphinxter.Compact.compact(self.PARSED)
+
+        self.assertEqual(compact["name"], "func")
+        self.assertEqual(compact.get("name"), "func")
+        self.assertIsNone(compact.get("nope"))
+        self.assertEqual(compact.get("nope", 1), 1)
+        self.assertIn("return", compact)
+        self.assertNotIn("usage", compact)
+        self.assertNotIn(0, compact)
+        self.assertEqual(list(compact), ["name", "parameters", "return"])
+        self.assertEqual(len(compact), 3)
+        self.assertEqual(compact.keys(), ("name", "parameters", "return"))
+        self.assertEqual(compact.values()[0], "func")
+        self.assertEqual(compact.items()[0], ("name", "func"))
+        self.assertEqual(dict(compact)["name"], "func")
+        self.assertIsInstance(compact, collections.abc.Mapping)
+        self.assertNotIsInstance(compact, tuple)
+        self.assertFalse(hasattr(compact, "__dict__"))
+        self.assertTrue(sphinxter.Compact.compact({"a": None}))
+        self.assertFalse(sphinxter.Compact.compact({}))
+
+        with self.assertRaises(KeyError):
+            compact["usage"]
+
+        # not a dict, so json has to be given one
+
+        with self.assertRaises(TypeError):
+            json.dumps(compact)
+
+        self.assertEqual(json.loads(json.dumps(compact.dict())), self.PARSED)
+
+    def test_comparing(self):
+
+        compact = sphinxter.Compact.compact(self.PARSED)
+
+        self.assertEqual(compact, self.PARSED)
+        self.assertEqual(self.PARSED, compact)
+        self.assertEqual(compact, sphinxter.Compact.compact(copy.deepcopy(self.PARSED)))
+        self.assertNotEqual(compact, {"name": "func"})
+        self.assertNotEqual(compact, sphinxter.Compact.compact({"name": "func"}))
+        self.assertNotEqual(compact, ("func",))
+        self.assertEqual(sphinxter.Parsed({"name": "func"}, lambda: {"kind": "function"}), sphinxter.Compact.compact({"name": "func", "kind": "function"}))
+        self.assertEqual(sphinxter.Compact.compact({"name": "func", "kind": "function"}), sphinxter.Parsed({"name": "func"}, lambda: {"kind": "function"}))
+
+        with self.assertRaises(TypeError):
+            hash(compact)
+
+    def test___repr__(self):
+
+        self.assertEqual(repr(sphinxter.Compact.compact({"a": [{"b": 1}]})), "{'a': [{'b': 1}]}")
+
+    def test___reduce__(self):
+
+        compact = sphinxter.Compact.compact(self.PARSED)
+
+        self.assertEqual(pickle.loads(pickle.dumps(compact)), compact)
+        self.assertIs(type(pickle.loads(pickle.dumps(compact))), type(compact))
+        self.assertEqual(copy.deepcopy(compact), compact)
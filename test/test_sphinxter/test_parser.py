@@ -0,0 +1,282 @@
+import unittest
+import unittest.mock
+import sphinxter.unittest
+
+import sys
+import ast
+import tokenize
+
+import yaml
+
+import sphinxter
+import test.example
+
+class TestParser(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        sphinxter.Reader.reset()
+
+    def test_parse(self):
+
+        # None
+
+        self.assertEqual(sphinxter.Parser.parse(None), {})
+
+        # str
+
+        self.assertEqual(sphinxter.Parser.parse("ya"), {
+            "description": "ya"
+        })
+
+        # dict
+
+        self.assertEqual(sphinxter.Parser.parse("a: 1"), {
+            "a": 1
+        })
+
+        # interned
+
+        parsed = sphinxter.Parser.parse("type: st" + "r")
+
+        self.assertIs(list(parsed.keys())[0], sys.intern("type"))
+        self.assertIs(parsed["type"], sys.intern("str"))
+
+        # memoized
+
+        sphinxter.Reader.reset()
+
+        parsed = sphinxter.Parser.parse("a: [1]")
+        parsed["a"].append(2)
+
+        self.assertEqual(sphinxter.Parser.parse("a: [1]"), {
+            "a": [1]
+        })
+
+        self.assertEqual(sphinxter.Parser.parses.stats(), {
+            "entries": 1,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0
+        })
+
+        with unittest.mock.patch.object(sphinxter.Parser.parses, "size", 1):
+            sphinxter.Parser.parse("b")
+            self.assertEqual(sphinxter.Parser.parses.evictions, 1)
+
+        self.assertSphinxter(sphinxter.Parser.parse)
+
+    PARITY = [
+        "",
+        "   ",
+        "ya",
+        "The id of the record",
+        "It's great",
+        "a [b] {c}, d",
+        "café au lait",
+        "yes",
+        "No",
+        "null",
+        "True",
+        "1",
+        "1.5",
+        "2022-01-01",
+        "a: 1",
+        "a:",
+        "a # b",
+        "- a",
+        "a\nb",
+        "\n    A plain function\n    ",
+        "'quoted'",
+        "Translate lines escaped with: !",
+        "a: !!str 1",
+        "- !\n- b"
+    ]
+
+    def test_parse_parity(self):
+
+        def parse(docstring):
+
+            if docstring:
+                parsed = yaml.safe_load(docstring)
+                if isinstance(parsed, str):
+                    parsed = {"description": parsed}
+            else:
+                parsed = {}
+
+            return parsed
+
+        docstrings = list(self.PARITY)
+
+        file = sphinxter.Source.file(test.example)
+
+        for node in ast.walk(file.parse()):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                docstrings.append(node.value)
+
+        for parsed in file.tokenize():
+            if parsed.type == tokenize.COMMENT:
+                docstrings.append(parsed.string[2:].rstrip())
+
+        for loader in [yaml.SafeLoader, getattr(yaml, "CSafeLoader", yaml.SafeLoader)]:
+            sphinxter.Parser.parses.clear()
+            with unittest.mock.patch.object(sphinxter.Parser, "loader", loader):
+                for docstring in docstrings:
+                    self.assertEqual(sphinxter.Parser.parse(docstring), parse(docstring), docstring)
+
+    def test_intern(self):
+
+        parsed = sphinxter.Parser.intern({
+            "na" + "me": "fu" + "nc",
+            "description": "The fu" + "nc",
+            "parameters": {
+                "a" + "b": {
+                    "type": ["st" + "r", None]
+                }
+            }
+        })
+
+        self.assertEqual(parsed, {
+            "name": "func",
+            "description": "The func",
+            "parameters": {
+                "ab": {
+                    "type": ["str", None]
+                }
+            }
+        })
+
+        self.assertIs(list(parsed.keys())[0], sys.intern("name"))
+        self.assertIs(parsed["name"], sys.intern("func"))
+        self.assertIs(list(parsed["parameters"].keys())[0], sys.intern("ab"))
+        self.assertIs(parsed["parameters"]["ab"]["type"][0], sys.intern("str"))
+
+        self.assertSphinxter(sphinxter.Parser.intern)
+
+    def test_prose(self):
+
+        self.assertTrue(sphinxter.Parser.prose("The id of the record"))
+        self.assertTrue(sphinxter.Parser.prose("It's great"))
+
+        self.assertFalse(sphinxter.Parser.prose(""))
+        self.assertFalse(sphinxter.Parser.prose("1 thing"))
+        self.assertFalse(sphinxter.Parser.prose("a: 1"))
+        self.assertFalse(sphinxter.Parser.prose("a # b"))
+        self.assertFalse(sphinxter.Parser.prose("a\nb"))
+        self.assertFalse(sphinxter.Parser.prose("a\tb"))
+        self.assertFalse(sphinxter.Parser.prose("Null"))
+        self.assertFalse(sphinxter.Parser.prose("off"))
+
+        self.assertSphinxter(sphinxter.Parser.prose)
+
+    def test_update(self):
+
+        # empty
+
+        primary = {}
+        secondary = {
+            "name": "foole",
+            "description": "sure",
+            "b": 2
+        }
+
+        sphinxter.Parser.update(primary, secondary)
+
+        self.assertEqual(primary, {
+            "name": "foole",
+            "description": "sure",
+            "b": 2
+        })
+
+        # full
+
+        primary = {
+            "name": "fool",
+            "description": "Ya",
+            "a": 1,
+            "b": 1
+        }
+        secondary = {
+            "name": "foole",
+            "description": "sure",
+            "b": 2
+        }
+
+        sphinxter.Parser.update(primary, secondary, skip="name")
+
+        self.assertEqual(primary, {
+            "name": "fool",
+            "description": "Ya\n\nsure",
+            "a": 1,
+            "b": 2
+        })
+
+        self.assertSphinxter(sphinxter.Parser.update)
+
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
+    @unittest.mock.patch("logging.info")
+    def test_comments(self, mock_log):
+
+        self.assertEqual(sphinxter.Parser.comments(test.example.func), {
+            "a": {
+                "description": "The a"
+            },
+            "b": {
+                "description": "The b"
+            },
+            "args": {},
+            "kwargs": {
+                "a": 1,
+                "b": 2
+            }
+        })
+
+        mock_log.assert_has_calls([
+            unittest.mock.call("%s parameter: %s", "func", "a"),
+            unittest.mock.call("%s parameter: %s", "func", "b"),
+            unittest.mock.call("%s parameter: %s", "func", "kwargs")
+        ])
+
+        for name in sphinxter.Parser.comments(test.example.func):
+            self.assertIs(name, sys.intern(name))
+
+        def func(
+            a,              # The a
+            b:bool=False    # The b
+        ):
+            pass
+
+        self.assertEqual(sphinxter.Parser.comments(func), {
+            "a": {
+                "description": "The a"
+            },
+            "b": {
+                "description": "The b"
+            }
+        })
+
+        self.assertSphinxter(sphinxter.Parser.comments)
+
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
+    @unittest.mock.patch("logging.info")
+    def test_remarks(self, mock_log):
+
+        self.assertEqual(sphinxter.Parser.remarks("func", {"a": "The a", "b": None, "c": "a: 1"}), {
+            "a": {
+                "description": "The a"
+            },
+            "b": {},
+            "c": {
+                "a": 1
+            }
+        })
+
+        mock_log.assert_has_calls([
+            unittest.mock.call("%s parameter: %s", "func", "a"),
+            unittest.mock.call("%s parameter: %s", "func", "c")
+        ])
+
+        self.assertSphinxter(sphinxter.Parser.remarks)
+
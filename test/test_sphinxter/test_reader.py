@@ -2,21 +2,102 @@ import unittest
 import unittest.mock
 import sphinxter.unittest
 
+import os
+import abc
+import sys
 import inspect
+import tempfile
+import importlib
 
 import sphinxter
+import sphinxter.cache
+import sphinxter.reader
 import test.example
 
-class Complex:
+class Slotted:
+    """
+    Slotted
+    """
 
-    class Subber:
+    __slots__ = {
+        "a": "The a",
+        "b": None
+    }
+
+class Tupled:
+
+    __slots__ = ("a",)
 
-        pass
+class Abstract(abc.ABC):
+    """
+    Abstract
+    """
+
+    a = None # The a
+
+Abstract.b = None
 
 class TestReader(sphinxter.unittest.TestCase):
 
     maxDiff = None
 
+    def setUp(self):
+
+        sphinxter.Reader.reset()
+
+    def test_reset(self):
+
+        sphinxter.Source.file(test.example)
+        sphinxter.Reader.reset()
+
+        self.assertEqual(sphinxter.Source.files.stats(), {
+            "entries": 0,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0
+        })
+
+        self.assertEqual(sphinxter.Parser.parses.stats()["entries"], 0)
+        self.assertEqual(sphinxter.Reader.classes.stats()["entries"], 0)
+
+    def test_prune(self):
+
+        sphinxter.Reader.reset()
+
+        sphinxter.Reader.cls(test.example.Complex).load()
+        sphinxter.Reader.routine(test.example.func).load()
+        sphinxter.Reader.routine(sphinxter.Source.digest).load()
+
+        self.assertEqual(sphinxter.Reader.classes.stats()["entries"], 3)
+        self.assertEqual(sphinxter.Signatures.signatures.stats()["entries"], 6)
+        self.assertEqual(sphinxter.Source.files.stats()["entries"], 2)
+
+        # only files that have changed
+
+        sphinxter.Reader.prune()
+
+        self.assertEqual(sphinxter.Reader.classes.stats()["entries"], 3)
+        self.assertEqual(sphinxter.Source.files.stats()["entries"], 2)
+
+        key = next(key for key in sphinxter.Source.files.entries if key[0].endswith("example.py"))
+        changed = (key[0], 0, key[2])
+        sphinxter.Source.files.set(changed, sphinxter.Source.files.get(key))
+
+        sphinxter.Reader.prune()
+
+        self.assertIn(key, sphinxter.Source.files.entries)
+        self.assertNotIn(changed, sphinxter.Source.files.entries)
+
+        # and what's of the module
+
+        sphinxter.Reader.prune("test.example")
+
+        self.assertEqual(sphinxter.Reader.classes.stats()["entries"], 0)
+        self.assertEqual(sphinxter.Signatures.annotated.stats()["entries"], 1)
+        self.assertEqual([key[0] for key in sphinxter.Signatures.signatures.entries], [sphinxter.Source.digest])
+
+        self.assertSphinxter(sphinxter.Reader.prune)
+
     BASIC_SOURCE = """class Basic(Exception):
     \"""
     Basic Exception
@@ -101,6 +182,7 @@ class TestReader(sphinxter.unittest.TestCase):
 
         self.assertSphinxter(sphinxter.Reader.update)
 
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
     @unittest.mock.patch("logging.info")
     def test_comments(self, mock_log):
 
@@ -300,6 +382,7 @@ class TestReader(sphinxter.unittest.TestCase):
         "usage": "Do some cool stuff::\n\n    like this\n\nIt's great\n"
     }
 
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
     @unittest.mock.patch("logging.info")
     def test_routine(self, mock_log):
 
@@ -315,6 +398,50 @@ class TestReader(sphinxter.unittest.TestCase):
 
         self.assertSphinxter(sphinxter.Reader.routine)
 
+    def test_routine_lazy(self):
+
+        parsed = sphinxter.Reader.routine(inspect.getattr_static(test.example.Complex, 'classy'), method=True)
+
+        self.assertIsInstance(parsed, sphinxter.Parsed)
+        self.assertEqual(parsed["name"], "classy")
+        self.assertEqual(parsed["kind"], "classmethod")
+        self.assertEqual(sphinxter.Source.files.misses + sphinxter.Parser.parses.misses, 0)
+
+        self.assertEqual(parsed["signature"], "(a, b, *args, **kwargs)")
+        self.assertEqual(sphinxter.Source.files.misses, 1)
+
+    def test_combine(self):
+
+        parsed = {"name": "func"}
+
+        self.assertIs(sphinxter.Reader.combine(
+            parsed,
+            ["a", "b"],
+            {"a": {"description": "The a"}},
+            {"parameters": {"b": {"type": "int"}}, "return": {"type": "str"}},
+            "description: Funky\nparameters:\n  a: More a\nreturn: Stuff"
+        ), parsed)
+
+        self.assertEqual(parsed, {
+            "name": "func",
+            "description": "Funky",
+            "parameters": [
+                {
+                    "name": "a",
+                    "description": "The a More a"
+                },
+                {
+                    "name": "b",
+                    "type": "int"
+                }
+            ],
+            "return": {
+                "description": "Stuff",
+                "type": "str"
+            }
+        })
+
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
     @unittest.mock.patch("logging.info")
     def test_attributes(self, mock_log):
 
@@ -356,6 +483,28 @@ class TestReader(sphinxter.unittest.TestCase):
 
         self.assertSphinxter(sphinxter.Reader.attributes)
 
+    def test_assignments(self):
+
+        file = sphinxter.Source.File("stuff.py", [
+            "a = 1 # The a\n",
+            "b = c = 2\n",
+            "\"\"\"\n",
+            "The b and c\n",
+            "\"\"\"\n"
+        ])
+
+        self.assertEqual(sphinxter.Reader.assignments(file, file.parse()), {
+            "a": {
+                "description": "The a"
+            },
+            "b": {
+                "description": "The b and c"
+            },
+            "c": {
+                "description": "The b and c"
+            }
+        })
+
     BASIC_EXCEPTION = {
         "name": "Basic",
         "kind": "exception",
@@ -437,6 +586,7 @@ class TestReader(sphinxter.unittest.TestCase):
         ]
     }
 
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
     @unittest.mock.patch("logging.info")
     def test_cls(self, mock_log):
 
@@ -448,6 +598,87 @@ class TestReader(sphinxter.unittest.TestCase):
 
         self.assertSphinxter(sphinxter.Reader.cls)
 
+    def test_cls_lazy(self):
+
+        parsed = sphinxter.Reader.cls(test.example.Complex)
+
+        self.assertEqual(parsed["name"], "Complex")
+        self.assertEqual(parsed["kind"], "class")
+        self.assertEqual(sphinxter.Source.files.misses + sphinxter.Parser.parses.misses, 0)
+
+        self.assertEqual(parsed, self.COMPLEX_CLASS)
+        self.assertIsNone(sphinxter.Reader.classes.get(test.example.Complex)[0].loader)
+
+        parsed = sphinxter.Reader.module(test.example)
+
+        self.assertIsNone(parsed["classes"][0].loader)
+        self.assertIsNotNone(parsed["functions"][0].loader)
+
+    def test_cls_slots(self):
+
+        self.assertEqual(sphinxter.Reader.cls(Slotted), {
+            "name": "Slotted",
+            "kind": "class",
+            "description": "Slotted",
+            "attributes": [
+                {
+                    "name": "a",
+                    "description": "The a"
+                },
+                {
+                    "name": "b"
+                }
+            ],
+            "methods": [],
+            "classes": [],
+            "exceptions": []
+        })
+
+        self.assertEqual(sphinxter.Reader.cls(Tupled)["attributes"], [{"name": "a"}])
+
+    def test_cls_attributes(self):
+
+        # only what's assigned in the class body, not what ABCMeta adds or what's set afterwards
+
+        self.assertIn("_abc_impl", Abstract.__dict__)
+        self.assertIn("b", Abstract.__dict__)
+
+        self.assertEqual(sphinxter.Reader.cls(Abstract)["attributes"], [{"name": "a", "description": "The a"}])
+
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
+    @unittest.mock.patch("logging.info")
+    def test_cls_memo(self, mock_log):
+
+        sphinxter.Reader.reset()
+
+        parsed = sphinxter.Reader.cls(test.example.Complex)
+        parsed["classes"][0]["name"] = "Changed"
+
+        self.assertEqual(sphinxter.Reader.cls(test.example.Complex), self.COMPLEX_CLASS)
+        self.assertEqual(sphinxter.Reader.cls(test.example.Complex.Subber), self.COMPLEX_CLASS["classes"][0])
+
+        self.assertEqual(sphinxter.Reader.classes.stats(), {
+            "entries": 3,
+            "hits": 2,
+            "misses": 3,
+            "evictions": 0
+        })
+
+        self.assertEqual([call.args for call in mock_log.mock_calls if call.args[0] == "class: %s"], [
+            ("class: %s", "Complex"),
+            ("class: %s", "Excepter"),
+            ("class: %s", "Subber")
+        ])
+
+        # files are still tracked for storing
+
+        with unittest.mock.patch.object(sphinxter.Source, "loaded", set()):
+
+            sphinxter.Reader.cls(test.example.Complex)
+            self.assertEqual(sphinxter.Source.loaded, {inspect.getsourcefile(test.example)})
+
+        self.assertIsNone(sphinxter.Source.loaded)
+
     MODULE = {
             "name": "test.example",
             "description": "mod me",
@@ -495,6 +726,7 @@ class TestReader(sphinxter.unittest.TestCase):
             "usage": "Do some cool stuff::\n\n    like this\n\nIt's great\n"
         }
 
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
     @unittest.mock.patch("logging.info")
     def test_module(self, mock_log):
 
@@ -503,3 +735,246 @@ class TestReader(sphinxter.unittest.TestCase):
         mock_log.assert_any_call("module: %s", "test.example")
 
         self.assertSphinxter(sphinxter.Reader.module)
+
+    def test_module_store(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            def write(name, text, mtime):
+                path = os.path.join(directory, f"{name}.py")
+                with open(path, "w", encoding="utf-8") as file:
+                    file.write(text)
+                os.utime(path, ns=(mtime, mtime))
+
+            write("stored_base", 'class Base:\n    """\n    The base\n    """\n', 1)
+            write("stored", '"""\nThe stored\n"""\nfrom stored_base import Base\n', 1)
+
+            sys.path.insert(0, directory)
+
+            try:
+
+                module = importlib.import_module("stored")
+
+                with unittest.mock.patch.object(sphinxter.Memory, "store", sphinxter.Store(os.path.join(directory, "store"))):
+
+                    sphinxter.Reader.reset()
+
+                    parsed = sphinxter.Reader.module(module)
+
+                    self.assertEqual(parsed["description"], "The stored")
+                    self.assertEqual(parsed["classes"][0]["description"], "The base")
+                    self.assertEqual(sphinxter.Memory.store.misses, 1)
+                    self.assertIsNone(sphinxter.Source.loaded)
+
+                    # hit, without parsing
+
+                    sphinxter.Reader.reset()
+
+                    self.assertEqual(sphinxter.Reader.module(module), parsed)
+                    self.assertEqual(sphinxter.Memory.store.hits, 1)
+                    self.assertEqual(sphinxter.Parser.parses.misses, 0)
+
+                    # dependency changed
+
+                    write("stored_base", 'class Base:\n    """\n    The changed base\n    """\n', 2)
+                    importlib.reload(sys.modules["stored_base"])
+                    module = importlib.reload(module)
+
+                    self.assertEqual(sphinxter.Reader.module(module)["classes"][0]["description"], "The changed base")
+
+                    # static
+
+                    self.assertEqual(sphinxter.Static.read(os.path.join(directory, "stored_base.py"))[0]["classes"][0]["description"], "The changed base")
+                    self.assertEqual(sphinxter.Memory.store.misses, 2)
+
+                    self.assertEqual(sphinxter.Static.read(os.path.join(directory, "stored_base.py"))[0]["classes"][0]["description"], "The changed base")
+                    self.assertEqual(sphinxter.Memory.store.hits, 3)
+
+            finally:
+
+                sys.path.remove(directory)
+                sys.modules.pop("stored", None)
+                sys.modules.pop("stored_base", None)
+
+    def test_module_owners(self):
+
+        with unittest.mock.patch.object(sphinxter.Registry, "owners", ["sphinxter"]), \
+             unittest.mock.patch.object(sphinxter.Registry, "reading", None):
+
+            # everything's read, so what's imported is documented where it's defined
+
+            sphinxter.Registry.symbols.clear()
+
+            parsed = sphinxter.Reader.module(sphinxter)
+
+            self.assertEqual([cls["name"] for cls in parsed["classes"]], ["Sphinxter"])
+            self.assertEqual([reference["reference"] for reference in parsed["references"]], [
+                "sphinxter.cache.Cache",
+                "sphinxter.parsed.Compact",
+                "sphinxter.document.Document",
+                "sphinxter.memory.Memory",
+                "sphinxter.parsed.Parsed",
+                "sphinxter.parser.Parser",
+                "sphinxter.reader.Reader",
+                "sphinxter.registry.Registry",
+                "sphinxter.sections.Sections",
+                "sphinxter.signatures.Signatures",
+                "sphinxter.source.Source",
+                "sphinxter.static.Static",
+                "sphinxter.cache.Store",
+                "sphinxter.timings.Timings",
+                "sphinxter.writer.Writer"
+            ])
+            self.assertEqual(sphinxter.Registry.documented("sphinxter"), {"sphinxter.Sphinxter": "sphinxter.Sphinxter"})
+
+            parsed = sphinxter.Reader.module(sphinxter.writer)
+
+            self.assertEqual([cls["name"] for cls in parsed["classes"]], ["Writer"])
+            self.assertEqual(parsed["references"], [
+                {
+                    "name": "Memory",
+                    "kind": "class",
+                    "reference": "sphinxter.memory.Memory"
+                },
+                {
+                    "name": "Sections",
+                    "kind": "class",
+                    "reference": "sphinxter.sections.Sections"
+                },
+                {
+                    "name": "Source",
+                    "kind": "class",
+                    "reference": "sphinxter.source.Source"
+                }
+            ])
+            self.assertEqual(sphinxter.Registry.documented("sphinxter.writer"), {"sphinxter.writer.Writer": "sphinxter.writer.Writer"})
+
+            # the package first, without what defines its classes, so it documents them instead
+
+            sphinxter.Registry.symbols.clear()
+            sphinxter.Registry.reading = ["sphinxter", "sphinxter.cache"]
+
+            parsed = sphinxter.Reader.module(sphinxter)
+
+            self.assertEqual([cls["name"] for cls in parsed["classes"]], [
+                "Compact", "Document", "Memory", "Parsed", "Parser", "Reader", "Registry", "Sections",
+                "Signatures", "Source", "Sphinxter", "Static", "Timings", "Writer"
+            ])
+            self.assertEqual([reference["name"] for reference in parsed["references"]], ["Cache", "Store"])
+            self.assertEqual(sphinxter.Registry.symbols.get("sphinxter.writer.Writer"), "sphinxter.Writer")
+
+            # and any other module importing them just references them there
+
+            parsed = sphinxter.Reader.module(sphinxter.writer)
+
+            self.assertEqual(parsed["classes"], [])
+            self.assertEqual(parsed["references"], [
+                {
+                    "name": "Memory",
+                    "kind": "class",
+                    "reference": "sphinxter.Memory"
+                },
+                {
+                    "name": "Sections",
+                    "kind": "class",
+                    "reference": "sphinxter.Sections"
+                },
+                {
+                    "name": "Source",
+                    "kind": "class",
+                    "reference": "sphinxter.Source"
+                },
+                {
+                    "name": "Writer",
+                    "kind": "class",
+                    "reference": "sphinxter.Writer"
+                }
+            ])
+            self.assertEqual(sphinxter.Registry.documented("sphinxter.writer"), {})
+
+            sphinxter.Registry.symbols.clear()
+
+        self.assertEqual(sphinxter.Reader.module(test.example), self.MODULE)
+
+    def test_walk(self):
+
+        walk = sphinxter.Reader.walk(test.example)
+
+        module, kind, parsed = next(walk)
+
+        self.assertEqual((module, kind), ("test.example", "module"))
+        self.assertEqual(parsed, {
+            name: value for name, value in self.MODULE.items()
+            if name not in ["functions", "classes", "exceptions"]
+        })
+
+        records = list(walk)
+
+        self.assertEqual([(module, kind) for module, kind, _ in records], [
+            ("test.example", "function"),
+            ("test.example", "class"),
+            ("test.example", "exception")
+        ])
+
+        self.assertIsNotNone(records[0][2].loader)
+        self.assertEqual([parsed for _, _, parsed in records], [self.FUNCTION, self.COMPLEX_CLASS, self.BASIC_EXCEPTION])
+
+        self.assertSphinxter(sphinxter.Reader.walk)
+
+    def test_walk_streaming(self):
+
+        # each read only as it's asked for
+
+        with unittest.mock.patch.object(sphinxter.Reader, "routine", wraps=sphinxter.Reader.routine) as mock_routine, \
+             unittest.mock.patch.object(sphinxter.Reader, "cls", wraps=sphinxter.Reader.cls) as mock_cls:
+
+            walk = sphinxter.Reader.walk(test.example)
+
+            self.assertEqual(next(walk)[1], "module")
+            mock_routine.assert_not_called()
+            mock_cls.assert_not_called()
+
+            self.assertEqual(next(walk)[1], "function")
+            mock_routine.assert_called_once_with(test.example.func)
+            mock_cls.assert_not_called()
+
+            self.assertEqual(next(walk)[1], "class")
+            mock_cls.assert_called_once_with(test.example.Complex)
+
+    def test_gather(self):
+
+        parsed = sphinxter.Reader.gather([
+            ("mod", "module", {"name": "mod", "description": "Mod"}),
+            ("mod", "function", {"name": "f"}),
+            ("mod", "exception", {"name": "E"})
+        ])
+
+        self.assertEqual(parsed, {
+            "name": "mod",
+            "description": "Mod",
+            "functions": [{"name": "f"}],
+            "classes": [],
+            "exceptions": [{"name": "E"}]
+        })
+
+        self.assertEqual(sphinxter.Reader.gather(sphinxter.Reader.walk(test.example)), self.MODULE)
+
+    def test_records(self):
+
+        parsed = {
+            "name": "mod",
+            "description": "Mod",
+            "functions": [{"name": "f"}, {"name": "g"}],
+            "exceptions": [{"name": "E"}]
+        }
+
+        records = sphinxter.Reader.records(parsed)
+
+        self.assertEqual(next(records), ("mod", "module", {"name": "mod", "description": "Mod"}))
+        self.assertEqual(list(records), [
+            ("mod", "function", {"name": "f"}),
+            ("mod", "function", {"name": "g"}),
+            ("mod", "exception", {"name": "E"})
+        ])
+
+        self.assertEqual(parsed, {"name": "mod", "description": "Mod"})
@@ -0,0 +1,94 @@
+import unittest
+import unittest.mock
+import sphinxter.unittest
+
+import yaml
+
+import sphinxter
+import test.example
+
+class TestRegistry(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        sphinxter.Reader.reset()
+
+    def test_owned(self):
+
+        self.assertTrue(sphinxter.Registry.owned("sphinxter", yaml.safe_load))
+
+        with unittest.mock.patch.object(sphinxter.Registry, "owners", ["sphinxter"]):
+
+            self.assertTrue(sphinxter.Registry.owned("sphinxter", sphinxter.Reader))
+            self.assertTrue(sphinxter.Registry.owned("sphinxter", sphinxter.Sphinxter))
+            self.assertFalse(sphinxter.Registry.owned("sphinxter", yaml.safe_load))
+
+        with unittest.mock.patch.object(sphinxter.Registry, "owners", []):
+
+            self.assertTrue(sphinxter.Registry.owned("test.example", test.example.func))
+            self.assertFalse(sphinxter.Registry.owned("test", test.example.func))
+
+        with unittest.mock.patch.object(sphinxter.Registry, "owners", ["sphinx"]):
+
+            self.assertFalse(sphinxter.Registry.owned("test", sphinxter.Reader))
+
+    def test_symbol(self):
+
+        self.assertEqual(sphinxter.Registry.symbol(test.example.func), "test.example.func")
+        self.assertEqual(sphinxter.Registry.symbol(test.example.Complex.Subber), "test.example.Complex.Subber")
+
+        self.assertSphinxter(sphinxter.Registry.symbol)
+
+    def test_documented(self):
+
+        sphinxter.Registry.symbols.set("sphinxter.reader.Reader", "sphinxter.Reader")
+        sphinxter.Registry.symbols.set("sphinxter.writer.Writer", "sphinxter.writer.Writer")
+
+        self.assertEqual(sphinxter.Registry.documented("sphinxter"), {"sphinxter.reader.Reader": "sphinxter.Reader"})
+        self.assertEqual(sphinxter.Registry.documented("sphinxter.writer"), {"sphinxter.writer.Writer": "sphinxter.writer.Writer"})
+        self.assertEqual(sphinxter.Registry.documented("sphinxter.cache"), {})
+
+        self.assertSphinxter(sphinxter.Registry.documented)
+
+    def test_link(self):
+
+        self.assertEqual(sphinxter.Registry.link({"name": "a"}, {}), {"name": "a"})
+
+        # only the package is being read, so what's defined elsewhere goes to where it's first read
+
+        with unittest.mock.patch.object(sphinxter.Registry, "owners", ["sphinxter"]), \
+             unittest.mock.patch.object(sphinxter.Registry, "reading", ["sphinxter"]):
+
+            # as if read in separate processes
+
+            sphinxter.Registry.symbols.clear()
+            package = sphinxter.Reader.module(sphinxter)
+            package_symbols = sphinxter.Registry.documented("sphinxter")
+            sphinxter.Registry.symbols.clear()
+            writer = sphinxter.Reader.module(sphinxter.writer)
+            writer_symbols = sphinxter.Registry.documented("sphinxter.writer")
+            sphinxter.Registry.symbols.clear()
+            cache = sphinxter.Reader.module(sphinxter.cache)
+            cache_symbols = sphinxter.Registry.documented("sphinxter.cache")
+
+            self.assertEqual(len(writer["classes"]), 4)
+            self.assertEqual(len(cache["classes"]), 2)
+
+            # as if read in order
+
+            sphinxter.Registry.symbols.clear()
+
+            self.assertIs(sphinxter.Registry.link(package, package_symbols), package)
+            self.assertEqual(len(package["classes"]), 16)
+
+            sphinxter.Registry.link(writer, writer_symbols)
+            sphinxter.Registry.link(cache, cache_symbols)
+
+            sphinxter.Registry.symbols.clear()
+            sphinxter.Reader.module(sphinxter)
+
+            self.assertEqual(writer, sphinxter.Reader.module(sphinxter.writer))
+            self.assertEqual(cache, sphinxter.Reader.module(sphinxter.cache))
+
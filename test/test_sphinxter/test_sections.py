@@ -0,0 +1,462 @@
+import unittest
+import unittest.mock
+import sphinxter.unittest
+
+import io
+
+import sphinxter
+
+class TestSections(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        document = sphinxter.Document(None, "test.example", None, '    ')
+        self.file = io.StringIO()
+        self.file.write("\n")
+
+        self.writer = sphinxter.Writer(document, self.file)
+
+    def test___init__(self):
+
+        sections = sphinxter.Sections("people", "stuff")
+
+        self.assertEqual(sections.document, "people")
+        self.assertEqual(sections.file, "stuff")
+        self.assertIsNone(sections.buffer)
+        self.assertEqual(sections.indents, [])
+
+        self.assertSphinxter(sphinxter.Sections, evaluate=False)
+
+    def test_prefix(self):
+
+        self.assertEqual(self.writer.prefix(2), "        ")
+        self.assertEqual(self.writer.indents, ["", "    ", "        "])
+        self.assertEqual(self.writer.prefix(0), "")
+
+        self.assertSphinxter(sphinxter.Sections.prefix)
+
+    def test_write(self):
+
+        self.writer.write("a\n")
+
+        self.assertEqual(self.file.getvalue(), "\na\n")
+
+        self.writer.buffer = []
+        self.writer.write("b\n")
+
+        self.assertEqual(self.file.getvalue(), "\na\n")
+        self.assertEqual(self.writer.buffer, ["b\n"])
+
+    def test_line(self):
+
+        self.writer.line("a ", before=True)
+        self.writer.line("b  ", 1, after=True)
+
+        self.assertEqual(self.file.getvalue(), """
+
+a
+    b
+
+""")
+
+        self.assertSphinxter(sphinxter.Sections.line, evaluate=False)
+
+    def test_lines(self):
+
+        self.writer.lines("a", 0, before=True)
+        self.writer.lines("b\nc", 1, after=True)
+
+        self.assertEqual(self.file.getvalue(), """
+
+a
+    b
+    c
+
+""")
+
+        self.assertSphinxter(sphinxter.Sections.lines, evaluate=False)
+
+    def test_types(self):
+
+        self.assertEqual(self.writer.types("people"), "people")
+        self.assertEqual(self.writer.types(["stuff", "things"]), "stuff or things")
+
+        self.assertSphinxter(sphinxter.Sections.types)
+
+    @unittest.mock.patch.object(sphinxter.Writer, "compiled", {})
+    def test_plan(self):
+
+        plan = self.writer.plan("class")
+
+        self.assertEqual(plan, [
+            sphinxter.Sections.description,
+            sphinxter.Sections.definition,
+            sphinxter.Sections.routine,
+            sphinxter.Sections.usage,
+            sphinxter.Sections.attributes,
+            sphinxter.Writer.methods,
+            sphinxter.Writer.classes,
+            sphinxter.Writer.exceptions
+        ])
+
+        self.assertIs(self.writer.plan("class"), plan)
+        self.assertIs(sphinxter.Writer.compiled[(sphinxter.Writer, "class")], plan)
+
+        emitter = unittest.mock.MagicMock()
+
+        with unittest.mock.patch.dict(sphinxter.Writer.emitters, {"description": emitter}):
+            self.assertEqual(self.writer.plan("function"), [emitter, sphinxter.Sections.routine, sphinxter.Sections.usage])
+
+        class Custom(sphinxter.Writer):
+
+            def usage(self, parsed, indent):
+                self.line("CUSTOM", indent)
+
+        self.writer.plan("function")
+
+        self.assertEqual(Custom(self.writer.document, self.file).plan("function"), [
+            sphinxter.Sections.description,
+            sphinxter.Sections.routine,
+            Custom.usage
+        ])
+
+        Custom(self.writer.document, self.file).function({"name": "func", "signature": "()", "usage": "Use it"})
+
+        self.assertEqual(self.file.getvalue(), """
+
+.. function:: func()
+    CUSTOM
+""")
+
+        self.assertSphinxter(sphinxter.Sections.plan)
+
+    def test_render(self):
+
+        self.writer.render("method", {"description": "It is", "usage": "Use it", "raises": {"Error": "oh no"}}, 1)
+
+        self.assertEqual(self.file.getvalue(), """
+
+    It is
+
+    :raises Error: oh no
+
+    **Usage**
+
+    Use it
+""")
+
+        emitter = unittest.mock.MagicMock()
+
+        with unittest.mock.patch.dict(sphinxter.Writer.compiled, {(sphinxter.Writer, "module"): [emitter]}):
+            self.writer.render("module", {}, 0)
+
+        emitter.assert_called_once_with(self.writer, {}, 0)
+
+        self.assertSphinxter(sphinxter.Sections.render, evaluate=False)
+
+    def test_description(self):
+
+        self.writer.description({}, 1)
+        self.assertEqual(self.file.getvalue(), """
+""")
+
+        self.writer.description({"description": "a\nb\n"}, 1)
+        self.assertEqual(self.file.getvalue(), """
+
+    a
+    b
+""")
+
+        self.assertSphinxter(sphinxter.Sections.description, evaluate=False)
+
+    def test_parameter(self):
+
+        parsed = {
+            "name": "small"
+        }
+
+        self.writer.parameter(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+    :param small: small
+""")
+
+        parsed = {
+            "name": "big",
+            "description": "stuff",
+            "type": "int"
+        }
+
+        self.writer.parameter(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+    :param small: small
+    :param big: stuff
+    :type big: int
+""")
+
+        self.assertSphinxter(sphinxter.Sections.parameter, evaluate=False)
+
+    def test_parameters(self):
+
+        self.writer.parameters({}, 1)
+        self.assertEqual(self.file.getvalue(), """
+""")
+
+        parsed = {
+            "parameters": [
+                {
+                    "name": "small"
+                },
+                {
+                    "name": "big",
+                    "description": "stuff",
+                    "type": "int"
+                }
+            ]
+        }
+
+        self.writer.parameters(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+    :param small: small
+    :param big: stuff
+    :type big: int
+""")
+
+        self.assertSphinxter(sphinxter.Sections.parameters, evaluate=False)
+
+    def test_returns(self):
+
+        self.writer.returns({}, 1)
+        self.assertEqual(self.file.getvalue(), """
+""")
+
+        parsed = {
+            "return": {
+                "description": "stuff",
+                "type": "int"
+            }
+        }
+
+        self.writer.returns(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+    :return: stuff
+    :rtype: int
+""")
+
+        self.assertSphinxter(sphinxter.Sections.returns, evaluate=False)
+
+    def test_raises(self):
+
+        self.writer.raises({}, 1)
+        self.assertEqual(self.file.getvalue(), """
+""")
+
+        parsed = {
+            "raises": {
+                "Exception": "oh no"
+            }
+        }
+
+        self.writer.raises(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+    :raises Exception: oh no
+""")
+
+        self.assertSphinxter(sphinxter.Sections.raises, evaluate=False)
+
+    def test_routine(self):
+
+        self.writer.routine({}, 1)
+        self.assertEqual(self.file.getvalue(), """
+""")
+
+        parsed = {
+            "parameters": [
+                {
+                    "name": "small"
+                },
+                {
+                    "name": "big",
+                    "description": "stuff",
+                    "type": "int"
+                }
+            ],
+            "return": {
+                "description": "stuff",
+                "type": "int"
+            },
+            "raises": {
+                "Exception": "oh no"
+            }
+        }
+
+        self.writer.routine(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+
+    :param small: small
+    :param big: stuff
+    :type big: int
+    :return: stuff
+    :rtype: int
+    :raises Exception: oh no
+""")
+
+        self.assertSphinxter(sphinxter.Sections.routine, evaluate=False)
+
+    def test_usage(self):
+
+        self.writer.usage({}, 1)
+        self.assertEqual(self.file.getvalue(), """
+""")
+
+        parsed = {
+            "usage": "a\nb"
+        }
+
+        self.writer.usage(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+
+    **Usage**
+
+    a
+    b
+""")
+
+        self.assertSphinxter(sphinxter.Sections.usage, evaluate=[True, False, False])
+
+    def test_type(self):
+
+        self.writer.type({}, 1)
+        self.assertEqual(self.file.getvalue(), """
+""")
+
+        self.writer.type({"type": "int"}, 1)
+        self.assertEqual(self.file.getvalue(), """
+    :type: int
+""")
+
+        self.assertSphinxter(sphinxter.Sections.type, evaluate=False)
+
+    def test_attribute(self):
+
+        parsed = {
+            "name": "small"
+        }
+
+        self.writer.attribute(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+
+    .. attribute:: small
+""")
+
+        parsed = {
+            "name": "big",
+            "description": "stuff",
+            "type": "int"
+        }
+
+        self.writer.attribute(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+
+    .. attribute:: small
+
+    .. attribute:: big
+        :type: int
+
+        stuff
+""")
+
+        self.assertSphinxter(sphinxter.Sections.attribute, evaluate=False)
+
+    def test_attributes(self):
+
+        self.writer.attributes({}, 1)
+        self.assertEqual(self.file.getvalue(), """
+""")
+
+        parsed = {
+            "attributes": [
+                {
+                    "name": "small"
+                },
+                {
+                    "name": "big",
+                    "description": "stuff",
+                    "type": "int"
+                }
+            ]
+        }
+
+        self.writer.attributes(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+
+    .. attribute:: small
+
+    .. attribute:: big
+        :type: int
+
+        stuff
+""")
+
+        self.assertSphinxter(sphinxter.Sections.attributes, evaluate=False)
+
+    def test_references(self):
+
+        self.writer.references({}, 1)
+        self.writer.references({"references": []}, 1)
+        self.assertEqual(self.file.getvalue(), """
+""")
+
+        parsed = {
+            "references": [
+                {
+                    "name": "Basic",
+                    "kind": "exception",
+                    "reference": "test.example.Basic"
+                },
+                {
+                    "name": "Complex",
+                    "kind": "class",
+                    "reference": "test.example.Complex"
+                },
+                {
+                    "name": "func",
+                    "kind": "function",
+                    "reference": "test.example.func"
+                }
+            ]
+        }
+
+        self.writer.references(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+
+    **References**
+
+    * :py:exc:`Basic <test.example.Basic>`
+    * :py:class:`Complex <test.example.Complex>`
+    * :py:func:`func <test.example.func>`
+""")
+
+        self.assertSphinxter(sphinxter.Sections.references, evaluate=False)
+
+    def test_definition(self):
+
+        self.writer.definition({}, 1)
+        self.assertEqual(self.file.getvalue(), """
+""")
+
+        parsed = {
+            "definition": "a\nb"
+        }
+
+        self.writer.definition(parsed, 1)
+        self.assertEqual(self.file.getvalue(), """
+
+    **Definition**
+
+    a
+    b
+""")
+
+        self.assertSphinxter(sphinxter.Sections.definition, evaluate=[True, False, False])
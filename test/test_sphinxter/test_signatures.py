@@ -0,0 +1,217 @@
+import unittest
+import unittest.mock
+import sphinxter.unittest
+
+import os
+import sys
+import ast
+import inspect
+import functools
+import tempfile
+import importlib
+
+import sphinxter
+import test.example
+
+class TestSignatures(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        sphinxter.Reader.reset()
+
+    def test_annotations(self):
+
+        self.assertEqual(sphinxter.Signatures.annotations(test.example.func), {
+            "parameters": {
+                "a": {
+                    "type": "int"
+                },
+                "b": {
+                    "type": "str"
+                }
+            },
+            "return": {}
+        })
+
+        self.assertEqual(sphinxter.Signatures.annotations(test.example.Complex.stat), {
+            "parameters": {},
+            "return": {
+                "type": "list"
+            }
+        })
+
+        # generics as written, never evaluated
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            with open(os.path.join(directory, "typed.py"), "w", encoding="utf-8") as module:
+                module.write("from __future__ import annotations\ndef typed(a:dict[str, list[int]], b:Missing)->Nope: pass\n")
+
+            sys.path.insert(0, directory)
+
+            try:
+                typed = importlib.import_module("typed")
+            finally:
+                sys.path.remove(directory)
+                sys.modules.pop("typed", None)
+
+            self.assertEqual(sphinxter.Signatures.annotations(typed.typed), {
+                "parameters": {
+                    "a": {
+                        "type": "dict[str, list[int]]"
+                    },
+                    "b": {
+                        "type": "Missing"
+                    }
+                },
+                "return": {
+                    "type": "Nope"
+                }
+            })
+
+        # no source
+
+        namespace = {}
+        exec(compile("from __future__ import annotations\ndef untyped(a:Missing)->list[int]: pass", "<untyped>", "exec"), namespace)
+
+        self.assertEqual(sphinxter.Signatures.annotations(namespace["untyped"]), {
+            "parameters": {
+                "a": {
+                    "type": "Missing"
+                }
+            },
+            "return": {
+                "type": "list[int]"
+            }
+        })
+
+        # cached
+
+        sphinxter.Reader.reset()
+
+        parsed = sphinxter.Signatures.annotations(test.example.func)
+        parsed["parameters"]["a"]["type"] = "float"
+
+        self.assertEqual(sphinxter.Signatures.annotations(test.example.func)["parameters"]["a"], {"type": "int"})
+        self.assertEqual(sphinxter.Signatures.annotated.stats(), {
+            "entries": 1,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0
+        })
+
+        self.assertSphinxter(sphinxter.Signatures.annotations)
+
+    def test_annotation(self):
+
+        self.assertEqual(sphinxter.Signatures.annotation(sphinxter.Reader), "Reader")
+        self.assertEqual(sphinxter.Signatures.annotation(list[sphinxter.Reader]), "list[sphinxter.reader.Reader]")
+
+        self.assertSphinxter(sphinxter.Signatures.annotation)
+
+    def test_signature(self):
+
+        sphinxter.Reader.reset()
+
+        self.assertEqual(sphinxter.Signatures.signature(test.example.func), (["a", "b", "args", "kwargs"], "(a: int, b: 'str', *args, **kwargs)"))
+        self.assertEqual(sphinxter.Signatures.signature(test.example.Complex.__dict__["classy"], bound=True), (["a", "b", "args", "kwargs"], "(a, b, *args, **kwargs)"))
+        self.assertEqual(sphinxter.Signatures.signature(test.example.Complex.__dict__["stat"]), (["a", "b", "args", "kwargs"], "(a, b, *args, **kwargs) -> list"))
+
+        # wrapped
+
+        @functools.wraps(test.example.func)
+        def wrapper(*args, **kwargs):
+            pass
+
+        self.assertEqual(sphinxter.Signatures.signature(wrapper), (["a", "b", "args", "kwargs"], "(a: int, b: 'str', *args, **kwargs)"))
+        self.assertEqual(sphinxter.Signatures.signature(functools.partial(test.example.func, 1)), (["b", "args", "kwargs"], "(b: 'str', *args, **kwargs)"))
+
+        # cached
+
+        names, _ = sphinxter.Signatures.signature(test.example.func)
+        names.append("c")
+
+        self.assertEqual(sphinxter.Signatures.signature(test.example.func)[0], ["a", "b", "args", "kwargs"])
+        self.assertEqual(sphinxter.Signatures.signatures.stats(), {
+            "entries": 5,
+            "hits": 2,
+            "misses": 5,
+            "evictions": 0
+        })
+
+        self.assertSphinxter(sphinxter.Signatures.signature)
+
+    def test_code_signature(self):
+
+        def plain():
+            pass
+
+        def positional(a, /):
+            pass
+
+        def keyword(a, *, b:int=1, c):
+            pass
+
+        def everything(self, a:'list'=[1], /, b=None, *c, d:dict={"e": 2}, **f)->None:
+            pass
+
+        for function in [plain, positional, keyword, everything, sphinxter.Signatures.code_signature, sphinxter.Source.File.parameters]:
+
+            signature = inspect.signature(function)
+            self.assertEqual(sphinxter.Signatures.code_signature(function), (list(signature.parameters), str(signature)))
+
+            if signature.parameters:
+                signature = signature.replace(parameters=list(signature.parameters.values())[1:])
+                self.assertEqual(sphinxter.Signatures.code_signature(function, bound=True), (list(signature.parameters), str(signature)))
+
+        self.assertSphinxter(sphinxter.Signatures.code_signature)
+
+    def test_static_annotations(self):
+
+        node = sphinxter.Source.file(test.example).locate(test.example.func)[2]
+
+        self.assertEqual(sphinxter.Signatures.static_annotations(node), sphinxter.Signatures.annotations(test.example.func))
+
+        self.assertSphinxter(sphinxter.Signatures.static_annotations)
+
+    def test_static_annotation(self):
+
+        self.assertEqual(sphinxter.Signatures.static_annotation(ast.parse("'str'", mode="eval").body), "str")
+        self.assertEqual(sphinxter.Signatures.static_annotation(ast.parse("list[int]", mode="eval").body), "list[int]")
+
+        self.assertIs(sphinxter.Signatures.static_annotation(ast.parse("list[int]", mode="eval").body), sys.intern("list[int]"))
+
+    def test_static_signature(self):
+
+        def signature(code, bound=False):
+            return sphinxter.Signatures.static_signature(ast.parse(code).body[0], bound)
+
+        self.assertEqual(signature("def func(): pass"), ([], "()"))
+        self.assertEqual(signature("def func(a, b=1, *args, c, d=2, **kwargs): pass"), (
+            ["a", "b", "args", "c", "d", "kwargs"],
+            "(a, b=1, *args, c, d=2, **kwargs)"
+        ))
+        self.assertEqual(signature("def func(a, /, b, *, c): pass"), (
+            ["a", "b", "c"],
+            "(a, /, b, *, c)"
+        ))
+        self.assertEqual(signature("def meth(self, /, a): pass", True), (["a"], "(a)"))
+        self.assertEqual(signature("def meth(self, *args: int, **kwargs: 'str')->'Things': pass", True), (
+            ["args", "kwargs"],
+            "(*args: int, **kwargs: 'str') -> 'Things'"
+        ))
+
+        for resource in [test.example.func, test.example.Complex.stat, test.example.Complex.meth]:
+
+            node = sphinxter.Source.file(test.example).locate(resource)[2]
+            signature = inspect.signature(resource)
+
+            if resource is test.example.Complex.meth:
+                signature = signature.replace(parameters=list(signature.parameters.values())[1:])
+
+            self.assertEqual(sphinxter.Signatures.static_signature(node, resource is test.example.Complex.meth)[1], str(signature))
+
+        self.assertSphinxter(sphinxter.Signatures.static_signature)
+
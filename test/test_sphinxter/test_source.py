@@ -0,0 +1,344 @@
+import unittest
+import unittest.mock
+import sphinxter.unittest
+
+import os
+import ast
+import inspect
+import tempfile
+import tokenize
+
+import sphinxter
+import test.example
+
+class Complex:
+
+    class Subber:
+
+        pass
+
+class TestFile(unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        self.file = sphinxter.Source.File("stuff.py", [
+            "import functools\n",
+            "\n",
+            "class Outer:\n",
+            "\n",
+            "    class Inner:\n",
+            "        pass\n",
+            "\n",
+            "    @functools.wraps(print)\n",
+            "    def meth(self):\n",
+            "        def inner():\n",
+            "            class Local:\n",
+            "                pass\n",
+            "\n",
+            "lamb = lambda: None\n"
+        ])
+
+    def test___init__(self):
+
+        self.assertEqual(self.file.name, "stuff.py")
+        self.assertEqual(len(self.file.lines), 14)
+        self.assertIsNone(self.file.tokens)
+        self.assertIsNone(self.file.nodes)
+
+    def test_tokenize(self):
+
+        self.assertEqual([parsed.string for parsed in self.file.tokenize(5, 6)], [
+            "    ", "class", "Inner", ":", "\n", "        ", "pass", "\n"
+        ])
+
+        self.assertEqual(next(self.file.tokenize()).string, "import")
+        self.assertEqual(self.file.rows[0], 1)
+
+    def test_remark(self):
+
+        file = sphinxter.Source.File("stuff.py", [
+            "a = 1 # The a\n",
+            "b = (\n",
+            "    2, # Not b\n",
+            ")\n",
+            "c = 3 #\n"
+        ])
+
+        self.assertEqual(file.remark(1), "The a")
+        self.assertIsNone(file.remark(2))
+        self.assertEqual(file.remark(3), "Not b")
+        self.assertEqual(file.remark(5), "")
+        self.assertEqual(file.remarks, {1: "The a", 3: "Not b", 5: ""})
+
+    def test_parameters(self):
+
+        file = sphinxter.Source.file(test.example)
+        start, end, _ = file.locate(test.example.func)
+
+        self.assertEqual(file.parameters(start, end), {
+            "a": "The a",
+            "b": "The b",
+            "args": None,
+            "kwargs": "a: 1\nb: 2"
+        })
+
+        # all found in one pass
+
+        self.assertEqual(file.comments[start], file.parameters(start, end))
+        self.assertEqual(file.comments[file.locate(test.example.Complex.stat)[0]], {
+            "a": "The a",
+            "b": "The b",
+            "args": None,
+            "kwargs": "a: 1\nb: 2"
+        })
+
+        # copies
+
+        file.parameters(start, end)["a"] = "nope"
+        self.assertEqual(file.comments[start]["a"], "The a")
+
+        # not found in the AST
+
+        file.comments = {}
+
+        self.assertEqual(file.parameters(start, end), {
+            "a": "The a",
+            "b": "The b",
+            "args": None,
+            "kwargs": "a: 1\nb: 2"
+        })
+
+    def test_parse(self):
+
+        nodes = self.file.parse()
+
+        self.assertIsInstance(nodes, ast.Module)
+        self.assertIs(self.file.parse(), nodes)
+
+    def test_index(self):
+
+        self.file.parse()
+
+        self.assertEqual(list(self.file.classes.keys()), [
+            "Outer",
+            "Outer.Inner",
+            "Outer.meth.<locals>.inner.<locals>.Local"
+        ])
+
+        self.assertEqual(list(self.file.routines.keys()), [8, 10])
+
+    def test_locate(self):
+
+        self.assertEqual(self.file.locate(test.example)[:2], (1, 14))
+
+        with self.assertRaisesRegex(OSError, "could not find class definition"):
+            self.file.locate(Complex)
+
+        file = sphinxter.Source.file(test.example)
+
+        start, end, node = file.locate(test.example.Complex.Subber)
+
+        self.assertEqual((start, end), (171, 175))
+        self.assertEqual(node.name, "Subber")
+
+        start, end, node = file.locate(inspect.getattr_static(test.example.Complex, "stat"))
+
+        self.assertEqual((start, end), (105, 120))
+        self.assertEqual(node.name, "stat")
+
+        self.assertEqual(file.locate(test.example.func)[:2], (24, 50))
+
+        lamb = lambda: None
+
+        start, end, node = sphinxter.Source.file(lamb).locate(lamb)
+
+        self.assertEqual(end - start, 0)
+        self.assertIsNone(node)
+
+
+class TestSignature(unittest.TestCase):
+
+    maxDiff = None
+
+    def test___init__(self):
+
+        signature = sphinxter.Source.File.Signature()
+
+        self.assertEqual(signature.parens, 0)
+        self.assertIsNone(signature.param)
+        self.assertFalse(signature.params)
+        self.assertFalse(signature.name)
+        self.assertEqual(signature.comments, {})
+
+    def test_read(self):
+
+        signature = sphinxter.Source.File.Signature()
+
+        source = "def func(a, # The a\n    b=(1, 2) # The b\n             # and more\n): # nope\n    pass\n"
+        dones = [signature.read(parsed) for parsed in tokenize.generate_tokens(iter(source.splitlines(True)).__next__)]
+
+        self.assertEqual(dones.count(True), 1)
+
+        signature = sphinxter.Source.File.Signature()
+
+        for parsed in tokenize.generate_tokens(iter(source.splitlines(True)).__next__):
+            if signature.read(parsed):
+                break
+
+        self.assertEqual(signature.comments, {
+            "a": "The a",
+            "b": "The b\nand more"
+        })
+
+class TestSource(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        sphinxter.Reader.reset()
+
+    @unittest.mock.patch("logging.info")
+    def test_emit(self, mock_log):
+
+        sphinxter.Reader.reset()
+
+        sphinxter.Source.emit("routine", "func")
+        sphinxter.Reader.routine(test.example.func).load()
+
+        mock_log.assert_not_called()
+
+        listener = unittest.mock.MagicMock()
+
+        with unittest.mock.patch.object(sphinxter.Source, "listeners", [listener]):
+            sphinxter.Source.emit("parameter", "func", "a")
+
+        listener.assert_called_once_with("parameter", "func", "a")
+
+        self.assertSphinxter(sphinxter.Source.emit)
+
+    @unittest.mock.patch("logging.info")
+    def test_log(self, mock_log):
+
+        sphinxter.Source.log("module", "test.example")
+        sphinxter.Source.log("parameter", "func", "a")
+        sphinxter.Source.log("attribute", "comment", "a-b")
+
+        mock_log.assert_has_calls([
+            unittest.mock.call("module: %s", "test.example"),
+            unittest.mock.call("%s parameter: %s", "func", "a"),
+            unittest.mock.call("attribute comment: %s", "a-b")
+        ])
+
+    def test_timing(self):
+
+        with sphinxter.Source.timing("module", "a") as timing:
+            self.assertIsNone(timing)
+
+        with unittest.mock.patch.object(sphinxter.Source, "timings", sphinxter.Timings()):
+
+            with sphinxter.Source.timing("module", "a") as timing:
+                self.assertEqual(timing["name"], "a")
+
+            self.assertEqual(sphinxter.Source.timings.resources[("module", "a")]["count"], 1)
+
+            with sphinxter.Source.timing("module", "a", lazy=True) as timing:
+                self.assertEqual(timing["name"], "a")
+
+                with sphinxter.Source.timing("module", "b", lazy=True) as inner:
+                    self.assertIsNone(inner)
+
+            self.assertEqual(sphinxter.Source.timings.resources[("module", "a")]["count"], 1)
+            self.assertNotIn(("module", "b"), sphinxter.Source.timings.resources)
+
+    def test_timed(self):
+
+        with sphinxter.Source.timed("yaml"):
+            pass
+
+        with unittest.mock.patch.object(sphinxter.Source, "timings", sphinxter.Timings()):
+
+            sphinxter.Reader.reset()
+
+            with sphinxter.Source.timing("class", "test.example.Complex"):
+                sphinxter.Source.file(test.example).parse()
+                sphinxter.Parser.parse("a: 1")
+
+            self.assertEqual(list(sphinxter.Source.timings.phases.keys()), ["source", "ast", "yaml"])
+            self.assertEqual(list(sphinxter.Source.timings.resources[("class", "test.example.Complex")]["phases"].keys()), ["source", "ast", "yaml"])
+
+    def test_file(self):
+
+        sphinxter.Reader.reset()
+
+        file = sphinxter.Source.file(test.example)
+
+        self.assertTrue(file.name.endswith("example.py"))
+        self.assertIs(sphinxter.Source.file(test.example.Complex), file)
+        self.assertIs(sphinxter.Source.file(inspect.getattr_static(test.example.Complex, "stat")), file)
+
+        self.assertEqual(sphinxter.Source.files.hits, 2)
+        self.assertEqual(sphinxter.Source.files.misses, 1)
+
+        with unittest.mock.patch("os.stat") as mock_stat:
+            mock_stat.return_value.st_mtime_ns = 7
+            mock_stat.return_value.st_size = 7
+            self.assertIsNot(sphinxter.Source.file(test.example), file)
+
+        exec("def execed():\n    pass", globals())
+
+        with self.assertRaisesRegex(OSError, "could not get source code"):
+            sphinxter.Source.file(execed)
+
+        self.assertSphinxter(sphinxter.Source.file)
+
+    def test_load(self):
+
+        sphinxter.Reader.reset()
+
+        file = sphinxter.Source.load(test.example.__file__)
+
+        self.assertEqual(file.name, test.example.__file__)
+        self.assertIs(sphinxter.Source.file(test.example), file)
+
+        with self.assertRaisesRegex(OSError, "could not get source code"):
+            sphinxter.Source.load("nope.py")
+
+        self.assertSphinxter(sphinxter.Source.load)
+
+    BASIC_SOURCE = """class Basic(Exception):
+    \"""
+    Basic Exception
+    \"""
+"""
+
+    SUBBER_SOURCE = """class Subber:
+    \"""
+    Sub class
+    \"""
+    pass
+"""
+
+    def test_source(self):
+
+        self.assertEqual(sphinxter.Source.source(test.example.Basic), self.BASIC_SOURCE)
+        self.assertEqual(sphinxter.Source.source(test.example.Complex.Subber), self.SUBBER_SOURCE)
+
+        self.assertSphinxter(sphinxter.Source.source, evaluate=False)
+
+    def test_digest(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            path = os.path.join(directory, "a.py")
+
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("a = 1\n")
+
+            self.assertEqual(sphinxter.Source.digest(path), "cb78bd8a17f7b751fe0d4663366dcbc257204033ef7ddd64b1f2969573b5b2e2")
+
+        self.assertIsNone(sphinxter.Source.digest(path))
+        self.assertIsNone(sphinxter.Source.digest(None))
+
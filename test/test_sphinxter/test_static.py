@@ -0,0 +1,98 @@
+import unittest
+import unittest.mock
+import sphinxter.unittest
+
+import sys
+import ast
+import copy
+import inspect
+
+import sphinxter
+import test.example
+
+class TestStatic(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        sphinxter.Reader.reset()
+
+    def test_modulename(self):
+
+        self.assertEqual(sphinxter.Static.modulename("test/example.py"), "example")
+        self.assertIs(sphinxter.Static.modulename("lib/sphinxter/reader.py"), sys.intern("sphinxter.reader"))
+
+        self.assertSphinxter(sphinxter.Static.modulename)
+
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
+    @unittest.mock.patch("logging.info")
+    def test_routine(self, mock_log):
+
+        file = sphinxter.Source.file(test.example)
+
+        self.assertEqual(sphinxter.Static.routine(file, file.locate(test.example.func)[2]), test.test_sphinxter.test_reader.TestReader.FUNCTION)
+
+        mock_log.assert_any_call("routine: %s", "func")
+
+        for name, expected in [("stat", test.test_sphinxter.test_reader.TestReader.STATICMETHOD), ("classy", test.test_sphinxter.test_reader.TestReader.CLASSMETHOD), ("meth", test.test_sphinxter.test_reader.TestReader.METHOD)]:
+            node = file.locate(inspect.getattr_static(test.example.Complex, name))[2]
+            self.assertEqual(sphinxter.Static.routine(file, node, method=True), expected)
+
+    def test_members(self):
+
+        nodes = ast.parse("a = b = 1\ndef a(): pass\nclass C: pass\nx.y = 2")
+
+        members = sphinxter.Static.members(nodes)
+
+        self.assertEqual(list(members.keys()), ["a", "b", "C"])
+        self.assertIsInstance(members["a"], ast.FunctionDef)
+        self.assertIsInstance(members["b"], ast.Assign)
+        self.assertIsInstance(members["C"], ast.ClassDef)
+
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
+    @unittest.mock.patch("logging.info")
+    def test_cls(self, mock_log):
+
+        file = sphinxter.Source.file(test.example)
+
+        self.assertEqual(sphinxter.Static.cls(file, file.locate(test.example.Basic)[2]), test.test_sphinxter.test_reader.TestReader.BASIC_EXCEPTION)
+
+        mock_log.assert_any_call("class: %s", "Basic")
+
+        self.assertEqual(sphinxter.Static.cls(file, file.locate(test.example.Complex)[2]), test.test_sphinxter.test_reader.TestReader.COMPLEX_CLASS)
+
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
+    @unittest.mock.patch("logging.info")
+    def test_module(self, mock_log):
+
+        self.assertEqual(sphinxter.Static.module(sphinxter.Source.file(test.example), "test.example"), test.test_sphinxter.test_reader.TestReader.MODULE)
+
+        mock_log.assert_any_call("module: %s", "test.example")
+
+        # only names are attributes, not what's unpacked or set on something else
+
+        file = sphinxter.Source.File("unpacked.py", [
+            "a, b = 1, 2 # The a and b\n",
+            "thing.x = 1 # The x\n",
+            "c = 3 # The c\n"
+        ])
+
+        self.assertEqual(sphinxter.Static.module(file, "unpacked")["attributes"], [
+            {
+                "name": "c",
+                "description": "The c"
+            }
+        ])
+
+    @unittest.mock.patch.object(sphinxter.Source, "listeners", [sphinxter.Source.log])
+    @unittest.mock.patch("logging.info")
+    def test_read(self, mock_log):
+
+        module = copy.deepcopy(test.test_sphinxter.test_reader.TestReader.MODULE)
+        module["name"] = "example"
+
+        self.assertEqual(sphinxter.Static.read(test.example.__file__), [module])
+
+        self.assertSphinxter(sphinxter.Static.read)
+
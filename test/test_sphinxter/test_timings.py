@@ -0,0 +1,162 @@
+import unittest
+import unittest.mock
+import sphinxter.unittest
+
+import sphinxter
+
+class TestTimings(sphinxter.unittest.TestCase):
+
+    maxDiff = None
+
+    def test___init__(self):
+
+        timings = sphinxter.Timings()
+
+        self.assertEqual(timings.phases, {})
+        self.assertEqual(timings.resources, {})
+        self.assertEqual(timings.stack, [])
+
+        self.assertSphinxter(sphinxter.Timings)
+
+    @unittest.mock.patch("time.perf_counter")
+    def test_resource(self, mock_time):
+
+        mock_time.side_effect = [1.0, 2.0, 5.0, 7.0, 8.0, 10.0, 11.0, 12.0, 13.0, 14.0]
+
+        timings = sphinxter.Timings()
+
+        with timings.resource("class", "a.Thing") as timing:
+            with timings.resource("method", "a.Thing.do"):
+                pass
+            with timings.resource("method", "a.Thing.do"):
+                pass
+
+        self.assertEqual(timing, {
+            "kind": "class",
+            "name": "a.Thing",
+            "count": 1,
+            "seconds": 9.0,
+            "own": 5.0,
+            "phases": {}
+        })
+
+        self.assertEqual(timings.resources[("method", "a.Thing.do")], {
+            "kind": "method",
+            "name": "a.Thing.do",
+            "count": 2,
+            "seconds": 4.0,
+            "own": 4.0,
+            "phases": {}
+        })
+
+        self.assertEqual(timings.stack, [])
+
+        with self.assertRaises(ValueError):
+            with timings.resource("module", "a"):
+                raise ValueError("nope")
+
+        self.assertEqual(timings.stack, [])
+        self.assertEqual(timings.resources[("module", "a")]["count"], 1)
+
+        with timings.resource("module", "a", count=False):
+            pass
+
+        self.assertEqual(timings.resources[("module", "a")]["count"], 1)
+        self.assertEqual(timings.resources[("module", "a")]["seconds"], 2.0)
+
+    @unittest.mock.patch("time.perf_counter")
+    def test_phase(self, mock_time):
+
+        mock_time.side_effect = [1.0, 2.0, 4.0, 5.0, 8.0, 9.0]
+
+        timings = sphinxter.Timings()
+
+        with timings.phase("source"):
+            pass
+
+        with timings.resource("module", "a"):
+            with timings.phase("yaml"):
+                pass
+
+        self.assertEqual(timings.phases, {
+            "source": {
+                "count": 1,
+                "seconds": 1.0
+            },
+            "yaml": {
+                "count": 1,
+                "seconds": 3.0
+            }
+        })
+
+        self.assertEqual(timings.resources[("module", "a")]["phases"], {
+            "yaml": {
+                "count": 1,
+                "seconds": 3.0
+            }
+        })
+
+    @unittest.mock.patch("time.perf_counter")
+    def test_merge(self, mock_time):
+
+        mock_time.side_effect = [1.0, 2.0, 3.0, 4.0, 5.0, 7.0, 8.0, 10.0]
+
+        timings = sphinxter.Timings()
+
+        with timings.resource("module", "a"):
+            with timings.phase("ast"):
+                pass
+
+        other = sphinxter.Timings()
+
+        with other.resource("module", "a"):
+            with other.phase("ast"):
+                pass
+
+        timings.merge(other)
+
+        self.assertEqual(timings.phases, {
+            "ast": {
+                "count": 2,
+                "seconds": 2.0
+            }
+        })
+
+        self.assertEqual(timings.resources, {
+            ("module", "a"): {
+                "kind": "module",
+                "name": "a",
+                "count": 2,
+                "seconds": 8.0,
+                "own": 8.0,
+                "phases": {
+                    "ast": {
+                        "count": 2,
+                        "seconds": 2.0
+                    }
+                }
+            }
+        })
+
+        other = sphinxter.Timings()
+        other.resources[("module", "b")] = {"kind": "module", "name": "b", "count": 1, "seconds": 1.0, "own": 1.0, "phases": {}}
+
+        timings.merge(other)
+
+        self.assertEqual(timings.resources[("module", "b")], {"kind": "module", "name": "b", "count": 1, "seconds": 1.0, "own": 1.0, "phases": {}})
+
+    def test_report(self):
+
+        timings = sphinxter.Timings()
+
+        timings.resources = {
+            ("module", "a"): {"kind": "module", "name": "a", "count": 1, "seconds": 3.0, "own": 1.0, "phases": {}},
+            ("class", "a.B"): {"kind": "class", "name": "a.B", "count": 1, "seconds": 2.0, "own": 2.0, "phases": {}},
+            ("function", "a.c"): {"kind": "function", "name": "a.c", "count": 1, "seconds": 0.5, "own": 0.5, "phases": {}}
+        }
+
+        report = timings.report(2)
+
+        self.assertIs(report["phases"], timings.phases)
+        self.assertEqual([timing["name"] for timing in report["resources"]], ["a", "a.B", "a.c"])
+        self.assertEqual([timing["name"] for timing in report["slowest"]], ["a.B", "a"])
@@ -387,6 +387,14 @@ class TestTestCase(sphinxter.unittest.TestCase):
 
             mock_equal.assert_called_with({"a": 2}, {"a": 1}, 'dude.a\nCorrect value:\n# {\n#     "a": 1\n# }')
 
+            # compact
+
+            mock_equal.reset_mock()
+
+            self.assertSphinxterSection(sphinxter.Compact.compact({"b": yaml.safe_load(self.Convert.__doc__)["usage"]}), "dude")
+
+            mock_equal.assert_called_with({"a": 2}, {"a": 1}, 'dude.b\nCorrect value:\n# {\n#     "a": 1\n# }')
+
         self.assertSphinxter(sphinxter.unittest.TestCase.assertSphinxter)
 
     def test_assertSphinxter(self):
@@ -3,6 +3,7 @@ import unittest.mock
 import sphinxter.unittest
 
 import io
+import tempfile
 
 import sphinxter
 from test import example
@@ -26,211 +27,10 @@ class TestWriter(sphinxter.unittest.TestCase):
 
         self.assertEqual(writer.document, "people")
         self.assertEqual(writer.file, "stuff")
-
-    def test_line(self):
-
-        self.writer.line("a ", before=True)
-        self.writer.line("b  ", 1, after=True)
-
-        self.assertEqual(self.file.getvalue(), """
-
-a
-    b
-
-""")
-
-        self.assertSphinxter(sphinxter.Writer.line, evaluate=False)
-
-    def test_lines(self):
-
-        self.writer.lines("a", 0, before=True)
-        self.writer.lines("b\nc", 1, after=True)
-
-        self.assertEqual(self.file.getvalue(), """
-
-a
-    b
-    c
-
-""")
-
-        self.assertSphinxter(sphinxter.Writer.lines, evaluate=False)
-
-    def test_types(self):
-
-        self.assertEqual(self.writer.types("people"), "people")
-        self.assertEqual(self.writer.types(["stuff", "things"]), "stuff or things")
-
-        self.assertSphinxter(sphinxter.Writer.types)
-
-    def test_description(self):
-
-        self.writer.description({}, 1)
-        self.assertEqual(self.file.getvalue(), """
-""")
-
-        self.writer.description({"description": "a\nb\n"}, 1)
-        self.assertEqual(self.file.getvalue(), """
-
-    a
-    b
-""")
-
-        self.assertSphinxter(sphinxter.Writer.description, evaluate=False)
-
-    def test_parameter(self):
-
-        parsed = {
-            "name": "small"
-        }
-
-        self.writer.parameter(parsed, 1)
-        self.assertEqual(self.file.getvalue(), """
-    :param small: small
-""")
-
-        parsed = {
-            "name": "big",
-            "description": "stuff",
-            "type": "int"
-        }
-
-        self.writer.parameter(parsed, 1)
-        self.assertEqual(self.file.getvalue(), """
-    :param small: small
-    :param big: stuff
-    :type big: int
-""")
-
-        self.assertSphinxter(sphinxter.Writer.parameter, evaluate=False)
-
-    def test_parameters(self):
-
-        self.writer.parameters({}, 1)
-        self.assertEqual(self.file.getvalue(), """
-""")
-
-        parsed = {
-            "parameters": [
-                {
-                    "name": "small"
-                },
-                {
-                    "name": "big",
-                    "description": "stuff",
-                    "type": "int"
-                }
-            ]
-        }
-
-        self.writer.parameters(parsed, 1)
-        self.assertEqual(self.file.getvalue(), """
-    :param small: small
-    :param big: stuff
-    :type big: int
-""")
-
-        self.assertSphinxter(sphinxter.Writer.parameters, evaluate=False)
-
-    def test_returns(self):
-
-        self.writer.returns({}, 1)
-        self.assertEqual(self.file.getvalue(), """
-""")
-
-        parsed = {
-            "return": {
-                "description": "stuff",
-                "type": "int"
-            }
-        }
-
-        self.writer.returns(parsed, 1)
-        self.assertEqual(self.file.getvalue(), """
-    :return: stuff
-    :rtype: int
-""")
-
-        self.assertSphinxter(sphinxter.Writer.returns, evaluate=False)
-
-    def test_raises(self):
-
-        self.writer.raises({}, 1)
-        self.assertEqual(self.file.getvalue(), """
-""")
-
-        parsed = {
-            "raises": {
-                "Exception": "oh no"
-            }
-        }
-
-        self.writer.raises(parsed, 1)
-        self.assertEqual(self.file.getvalue(), """
-    :raises Exception: oh no
-""")
-
-        self.assertSphinxter(sphinxter.Writer.raises, evaluate=False)
-
-    def test_routine(self):
-
-        self.writer.routine({}, 1)
-        self.assertEqual(self.file.getvalue(), """
-""")
-
-        parsed = {
-            "parameters": [
-                {
-                    "name": "small"
-                },
-                {
-                    "name": "big",
-                    "description": "stuff",
-                    "type": "int"
-                }
-            ],
-            "return": {
-                "description": "stuff",
-                "type": "int"
-            },
-            "raises": {
-                "Exception": "oh no"
-            }
-        }
-
-        self.writer.routine(parsed, 1)
-        self.assertEqual(self.file.getvalue(), """
-
-    :param small: small
-    :param big: stuff
-    :type big: int
-    :return: stuff
-    :rtype: int
-    :raises Exception: oh no
-""")
-
-        self.assertSphinxter(sphinxter.Writer.routine, evaluate=False)
-
-    def test_usage(self):
-
-        self.writer.usage({}, 1)
-        self.assertEqual(self.file.getvalue(), """
-""")
-
-        parsed = {
-            "usage": "a\nb"
-        }
-
-        self.writer.usage(parsed, 1)
-        self.assertEqual(self.file.getvalue(), """
-
-    **Usage**
-
-    a
-    b
-""")
-
-        self.assertSphinxter(sphinxter.Writer.usage, evaluate=[True, False, False])
+        self.assertIsNone(writer.buffer)
+        self.assertEqual(writer.indents, [])
+        self.assertIsNone(writer.fragments)
+        self.assertIsNone(writer.rendered)
 
     def test_function(self):
 
@@ -262,69 +62,6 @@ a
 
         self.assertSphinxter(sphinxter.Writer.function, evaluate=[True, False])
 
-    def test_attribute(self):
-
-        parsed = {
-            "name": "small"
-        }
-
-        self.writer.attribute(parsed, 1)
-        self.assertEqual(self.file.getvalue(), """
-
-    .. attribute:: small
-""")
-
-        parsed = {
-            "name": "big",
-            "description": "stuff",
-            "type": "int"
-        }
-
-        self.writer.attribute(parsed, 1)
-        self.assertEqual(self.file.getvalue(), """
-
-    .. attribute:: small
-
-    .. attribute:: big
-        :type: int
-
-        stuff
-""")
-
-        self.assertSphinxter(sphinxter.Writer.attribute, evaluate=False)
-
-    def test_attributes(self):
-
-        self.writer.attributes({}, 1)
-        self.assertEqual(self.file.getvalue(), """
-""")
-
-        parsed = {
-            "attributes": [
-                {
-                    "name": "small"
-                },
-                {
-                    "name": "big",
-                    "description": "stuff",
-                    "type": "int"
-                }
-            ]
-        }
-
-        self.writer.attributes(parsed, 1)
-        self.assertEqual(self.file.getvalue(), """
-
-    .. attribute:: small
-
-    .. attribute:: big
-        :type: int
-
-        stuff
-""")
-
-        self.assertSphinxter(sphinxter.Writer.attributes, evaluate=False)
-
     def test_method(self):
 
         self.writer.method(test.test_sphinxter.test_reader.TestReader.METHOD, 1)
@@ -353,26 +90,38 @@ a
 
         self.assertSphinxter(sphinxter.Writer.method, evaluate=[True, False, True, False, True, False])
 
-    def test_definition(self):
+    def test_methods(self):
 
-        self.writer.definition({}, 1)
+        self.writer.methods({}, 1)
         self.assertEqual(self.file.getvalue(), """
 """)
 
-        parsed = {
-            "definition": "a\nb"
-        }
+        self.writer.methods({"methods": [test.test_sphinxter.test_reader.TestReader.METHOD]}, 0)
+        self.assertIn(".. method:: meth(a, b, *args, **kwargs)\n\n    Some basic meth\n", self.file.getvalue())
+
+        self.assertSphinxter(sphinxter.Writer.methods, evaluate=False)
+
+    def test_classes(self):
 
-        self.writer.definition(parsed, 1)
+        self.writer.classes({}, 1)
         self.assertEqual(self.file.getvalue(), """
+""")
 
-    **Definition**
+        self.writer.classes({"classes": [test.test_sphinxter.test_reader.TestReader.COMPLEX_CLASS]}, 0)
+        self.assertIn(".. class:: Complex(a, b, *args, **kwargs)", self.file.getvalue())
 
-    a
-    b
+        self.assertSphinxter(sphinxter.Writer.classes, evaluate=False)
+
+    def test_exceptions(self):
+
+        self.writer.exceptions({}, 1)
+        self.assertEqual(self.file.getvalue(), """
 """)
 
-        self.assertSphinxter(sphinxter.Writer.definition, evaluate=[True, False, False])
+        self.writer.exceptions({"exceptions": [test.test_sphinxter.test_reader.TestReader.BASIC_EXCEPTION]}, 0)
+        self.assertIn(".. exception:: Basic", self.file.getvalue())
+
+        self.assertSphinxter(sphinxter.Writer.exceptions, evaluate=False)
 
     def test_cls(self):
 
@@ -694,6 +443,101 @@ It's great
     Basic Exception
 """
 
+    def test_settings(self):
+
+        settings = self.writer.settings()
+
+        self.assertEqual(sphinxter.Writer.version, sphinxter.Memory.version())
+        self.assertEqual(settings.split("\n")[:5], [
+            sphinxter.Memory.version(),
+            "sphinxter.writer.Writer",
+            sphinxter.Source.digest(sphinxter.writer.__file__),
+            sphinxter.Source.digest(sphinxter.sections.__file__),
+            "'    '"
+        ])
+
+        class Custom(sphinxter.Writer):
+            pass
+
+        self.assertEqual(Custom(self.writer.document, self.file).settings().split("\n")[1:5], [
+            f"{__name__}.TestWriter.test_settings.<locals>.Custom",
+            sphinxter.Source.digest(__file__),
+            sphinxter.Source.digest(sphinxter.writer.__file__),
+            sphinxter.Source.digest(sphinxter.sections.__file__)
+        ])
+
+        self.writer.document = sphinxter.Document(None, "test.example", None, '  ')
+        self.assertNotEqual(self.writer.settings(), settings)
+
+        with unittest.mock.patch.dict(sphinxter.Writer.plans, {"function": ["description"]}):
+            self.assertNotEqual(self.writer.settings(), settings)
+
+        with unittest.mock.patch.dict(sphinxter.Writer.emitters, {"description": test.test_sphinxter.test_reader.TestReader}):
+            self.assertIn("'description': 'test.test_sphinxter.test_reader.TestReader'", self.writer.settings())
+            self.assertIn(sphinxter.Source.digest(test.test_sphinxter.test_reader.__file__), self.writer.settings())
+
+    @unittest.mock.patch.object(sphinxter.Writer, "digests", {})
+    def test_source(self):
+
+        self.assertEqual(sphinxter.Writer.source(sphinxter.Writer), sphinxter.Source.digest(sphinxter.writer.__file__))
+        self.assertEqual(sphinxter.Writer.digests, {sphinxter.Writer: sphinxter.Source.digest(sphinxter.writer.__file__)})
+
+        with unittest.mock.patch("sphinxter.Source.digest") as mock_digest:
+            sphinxter.Writer.source(sphinxter.Writer)
+
+        mock_digest.assert_not_called()
+
+        self.assertEqual(sphinxter.Writer.source(len), "")
+
+    def test_fragment(self):
+
+        parsed = {"name": "func", "signature": "()", "description": "It is"}
+
+        self.writer.fragment("function", parsed)
+
+        self.assertEqual(self.file.getvalue(), """
+
+.. function:: func()
+
+    It is
+""")
+
+        self.writer.buffer = ["before"]
+        self.writer.fragments = {}
+        self.writer.rendered = {}
+
+        self.writer.fragment("function", parsed, 1)
+
+        key, text = list(self.writer.rendered.items())[0]
+
+        self.assertEqual(text, "\n    .. function:: func()\n\n        It is\n")
+        self.assertEqual(self.writer.buffer, ["before", text])
+
+        self.writer.buffer = []
+        self.writer.fragments = {key: "cached"}
+        self.writer.rendered = {}
+
+        with unittest.mock.patch.object(self.writer, "function") as mock_function:
+            self.writer.fragment("function", parsed, 1)
+
+        mock_function.assert_not_called()
+        self.assertEqual(self.writer.buffer, ["cached"])
+        self.assertEqual(self.writer.rendered, {key: "cached"})
+
+        self.writer.buffer = []
+        self.writer.fragment("function", dict(parsed, description="It isn't"), 1)
+        self.writer.fragment("class", {"name": "Basic", "kind": "class", "methods": [], "classes": [], "exceptions": []}, 1)
+        self.writer.fragment("module", {"name": "basic"}, 0)
+
+        self.assertEqual(self.writer.buffer, [
+            "\n    .. function:: func()\n\n        It isn't\n",
+            "\n    .. class:: Basic\n",
+            "\n.. module:: basic\n"
+        ])
+        self.assertEqual(len(self.writer.rendered), 4)
+
+        self.assertSphinxter(sphinxter.Writer.fragment)
+
     def test_dump(self):
 
         # actual
@@ -708,10 +552,38 @@ It's great
 
         self.writer.document.add("test.example", "exception", test.test_sphinxter.test_reader.TestReader.BASIC_EXCEPTION, 0)
 
-        self.writer.dump()
+        with unittest.mock.patch.object(self.file, "write", wraps=self.file.write) as mock_write:
+            self.writer.dump()
 
+        mock_write.assert_called_once()
+        self.assertIsNone(self.writer.buffer)
         self.assertEqual(self.file.getvalue(), self.EXAMPLE)
 
+        # stored
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            store = sphinxter.Store(directory)
+
+            with unittest.mock.patch.object(sphinxter.Writer, "store", store):
+
+                for _ in range(2):
+
+                    file = io.StringIO()
+                    file.write("\n")
+
+                    writer = sphinxter.Writer(self.writer.document, file)
+
+                    with unittest.mock.patch.object(store, "set", wraps=store.set) as mock_set:
+                        writer.dump()
+
+                    self.assertEqual(file.getvalue(), self.EXAMPLE)
+                    self.assertIsNone(writer.fragments)
+                    self.assertIsNone(writer.rendered)
+
+            mock_set.assert_not_called()
+            self.assertEqual(store.stats(), {"entries": 1, "hits": 1, "misses": 1, "evictions": 0})
+
         # modules
 
         document = sphinxter.Document(None, "test.example", False, '    ')